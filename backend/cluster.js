@@ -0,0 +1,135 @@
+// Runs server.js in several worker processes sharing one port, so requests
+// spread over every CPU core. Crashed workers are restarted; SIGTERM/SIGINT
+// lets every worker drain its connections before the cluster exits.
+//
+// Usage:
+//   npm run start:cluster
+//   CLUSTER_WORKERS=4 node cluster.js
+//
+// CLUSTER_WORKERS defaults to the number of cores. Each worker keeps its own
+// response cache (invalidations are relayed to the others) and view-count
+// buffer; the boost sweeper and index sync run in worker slot 0 only.
+// GET /api/health/workers on any worker lists the health of all of them.
+
+import os from "os";
+import cluster from "cluster";
+import dotenv from "dotenv";
+import { fileURLToPath } from "url";
+
+dotenv.config();
+
+const WORKERS = Number(process.env.CLUSTER_WORKERS) || os.availableParallelism();
+const SHUTDOWN_TIMEOUT_MS = Number(process.env.SHUTDOWN_TIMEOUT_MS) || 10 * 1000;
+// A worker that dies sooner than this after starting is restarted with a
+// growing delay, so a crash on startup does not fork in a tight loop
+const MIN_UPTIME_MS = 5 * 1000;
+const MAX_RESTART_DELAY_MS = 30 * 1000;
+
+cluster.setupPrimary({ exec: fileURLToPath(new URL("./server.js", import.meta.url)) });
+
+// One entry per worker slot; a restarted worker takes over its slot
+const slots = Array.from({ length: WORKERS }, () => ({
+  worker: null,
+  startedAt: null,
+  restarts: 0,
+  restartDelayMs: 0,
+  restartTimer: null,
+  health: null,
+  reportedAt: null,
+}));
+let shuttingDown = false;
+
+const workersHealth = () =>
+  slots.map((slot, index) => ({
+    slot: index,
+    status: slot.worker ? "up" : "restarting",
+    id: slot.worker?.id ?? null,
+    restarts: slot.restarts,
+    reportedAt: slot.reportedAt,
+    ...slot.health,
+    pid: slot.worker?.process.pid ?? null,
+  }));
+
+const handleMessage = (index, worker, message) => {
+  const slot = slots[index];
+  switch (message?.type) {
+    case "worker:health":
+      slot.health = message.data;
+      slot.reportedAt = new Date();
+      break;
+    case "cache:invalidate":
+      for (const other of slots) {
+        if (other.worker && other.worker !== worker && other.worker.isConnected()) {
+          other.worker.send(message);
+        }
+      }
+      break;
+    case "cluster:workers":
+      worker.send({ replyTo: message.id, data: workersHealth() });
+      break;
+    default:
+      break;
+  }
+};
+
+const fork = (index) => {
+  const slot = slots[index];
+  const worker = cluster.fork({ WORKER_SLOT: String(index) });
+  slot.worker = worker;
+  slot.startedAt = Date.now();
+  slot.restartTimer = null;
+  slot.health = null;
+  slot.reportedAt = null;
+  worker.on("message", (message) => handleMessage(index, worker, message));
+};
+
+cluster.on("exit", (worker, code, signal) => {
+  const index = slots.findIndex((slot) => slot.worker === worker);
+  if (index === -1) return;
+  const slot = slots[index];
+  slot.worker = null;
+
+  if (shuttingDown) {
+    if (slots.every((s) => !s.worker)) {
+      console.log("👋 All workers stopped");
+      process.exit(0);
+    }
+    return;
+  }
+
+  const uptime = Date.now() - slot.startedAt;
+  slot.restartDelayMs =
+    uptime < MIN_UPTIME_MS ? Math.min(Math.max(slot.restartDelayMs * 2, 1000), MAX_RESTART_DELAY_MS) : 0;
+  slot.restarts++;
+  console.error(
+    `💥 Worker ${index} (pid ${worker.process.pid}) died (${signal || `code ${code}`}), ` +
+      `restarting in ${slot.restartDelayMs}ms`
+  );
+  slot.restartTimer = setTimeout(() => fork(index), slot.restartDelayMs);
+});
+
+const shutdown = (signal) => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`🛑 ${signal} received, draining ${WORKERS} worker(s)`);
+
+  for (const slot of slots) {
+    clearTimeout(slot.restartTimer);
+    // Workers started from a terminal also get Ctrl+C themselves; they
+    // ignore the second signal
+    slot.worker?.process.kill("SIGTERM");
+  }
+  if (slots.every((s) => !s.worker)) process.exit(0);
+
+  // Workers give up draining after SHUTDOWN_TIMEOUT_MS; allow time to flush
+  setTimeout(() => {
+    console.error("⏱️  Workers did not stop in time, killing them");
+    for (const slot of slots) slot.worker?.process.kill("SIGKILL");
+    process.exit(1);
+  }, SHUTDOWN_TIMEOUT_MS + 5 * 1000).unref();
+};
+process.on("SIGINT", shutdown);
+process.on("SIGTERM", shutdown);
+
+console.log(`🧩 Cluster primary ${process.pid} starting ${WORKERS} worker(s)`);
+for (let index = 0; index < WORKERS; index++) fork(index);
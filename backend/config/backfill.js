@@ -0,0 +1,80 @@
+import Hostel from "../models/Hostel.js";
+import { rebuildRatings } from "../models/Review.js";
+
+// Rating aggregates from reviews still embedded in the hostel
+const RATINGS_FROM_EMBEDDED = {
+  $set: {
+    reviewCount: { $size: "$reviews" },
+    ratingSum: { $sum: "$reviews.rating" },
+    avgRating: { $ifNull: [{ $avg: "$reviews.rating" }, 0] },
+    ratingHistogram: Object.fromEntries(
+      [1, 2, 3, 4, 5].map((stars) => [
+        stars,
+        { $size: { $filter: { input: "$reviews", cond: { $eq: ["$$this.rating", stars] } } } },
+      ])
+    ),
+  },
+};
+
+// Hostels created before the rating aggregates existed have none, so they
+// would sort last, break listing cursors and never match minRating. Fill them
+// in from wherever their reviews are now.
+const fillMissingRatings = async () => {
+  const missing = { avgRating: { $exists: false } };
+
+  const embedded = await Hostel.updateMany(
+    { ...missing, reviews: { $type: "array" } },
+    [RATINGS_FROM_EMBEDDED],
+    { updatePipeline: true }
+  );
+
+  const migrated = await Hostel.distinct("_id", missing);
+  if (migrated.length) await rebuildRatings(migrated);
+
+  return embedded.modifiedCount + migrated.length;
+};
+
+// Hostels boosted before boostRank existed would sort as unboosted and, like
+// any hostel without it, break listing cursors. Same rule as the boost routes:
+// 1 while an approved boost is running.
+const fillMissingBoostRank = async (now = new Date()) => {
+  const result = await Hostel.updateMany(
+    { boostRank: { $exists: false } },
+    [
+      {
+        $set: {
+          boostRank: {
+            $cond: [
+              {
+                $and: [
+                  { $eq: ["$boost.isActive", true] },
+                  { $eq: ["$boost.status", "approved"] },
+                  { $gt: ["$boost.endDate", now] },
+                ],
+              },
+              1,
+              0,
+            ],
+          },
+        },
+      },
+    ],
+    { updatePipeline: true }
+  );
+  return result.modifiedCount;
+};
+
+// Give hostels that predate a stored listing field a value for it. Only
+// touches documents missing a field, so after the first run it finds nothing.
+const backfillListingFields = async () => {
+  try {
+    const ratings = await fillMissingRatings();
+    if (ratings) console.log(`⭐ Rating aggregates filled in for ${ratings} hostel(s)`);
+    const boostRanks = await fillMissingBoostRank();
+    if (boostRanks) console.log(`🚀 boostRank filled in for ${boostRanks} hostel(s)`);
+  } catch (err) {
+    console.error("❌ Listing field backfill error:", err.message);
+  }
+};
+
+export default backfillListingFields;
@@ -0,0 +1,19 @@
+import mongoose from "mongoose";
+
+// Make every model's indexes match the ones declared in its schema: build
+// missing indexes and drop ones that are no longer declared
+const syncIndexes = async () => {
+  for (const model of Object.values(mongoose.models)) {
+    try {
+      const dropped = await model.syncIndexes();
+      if (dropped.length) {
+        console.log(`🗂️  ${model.modelName}: dropped stale indexes ${dropped.join(", ")}`);
+      }
+    } catch (err) {
+      console.error(`❌ Index sync error (${model.modelName}):`, err.message);
+    }
+  }
+  console.log("✅ Indexes in sync");
+};
+
+export default syncIndexes;
@@ -0,0 +1,95 @@
+import Hostel from "../models/Hostel.js";
+import User from "../models/User.js";
+import Review from "../models/Review.js";
+import { computeSalesStats } from "./salesController.js";
+
+// How many items of each moderation queue the dashboard shows
+const QUEUE_PAGE_SIZE = 10;
+const RECENT_REVIEWS = 5;
+
+const countWhen = (cond) => ({ $sum: { $cond: [cond, 1, 0] } });
+
+// Everything the admin dashboard shows, in one request. Hostel counts and the
+// moderation queues come from a single $facet pass; the latest reviews, user
+// counts and sales run alongside it. The route caches the result until
+// a hostel, user or sale write invalidates it.
+export const getAdminSummary = async (req, res) => {
+  try {
+    const [[hostels], recentReviews, userCounts, sales] = await Promise.all([
+      Hostel.aggregate([
+        {
+          $facet: {
+            counts: [
+              {
+                $group: {
+                  _id: null,
+                  total: { $sum: 1 },
+                  pending: countWhen({ $eq: [{ $ifNull: ["$status", "pending"] }, "pending"] }),
+                  approved: countWhen({ $eq: ["$status", "approved"] }),
+                  rejected: countWhen({ $eq: ["$status", "rejected"] }),
+                  pendingBoosts: countWhen({
+                    $and: [{ $eq: ["$boost.isActive", true] }, { $eq: ["$boost.status", "pending"] }],
+                  }),
+                  activeBoosts: countWhen({
+                    $and: [{ $eq: ["$boost.isActive", true] }, { $eq: ["$boost.status", "approved"] }],
+                  }),
+                },
+              },
+            ],
+            // Oldest submissions first, so nothing waits forever
+            pendingHostels: [
+              { $match: { status: { $in: ["pending", null] } } },
+              { $sort: { createdAt: 1, _id: 1 } },
+              { $limit: QUEUE_PAGE_SIZE },
+              { $project: { name: 1, area: 1, ownerId: 1, status: 1, createdAt: 1 } },
+            ],
+            // Requests awaiting approval, then running boosts
+            boostQueue: [
+              { $match: { "boost.isActive": true } },
+              { $sort: { "boost.status": -1, updatedAt: 1, _id: 1 } },
+              { $limit: QUEUE_PAGE_SIZE },
+              { $project: { name: 1, area: 1, boost: 1 } },
+            ],
+          },
+        },
+      ]),
+      Review.find()
+        .sort({ createdAt: -1 })
+        .limit(RECENT_REVIEWS)
+        .populate("hostelId", "name")
+        .lean(),
+      User.aggregate([{ $group: { _id: "$role", count: { $sum: 1 } } }]),
+      computeSalesStats(),
+    ]);
+
+    const { _id, ...counts } = hostels.counts[0] || {
+      total: 0,
+      pending: 0,
+      approved: 0,
+      rejected: 0,
+      pendingBoosts: 0,
+      activeBoosts: 0,
+    };
+    const roles = Object.fromEntries(userCounts.map((r) => [r._id, r.count]));
+
+    res.status(200).json({
+      success: true,
+      hostels: counts,
+      users: { users: roles.user || 0, owners: roles.owner || 0, admins: roles.admin || 0 },
+      sales,
+      pendingHostels: hostels.pendingHostels,
+      boostQueue: hostels.boostQueue,
+      recentReviews: recentReviews.map((r) => ({
+        _id: r._id,
+        hostelId: r.hostelId?._id ?? r.hostelId,
+        hostelName: r.hostelId?.name,
+        rating: r.rating,
+        text: r.text,
+        createdAt: r.createdAt,
+      })),
+    });
+  } catch (error) {
+    console.error("Admin summary error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
+  }
+};
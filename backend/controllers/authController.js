@@ -1,6 +1,7 @@
 import bcrypt from "bcrypt";
 import jwt from "jsonwebtoken";
 import User from "../models/User.js";
+import { invalidateCache, ADMIN_SUMMARY_TAG } from "../middleware/cache.js";
 
 // Register a new user
 export const register = async (req, res) => {
@@ -35,6 +36,7 @@ export const register = async (req, res) => {
       password: hashedPassword,
       role: role || "user",
     });
+    invalidateCache(ADMIN_SUMMARY_TAG);
 
     // Check if JWT_SECRET is set
     if (!process.env.JWT_SECRET) {
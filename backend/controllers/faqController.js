@@ -1,5 +1,6 @@
 // controllers/faqController.js
 import FAQ from "../models/FAQ.js";
+import { invalidateCache, FAQ_TAG } from "../middleware/cache.js";
 
 // GET /api/faqs
 export const getFAQs = async (req, res) => {
@@ -26,6 +27,7 @@ export const createFAQ = async (req, res) => {
       answer: answer.trim(),
       createdBy: req.user?.userId || null,
     });
+    invalidateCache(FAQ_TAG);
 
     return res.status(201).json(faq);
   } catch (error) {
@@ -47,6 +49,7 @@ export const updateFAQ = async (req, res) => {
     if (answer) faq.answer = answer.trim();
 
     await faq.save();
+    invalidateCache(FAQ_TAG);
     return res.status(200).json(faq);
   } catch (error) {
     console.error("updateFAQ error:", error);
@@ -62,6 +65,7 @@ export const deleteFAQ = async (req, res) => {
     if (!faq) return res.status(404).json({ success: false, message: "FAQ not found" });
 
     await FAQ.findByIdAndDelete(id);
+    invalidateCache(FAQ_TAG);
     return res.status(200).json({ success: true, message: "FAQ deleted" });
   } catch (error) {
     console.error("deleteFAQ error:", error);
@@ -1,93 +1,329 @@
+import mongoose from "mongoose";
 import Hostel from "../models/Hostel.js";
 import User from "../models/User.js";
 import Sale from "../models/Sales.js";
+import { recordSale } from "../models/SalesRollup.js";
 import Visit from "../models/Visit.js";
+import Review from "../models/Review.js";
+import Question from "../models/Question.js";
+import { invalidateCache, invalidateHostel, HOSTEL_LIST_TAG, ADMIN_SUMMARY_TAG } from "../middleware/cache.js";
+import { recordView } from "../jobs/viewCounter.js";
 
 
-// Get all hostels (with optional filters)
+const DEFAULT_PAGE_SIZE = 20;
+const MAX_PAGE_SIZE = 100;
+
+// Listing order: running boosts first, then by stored average rating, newest
+// first on ties and _id last so that every hostel has exactly one position.
+// Matches the listing indexes on the Hostel model.
+export const LISTING_SORT = { boostRank: -1, avgRating: -1, createdAt: -1, _id: -1 };
+
+// Cursors are the sort key of the last hostel on the previous page
+const encodeCursor = (h) =>
+  Buffer.from(
+    JSON.stringify([h.boostRank, h.avgRating, h.createdAt.toISOString(), String(h._id)])
+  ).toString("base64url");
+
+const decodeCursor = (cursor) => {
+  try {
+    const [boostRank, avgRating, createdAt, id] = JSON.parse(
+      Buffer.from(cursor, "base64url").toString("utf-8")
+    );
+    const date = new Date(createdAt);
+    if (
+      typeof boostRank !== "number" ||
+      typeof avgRating !== "number" ||
+      Number.isNaN(date.getTime()) ||
+      !mongoose.isValidObjectId(id)
+    ) {
+      return null;
+    }
+    return { boostRank, avgRating, createdAt: date, _id: new mongoose.Types.ObjectId(id) };
+  } catch {
+    return null;
+  }
+};
+
+// Everything that sorts after the cursor in LISTING_SORT order
+export const afterCursor = ({ boostRank, avgRating, createdAt, _id }) => ({
+  $or: [
+    { boostRank: { $lt: boostRank } },
+    { boostRank, avgRating: { $lt: avgRating } },
+    { boostRank, avgRating, createdAt: { $lt: createdAt } },
+    { boostRank, avgRating, createdAt, _id: { $lt: _id } },
+  ],
+});
+
+// What a listing card needs; reviews, questions, FAQs and the owner are only
+// sent by the detail endpoint. Sort keys are included for the cursor.
+export const LIST_FIELDS =
+  "name area rent gender profession image amenities nearbyUniversities " +
+  "avgRating reviewCount views shortlists status boostRank boost.endDate createdAt";
+
+export const toSummary = (h, now) => ({
+  _id: h._id,
+  name: h.name,
+  area: h.area,
+  rent: h.rent,
+  gender: h.gender,
+  profession: h.profession,
+  image: h.image,
+  amenities: h.amenities,
+  nearbyUniversities: h.nearbyUniversities,
+  avgRating: h.avgRating,
+  reviewCount: h.reviewCount,
+  views: h.views,
+  shortlists: h.shortlists,
+  status: h.status,
+  // Boosts past their endDate are cleared by jobs/boostSweeper.js; until it
+  // runs they still rank first but are not shown as boosted
+  boosted: h.boostRank === 1 && Boolean(h.boost?.endDate) && new Date(h.boost.endDate) > now,
+});
+
+// `?area=a,b` and `?area=a&area=b` both mean "a or b"
+const listParam = (value) =>
+  (Array.isArray(value) ? value : String(value || "").split(","))
+    .map((v) => v.trim())
+    .filter(Boolean);
+
+// The listing filters in a query string, one condition per filter panel
+// control, so that the listing and the facet counts apply the same ones
+export const listingConditions = (query) => {
+  const { gender, profession, minRent, maxRent, minRating } = query;
+  const areas = listParam(query.area);
+  const universities = listParam(query.universities);
+
+  const conditions = {};
+  if (areas.length) conditions.area = { area: { $in: areas } };
+  if (universities.length) conditions.universities = { nearbyUniversities: { $in: universities } };
+  if (gender) conditions.gender = { gender };
+  if (profession) conditions.profession = { profession };
+  if (minRent || maxRent) {
+    const rent = {};
+    if (minRent) rent.$gte = Number(minRent);
+    if (maxRent) rent.$lte = Number(maxRent);
+    conditions.rent = { rent };
+  }
+  if (minRating) conditions.rating = { avgRating: { $gte: Number(minRating) } };
+  return conditions;
+};
+
+// Get all hostels (with optional filters), one page at a time. The public
+// listing returns summaries; the admin listing returns full documents.
 export const getAllHostels = async (req, res) => {
   try {
-    const { status, area, gender, profession, minRent, maxRent } = req.query;
+    const { cursor } = req.query;
+
+    const limit = Math.min(
+      Math.max(parseInt(req.query.limit, 10) || DEFAULT_PAGE_SIZE, 1),
+      MAX_PAGE_SIZE
+    );
 
-    const filter = {};
+    const filter = Object.assign({}, ...Object.values(listingConditions(req.query)));
 
     if (req.user?.role !== "admin") {
       filter.status = "approved";
     }
 
-    if (area) filter.area = area;
-    if (gender) filter.gender = gender;
-    if (profession) filter.profession = profession;
-
-    if (minRent || maxRent) {
-      filter.rent = {};
-      if (minRent) filter.rent.$gte = Number(minRent);
-      if (maxRent) filter.rent.$lte = Number(maxRent);
+    let position = null;
+    if (cursor) {
+      position = decodeCursor(cursor);
+      if (!position) {
+        return res.status(400).json({ success: false, message: "Invalid cursor" });
+      }
     }
 
-    let hostels = await Hostel.find(filter)
-      .populate("ownerId", "name email")
-      .sort({ createdAt: -1 });
+    const full = req.user?.role === "admin";
+    let query = Hostel.find(position ? { $and: [filter, afterCursor(position)] } : filter)
+      .sort(LISTING_SORT)
+      .limit(limit + 1);
+    query = full ? query.populate("ownerId", "name email") : query.select(LIST_FIELDS);
+    const page = await query.lean();
 
-    const now = new Date();
+    const hasMore = page.length > limit;
+    let hostels = page.slice(0, limit);
+    const nextCursor = hasMore ? encodeCursor(hostels[hostels.length - 1]) : null;
 
-    for (let h of hostels) {
-      if (
-        h.boost?.isActive &&
-        h.boost?.endDate &&
-        new Date(h.boost.endDate) < now
-      ) {
-        // Reset in database
-        await Hostel.updateOne(
-          { _id: h._id },
-          {
-            $set: {
-              "boost.isActive": false,
-              "boost.status": "none",
-              "boost.durationDays": null,
-              "boost.startDate": null,
-              "boost.endDate": null
-            }
-          }
-        );
-
-        // Also update the local object so frontend receives updated values
-        h.boost.isActive = false;
-        h.boost.status = "none";
-        h.boost.durationDays = null;
-        h.boost.startDate = null;
-        h.boost.endDate = null;
+    const now = new Date();
+    if (full) {
+      // Report boosts the sweeper has not reached yet as inactive
+      for (const h of hostels) {
+        if (h.boost?.isActive && h.boost.endDate && new Date(h.boost.endDate) < now) {
+          h.boost = { ...h.boost, isActive: false, status: "none" };
+        }
       }
+    } else {
+      hostels = hostels.map((h) => toSummary(h, now));
     }
 
+    res.status(200).json({
+      success: true,
+      count: hostels.length,
+      hostels,
+      nextCursor,
+    });
+  } catch (error) {
+    console.error("Get all hostels error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
+  }
+};
 
-    hostels = hostels.sort((a, b) => {
-      const aBoost = a.boost?.status === "approved";
-      const bBoost = b.boost?.status === "approved";
+// Rent ranges shown in the filter panel (lower bounds, PKR/month)
+const RENT_BUCKETS = [0, 10000, 15000, 20000, 25000, 30000, 40000];
 
-      if (aBoost && !bBoost) return -1;
-      if (!aBoost && bBoost) return 1;
+// Option counts for the filter panel, computed with one $facet pass over the
+// same conditions as the listing. Each facet applies every filter except its
+// own, so choosing an area still shows how many hostels the other areas have.
+export const getHostelFacets = async (req, res) => {
+  try {
+    const base = {};
+    if (req.user?.role !== "admin") {
+      base.status = "approved";
+    }
 
-      const aRating =
-        a.reviews?.length > 0
-          ? a.reviews.reduce((s, r) => s + r.rating, 0) / a.reviews.length
-          : 0;
+    const conditions = listingConditions(req.query);
 
-      const bRating =
-        b.reviews?.length > 0
-          ? b.reviews.reduce((s, r) => s + r.rating, 0) / b.reviews.length
-          : 0;
+    const except = (name) => ({
+      $match: Object.assign(
+        {},
+        ...Object.entries(conditions)
+          .filter(([key]) => key !== name)
+          .map(([, condition]) => condition)
+      ),
+    });
+
+    const countBy = (field) => [
+      { $group: { _id: field, count: { $sum: 1 } } },
+      { $sort: { count: -1, _id: 1 } },
+      { $project: { _id: 0, value: "$_id", count: 1 } },
+    ];
+
+    const [facets] = await Hostel.aggregate([
+      { $match: base },
+      {
+        $facet: {
+          areas: [except("area"), ...countBy("$area")],
+          universities: [
+            except("universities"),
+            { $unwind: "$nearbyUniversities" },
+            ...countBy("$nearbyUniversities"),
+          ],
+          gender: [except("gender"), ...countBy("$gender")],
+          profession: [except("profession"), ...countBy("$profession")],
+          rent: [
+            except("rent"),
+            {
+              $bucket: {
+                groupBy: "$rent",
+                boundaries: [...RENT_BUCKETS, Number.MAX_SAFE_INTEGER],
+                default: "other",
+                output: { count: { $sum: 1 } },
+              },
+            },
+            { $project: { _id: 0, min: "$_id", count: 1 } },
+          ],
+          total: [except(null), { $count: "count" }],
+        },
+      },
+    ]);
 
-      return bRating - aRating;
+    res.status(200).json({
+      success: true,
+      facets: {
+        areas: facets.areas,
+        universities: facets.universities,
+        gender: facets.gender,
+        profession: facets.profession,
+        rent: facets.rent,
+      },
+      total: facets.total[0]?.count || 0,
     });
+  } catch (error) {
+    console.error("Get hostel facets error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
+  }
+};
+
+// Search cursors are the relevance score and id of the last result
+const encodeSearchCursor = (h) =>
+  Buffer.from(JSON.stringify([h.score, String(h._id)])).toString("base64url");
+
+const decodeSearchCursor = (cursor) => {
+  try {
+    const [score, id] = JSON.parse(Buffer.from(cursor, "base64url").toString("utf-8"));
+    if (typeof score !== "number" || !mongoose.isValidObjectId(id)) return null;
+    return { score, _id: new mongoose.Types.ObjectId(id) };
+  } catch {
+    return null;
+  }
+};
+
+// Full-text search over the weighted text index, best matches first
+export const searchHostels = async (req, res) => {
+  try {
+    const { q, cursor } = req.query;
+
+    if (!q || !q.trim()) {
+      return res.status(400).json({ success: false, message: "Search query is required" });
+    }
+
+    const limit = Math.min(
+      Math.max(parseInt(req.query.limit, 10) || DEFAULT_PAGE_SIZE, 1),
+      MAX_PAGE_SIZE
+    );
+
+    // Same filters as the listing, so results match the applied filter panel
+    const filter = Object.assign(
+      { $text: { $search: q.trim() } },
+      ...Object.values(listingConditions(req.query))
+    );
+
+    if (req.user?.role !== "admin") {
+      filter.status = "approved";
+    }
+
+    const pipeline = [
+      { $match: filter },
+      { $addFields: { score: { $meta: "textScore" } } },
+    ];
+
+    if (cursor) {
+      const position = decodeSearchCursor(cursor);
+      if (!position) {
+        return res.status(400).json({ success: false, message: "Invalid cursor" });
+      }
+      pipeline.push({
+        $match: {
+          $or: [
+            { score: { $lt: position.score } },
+            { score: position.score, _id: { $lt: position._id } },
+          ],
+        },
+      });
+    }
+
+    pipeline.push(
+      { $sort: { score: -1, _id: -1 } },
+      { $limit: limit + 1 },
+      { $project: { ...Object.fromEntries(LIST_FIELDS.split(" ").map((f) => [f, 1])), score: 1 } }
+    );
+
+    const page = await Hostel.aggregate(pipeline);
+    const hasMore = page.length > limit;
+    const matches = page.slice(0, limit);
+    const nextCursor = hasMore ? encodeSearchCursor(matches[matches.length - 1]) : null;
+
+    const now = new Date();
+    const hostels = matches.map((h) => ({ ...toSummary(h, now), score: h.score }));
 
     res.status(200).json({
       success: true,
       count: hostels.length,
       hostels,
+      nextCursor,
     });
   } catch (error) {
-    console.error("Get all hostels error:", error);
+    console.error("Search hostels error:", error);
     res.status(500).json({ success: false, message: "Server error" });
   }
 };
@@ -167,6 +403,7 @@ export const createHostel = async (req, res) => {
     });
 
     const populatedHostel = await Hostel.findById(hostel._id).populate("ownerId", "name email");
+    invalidateCache(HOSTEL_LIST_TAG);
 
     res.status(201).json({
       success: true,
@@ -203,6 +440,11 @@ export const updateHostel = async (req, res) => {
 
     delete updates.status;
 
+    // Maintained by the review and boost routes, never set directly
+    for (const field of ["avgRating", "reviewCount", "ratingSum", "ratingHistogram", "boostRank"]) {
+      delete updates[field];
+    }
+
     if (updates.nearbyUniversities && !Array.isArray(updates.nearbyUniversities)) {
       return res.status(400).json({
         success: false,
@@ -221,6 +463,7 @@ export const updateHostel = async (req, res) => {
     await hostel.save();
 
     const updatedHostel = await Hostel.findById(id).populate("ownerId", "name email");
+    invalidateHostel(id);
 
     res.status(200).json({
       success: true,
@@ -255,6 +498,9 @@ export const deleteHostel = async (req, res) => {
     }
 
     await Hostel.findByIdAndDelete(id);
+    await Review.deleteMany({ hostelId: id });
+    await Question.deleteMany({ hostelId: id });
+    invalidateHostel(id);
 
     res.status(200).json({
       success: true,
@@ -282,6 +528,7 @@ export const approveHostel = async (req, res) => {
 
     hostel.status = "approved";
     await hostel.save();
+    invalidateHostel(id);
 
     const updatedHostel = await Hostel.findById(id)
       .populate("ownerId", "name email");
@@ -312,6 +559,9 @@ export const rejectHostel = async (req, res) => {
     }
 
     await Hostel.findByIdAndDelete(id);
+    await Review.deleteMany({ hostelId: id });
+    await Question.deleteMany({ hostelId: id });
+    invalidateHostel(id);
 
     res.status(200).json({
       success: true,
@@ -343,32 +593,17 @@ export const getHostelsByOwner = async (req, res) => {
   }
 };
 
-// Increment hostel view count
-export const increaseViewCount = async (req, res) => {
-  try {
-    const { id } = req.params;
-
-    const hostel = await Hostel.findByIdAndUpdate(
-      id,
-      { $inc: { views: 0.5 } },
-      { new: true }
-    ).populate("ownerId", "name email");
+// Increment hostel view count. Views are buffered and written in batches by
+// jobs/viewCounter.js, so an unknown id is simply a no-op update.
+export const increaseViewCount = (req, res) => {
+  const { id } = req.params;
 
-    if (!hostel) {
-      return res.status(404).json({
-        success: false,
-        message: "Hostel not found",
-      });
-    }
-
-    res.status(200).json({
-      success: true,
-      hostel,
-    });
-  } catch (error) {
-    console.error("Increase view count error:", error);
-    res.status(500).json({ success: false, message: "Server error" });
+  if (!mongoose.isValidObjectId(id)) {
+    return res.status(400).json({ success: false, message: "Invalid hostel ID" });
   }
+
+  recordView(id);
+  res.status(204).end();
 };
 
 // Add FAQ
@@ -386,6 +621,7 @@ export const addFaq = async (req, res) => {
 
     hostel.faqs.push({ question, answer });
     await hostel.save();
+    invalidateHostel(id);
 
     res.status(200).json({ success: true, message: "FAQ added", faqs: hostel.faqs });
   } catch (error) {
@@ -414,6 +650,7 @@ export const updateFaq = async (req, res) => {
     faq.answer = answer ?? faq.answer;
 
     await hostel.save();
+    invalidateHostel(id);
 
     res.status(200).json({ success: true, message: "FAQ updated", faqs: hostel.faqs });
   } catch (error) {
@@ -433,6 +670,7 @@ export const deleteFaq = async (req, res) => {
     hostel.faqs = hostel.faqs.filter((f) => f._id.toString() !== faqId);
 
     await hostel.save();
+    invalidateHostel(id);
 
     res.status(200).json({ success: true, message: "FAQ deleted", faqs: hostel.faqs });
   } catch (error) {
@@ -457,6 +695,7 @@ export const requestBoost = async (req, res) => {
       return res.status(400).json({ success: false, message: "Please provide a valid boost duration in days" });
     }
 
+    hostel.boostRank = 0;
     hostel.boost = {
       isActive: true, // boost is requested
       status: "pending",
@@ -466,6 +705,7 @@ export const requestBoost = async (req, res) => {
     };
 
     await hostel.save();
+    invalidateHostel(id);
 
     res.status(200).json({ success: true, message: "Boost requested successfully", boost: hostel.boost });
   } catch (error) {
@@ -500,22 +740,26 @@ export const approveBoost = async (req, res) => {
     const now = new Date();
     const durationMs = (hostel.boost.durationDays || 1) * 24 * 60 * 60 * 1000; // convert days to ms
 
+    hostel.boostRank = 1;
     hostel.boost.status = "approved";
     hostel.boost.isActive = true;
     hostel.boost.startDate = now;
     hostel.boost.endDate = new Date(now.getTime() + durationMs);
 
     await hostel.save();
+    invalidateHostel(id);
 
     const amount = calculateBoostPrice(hostel.boost.durationDays); 
 
-    await Sale.create({
+    const sale = await Sale.create({
       hostelId: hostel._id,
       ownerId: hostel.ownerId,
       durationDays: hostel.boost.durationDays,
       amount,
       purchasedAt: new Date(),
     });
+    await recordSale(sale);
+    invalidateCache(ADMIN_SUMMARY_TAG);
 
     res.status(200).json({ success: true, message: "Boost approved", boost: hostel.boost });
   } catch (error) {
@@ -539,6 +783,7 @@ export const rejectBoost = async (req, res) => {
       return res.status(400).json({ success: false, message: "No pending boost request found" });
     }
 
+    hostel.boostRank = 0;
     hostel.boost.isActive = false;
     hostel.boost.status = "pending";
     hostel.boost.startDate = null;
@@ -546,6 +791,7 @@ export const rejectBoost = async (req, res) => {
     hostel.boost.durationDays = null;
 
     await hostel.save();
+    invalidateHostel(id);
 
     res.status(200).json({ success: true, message: "Boost request rejected", boost: hostel.boost });
   } catch (error) {
@@ -607,7 +853,8 @@ export const getMyVisitsForOwner = async (req, res) => {
 
     const visits = await Visit.find({ owner: ownerId })
       .populate("user", "name email")
-      .populate("hostel", "name area");
+      .populate("hostel", "name area")
+      .sort({ createdAt: -1 });
 
     res.status(200).json({
       success: true,
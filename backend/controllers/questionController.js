@@ -1,5 +1,10 @@
+import mongoose from "mongoose";
 import Hostel from "../models/Hostel.js";
-import User from "../models/User.js";
+import Question from "../models/Question.js";
+import { findPage, newestFirst, oldestFirst } from "../utils/pagination.js";
+
+const invalidCursor = (res) =>
+  res.status(400).json({ success: false, message: "Invalid cursor" });
 
 // Add question to hostel
 export const addQuestion = async (req, res) => {
@@ -14,7 +19,9 @@ export const addQuestion = async (req, res) => {
       });
     }
 
-    const hostel = await Hostel.findById(id);
+    const hostel = mongoose.isValidObjectId(id)
+      ? await Hostel.findById(id).select("ownerId").lean()
+      : null;
     
     if (!hostel) {
       return res.status(404).json({ 
@@ -23,22 +30,19 @@ export const addQuestion = async (req, res) => {
       });
     }
 
-    // Add question
-    hostel.questions.push({
+    // Add question, filed under the owner's inbox
+    const question = await Question.create({
+      hostelId: hostel._id,
+      ownerId: hostel.ownerId,
       userId: req.user.userId,
       text: text.trim(),
-      answer: null,
     });
-
-    await hostel.save();
-
-    const updatedHostel = await Hostel.findById(id)
-      .populate("ownerId", "name email");
+    await question.populate("userId", "name");
 
     res.status(200).json({
       success: true,
       message: "Question added successfully",
-      hostel: updatedHostel,
+      question,
     });
   } catch (error) {
     console.error("Add question error:", error);
@@ -49,7 +53,8 @@ export const addQuestion = async (req, res) => {
   }
 };
 
-// Answer question (owner only)
+// Answer question (owner only). One conditional write: the filter checks the
+// question belongs to this hostel and the hostel to this owner.
 export const answerQuestion = async (req, res) => {
   try {
     const { id, questionId } = req.params;
@@ -62,82 +67,157 @@ export const answerQuestion = async (req, res) => {
       });
     }
 
-    const hostel = await Hostel.findById(id);
-    
-    if (!hostel) {
-      return res.status(404).json({ 
-        success: false, 
-        message: "Hostel not found" 
+    if (!mongoose.isValidObjectId(id) || !mongoose.isValidObjectId(questionId)) {
+      return res.status(404).json({ success: false, message: "Question not found" });
+    }
+
+    const answeredAt = new Date();
+    const question = await Question.findOneAndUpdate(
+      { _id: questionId, hostelId: id, ownerId: req.user.userId },
+      { $set: { answer: answer.trim(), answered: true, answeredAt } },
+      { new: true }
+    )
+      .populate("userId", "name")
+      .lean();
+
+    if (question) {
+      return res.status(200).json({
+        success: true,
+        message: "Answer added successfully",
+        question,
+      });
+    }
+
+    // Hostels migrations/migrateQuestions.js has not reached yet
+    const result = await Hostel.updateOne(
+      { _id: id, ownerId: req.user.userId, "questions._id": questionId },
+      { $set: { "questions.$.answer": answer.trim(), "questions.$.answeredAt": answeredAt } }
+    );
+    if (result.matchedCount > 0) {
+      return res.status(200).json({
+        success: true,
+        message: "Answer added successfully",
+        question: { _id: questionId, hostelId: id, answer: answer.trim(), answered: true, answeredAt },
       });
     }
 
-    // Check if user is the owner
-    if (hostel.ownerId.toString() !== req.user.userId) {
+    const exists =
+      (await Question.exists({ _id: questionId, hostelId: id })) ||
+      (await Hostel.exists({ _id: id, "questions._id": questionId }));
+    if (exists) {
       return res.status(403).json({ 
         success: false, 
         message: "Only the hostel owner can answer questions" 
       });
     }
+    res.status(404).json({ 
+      success: false, 
+      message: "Question not found" 
+    });
+  } catch (error) {
+    console.error("Answer question error:", error);
+    res.status(500).json({ 
+      success: false, 
+      message: "Server error" 
+    });
+  }
+};
 
-    // Find and update question
-    const question = hostel.questions.id(questionId);
-    if (!question) {
-      return res.status(404).json({ 
-        success: false, 
-        message: "Question not found" 
-      });
+// Get a hostel's questions, newest first, one page at a time
+export const getHostelQuestions = async (req, res) => {
+  try {
+    const { id } = req.params;
+
+    if (!mongoose.isValidObjectId(id)) {
+      return res.status(404).json({ success: false, message: "Hostel not found" });
     }
 
-    question.answer = answer.trim();
-    question.answeredAt = new Date();
-    await hostel.save();
+    const page = await findPage(Question, { hostelId: id }, {
+      cursor: req.query.cursor,
+      limit: req.query.limit,
+      populate: [["userId", "name"]],
+    });
+    if (!page) return invalidCursor(res);
 
-    const updatedHostel = await Hostel.findById(id)
-      .populate("ownerId", "name email");
+    if (page.first && page.items.length === 0 && !(await Hostel.exists({ _id: id }))) {
+      return res.status(404).json({ success: false, message: "Hostel not found" });
+    }
 
     res.status(200).json({
       success: true,
-      message: "Answer added successfully",
-      hostel: updatedHostel,
+      questions: page.items,
+      nextCursor: page.nextCursor,
     });
   } catch (error) {
-    console.error("Answer question error:", error);
-    res.status(500).json({ 
-      success: false, 
-      message: "Server error" 
+    console.error("Get hostel questions error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
+  }
+};
+
+// Owner inbox: questions on the owner's hostels, unanswered ones by default
+// (oldest first), or ?status=answered (newest first). `count` is always the
+// number still waiting for an answer.
+export const getOwnerQuestions = async (req, res) => {
+  try {
+    const ownerId = req.user.userId;
+    const answered = req.query.status === "answered";
+
+    const [page, count] = await Promise.all([
+      findPage(Question, { ownerId, answered }, {
+        cursor: req.query.cursor,
+        limit: req.query.limit,
+        sort: answered ? newestFirst : oldestFirst,
+        populate: [["hostelId", "name"], ["userId", "name"]],
+      }),
+      Question.countDocuments({ ownerId, answered: false }),
+    ]);
+    if (!page) return invalidCursor(res);
+
+    res.status(200).json({
+      success: true,
+      count,
+      questions: page.items.map((q) => ({
+        questionId: q._id,
+        hostelId: q.hostelId?._id ?? q.hostelId,
+        hostelName: q.hostelId?.name,
+        askedBy: q.userId?.name,
+        text: q.text,
+        answer: q.answer,
+        askedAt: q.createdAt,
+        answeredAt: q.answeredAt,
+      })),
+      nextCursor: page.nextCursor,
     });
+  } catch (error) {
+    console.error("Get owner questions error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
   }
 };
 
-// Get all questions asked by the logged-in user
+// Get the questions asked by the logged-in user, newest first, one page at a time
 export const getQuestionsByUser = async (req, res) => {
   try {
     const userId = req.user.userId;
 
-    // Find all hostels that contain at least one question by this user
-    const hostels = await Hostel.find({ "questions.userId": userId }).select("name questions");
-
-    const userQuestions = [];
-
-    hostels.forEach((hostel) => {
-      hostel.questions.forEach((q) => {
-        if (q.userId.toString() === userId) {
-          userQuestions.push({
-            questionId: q._id,
-            hostelId: hostel._id,
-            hostelName: hostel.name,
-            question: q.text,
-            answer: q.answer || null,
-            askedAt: q.createdAt,
-            answeredAt: q.answeredAt || null,
-          });
-        }
-      });
+    const page = await findPage(Question, { userId }, {
+      cursor: req.query.cursor,
+      limit: req.query.limit,
+      populate: [["hostelId", "name"]],
     });
+    if (!page) return invalidCursor(res);
 
     res.status(200).json({
       success: true,
-      questions: userQuestions,
+      questions: page.items.map((q) => ({
+        questionId: q._id,
+        hostelId: q.hostelId?._id ?? q.hostelId,
+        hostelName: q.hostelId?.name,
+        question: q.text,
+        answer: q.answer || null,
+        askedAt: q.createdAt,
+        answeredAt: q.answeredAt || null,
+      })),
+      nextCursor: page.nextCursor,
     });
   } catch (error) {
     console.error("Get user questions error:", error);
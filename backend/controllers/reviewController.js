@@ -1,4 +1,31 @@
+import mongoose from "mongoose";
 import Hostel from "../models/Hostel.js";
+import Review from "../models/Review.js";
+import { invalidateHostel } from "../middleware/cache.js";
+import { findPage } from "../utils/pagination.js";
+
+// Average of the stored sum and count, set after they have been changed
+const AVG_RATING = {
+  $set: {
+    avgRating: {
+      $cond: [{ $gt: ["$reviewCount", 0] }, { $divide: ["$ratingSum", "$reviewCount"] }, 0],
+    },
+  },
+};
+
+// Pipeline stage that moves the rating aggregates by one review (+1 or -1)
+const shiftRatings = (rating, step) => ({
+  $set: {
+    reviewCount: { $add: [{ $ifNull: ["$reviewCount", 0] }, step] },
+    ratingSum: { $add: [{ $ifNull: ["$ratingSum", 0] }, step * rating] },
+    [`ratingHistogram.${rating}`]: {
+      $add: [{ $ifNull: [`$ratingHistogram.${rating}`, 0] }, step],
+    },
+  },
+});
+
+// Rating fields sent back after a review is added or removed
+const RATING_FIELDS = { avgRating: 1, reviewCount: 1, ratingHistogram: 1 };
 
 // Add review to hostel
 export const addReview = async (req, res) => {
@@ -21,8 +48,17 @@ export const addReview = async (req, res) => {
       });
     }
 
-    const hostel = await Hostel.findById(id);
-    
+    if (!mongoose.isValidObjectId(id)) {
+      return res.status(404).json({ success: false, message: "Hostel not found" });
+    }
+
+    const userId = new mongoose.Types.ObjectId(req.user.userId);
+    const stars = Math.round(Number(rating));
+
+    // A review still embedded in a hostel that has not been migrated counts too
+    const hostel = await Hostel.findById(id)
+      .select({ reviews: { $elemMatch: { userId } } })
+      .lean();
     if (!hostel) {
       return res.status(404).json({ 
         success: false, 
@@ -30,35 +66,36 @@ export const addReview = async (req, res) => {
       });
     }
 
-    // Check if user has already reviewed this hostel
-    const existingReview = hostel.reviews.find(
-      (r) => r.userId.toString() === req.user.userId
-    );
-
-    if (existingReview) {
+    // The unique (hostelId, userId) index makes "one review per user" atomic
+    let review = null;
+    if (!hostel.reviews?.length) {
+      try {
+        review = await Review.create({ hostelId: id, userId, rating: stars, text: text.trim() });
+      } catch (error) {
+        if (error.code !== 11000) throw error;
+      }
+    }
+    if (!review) {
       return res.status(400).json({ 
         success: false, 
         message: "You have already reviewed this hostel" 
       });
     }
 
-    // Add review
-    hostel.reviews.push({
-      userId: req.user.userId,
-      rating: Number(rating),
-      text: text.trim(),
-    });
-
-    await hostel.save();
+    const ratings = await Hostel.findOneAndUpdate(
+      { _id: id },
+      [shiftRatings(stars, 1), AVG_RATING],
+      { new: true, projection: RATING_FIELDS, updatePipeline: true }
+    ).lean();
+    invalidateHostel(id);
 
-    const updatedHostel = await Hostel.findById(id)
-      .populate("ownerId", "name email")
-      .populate("reviews.userId", "name");
+    await review.populate("userId", "name");
 
     res.status(200).json({
       success: true,
       message: "Review added successfully",
-      hostel: updatedHostel,
+      review,
+      hostel: ratings,
     });
   } catch (error) {
     console.error("Add review error:", error);
@@ -74,17 +111,21 @@ export const deleteReview = async (req, res) => {
   try {
     const { id, reviewId } = req.params;
 
-    const hostel = await Hostel.findById(id);
-    
-    if (!hostel) {
-      return res.status(404).json({ 
-        success: false, 
-        message: "Hostel not found" 
-      });
+    if (!mongoose.isValidObjectId(id) || !mongoose.isValidObjectId(reviewId)) {
+      return res.status(404).json({ success: false, message: "Review not found" });
     }
 
-    // Find review
-    const review = hostel.reviews.id(reviewId);
+    // Find review, falling back to the embedded array for hostels the
+    // migration has not reached yet
+    let review = await Review.findOne({ _id: reviewId, hostelId: id }).lean();
+    let embedded = false;
+    if (!review) {
+      const hostel = await Hostel.findById(id)
+        .select({ reviews: { $elemMatch: { _id: reviewId } } })
+        .lean();
+      review = hostel?.reviews?.[0];
+      embedded = true;
+    }
     if (!review) {
       return res.status(404).json({ 
         success: false, 
@@ -103,17 +144,42 @@ export const deleteReview = async (req, res) => {
       });
     }
 
-    // Remove review
-    hostel.reviews.pull(reviewId);
-    await hostel.save();
-
-    const updatedHostel = await Hostel.findById(id)
-      .populate("ownerId", "name email");
+    // Only the request that actually removed the review moves the aggregates,
+    // so a concurrent delete cannot count it twice
+    let removed;
+    if (embedded) {
+      const result = await Hostel.updateOne(
+        { _id: id, "reviews._id": review._id },
+        [
+          {
+            $set: {
+              reviews: {
+                $filter: { input: "$reviews", cond: { $ne: ["$$this._id", review._id] } },
+              },
+            },
+          },
+          shiftRatings(review.rating, -1),
+          AVG_RATING,
+        ],
+        { updatePipeline: true }
+      );
+      removed = result.modifiedCount > 0;
+    } else {
+      const result = await Review.deleteOne({ _id: review._id });
+      removed = result.deletedCount > 0;
+      if (removed) {
+        await Hostel.updateOne(
+          { _id: id },
+          [shiftRatings(review.rating, -1), AVG_RATING],
+          { updatePipeline: true }
+        );
+      }
+    }
+    if (removed) invalidateHostel(id);
 
     res.status(200).json({
       success: true,
       message: "Review deleted successfully",
-      hostel: updatedHostel,
     });
   } catch (error) {
     console.error("Delete review error:", error);
@@ -124,16 +190,54 @@ export const deleteReview = async (req, res) => {
   }
 };
 
-// Get all reviews for a hostel
+// Whether the logged-in user has already reviewed a hostel. Reviews are
+// paged, so the detail page cannot tell from the reviews it has loaded.
+export const getMyReview = async (req, res) => {
+  try {
+    const { id } = req.params;
+
+    if (!mongoose.isValidObjectId(id)) {
+      return res.status(404).json({ success: false, message: "Hostel not found" });
+    }
+
+    const userId = new mongoose.Types.ObjectId(req.user.userId);
+    // Served by the unique (hostelId, userId) index; a review still embedded
+    // in a hostel that has not been migrated counts too
+    const [review, embedded] = await Promise.all([
+      Review.exists({ hostelId: id, userId }),
+      Hostel.exists({ _id: id, reviews: { $elemMatch: { userId } } }),
+    ]);
+
+    res.status(200).json({ success: true, reviewed: Boolean(review || embedded) });
+  } catch (error) {
+    console.error("Get my review error:", error);
+    res.status(500).json({ 
+      success: false, 
+      message: "Server error" 
+    });
+  }
+};
+
+// Get a hostel's reviews, newest first, one page at a time
 export const getReviews = async (req, res) => {
   try {
     const { id } = req.params;
 
-    const hostel = await Hostel.findById(id)
-      .populate("reviews.userId", "name email")
-      .select("reviews");
+    if (!mongoose.isValidObjectId(id)) {
+      return res.status(404).json({ success: false, message: "Hostel not found" });
+    }
 
-    if (!hostel) {
+    // Newest first, served by the (hostelId, createdAt, _id) index
+    const page = await findPage(Review, { hostelId: id }, {
+      cursor: req.query.cursor,
+      limit: req.query.limit,
+      populate: [["userId", "name"]],
+    });
+    if (!page) {
+      return res.status(400).json({ success: false, message: "Invalid cursor" });
+    }
+
+    if (page.first && page.items.length === 0 && !(await Hostel.exists({ _id: id }))) {
       return res.status(404).json({ 
         success: false, 
         message: "Hostel not found" 
@@ -142,7 +246,8 @@ export const getReviews = async (req, res) => {
 
     res.status(200).json({
       success: true,
-      reviews: hostel.reviews,
+      reviews: page.items,
+      nextCursor: page.nextCursor,
     });
   } catch (error) {
     console.error("Get reviews error:", error);
@@ -153,45 +258,40 @@ export const getReviews = async (req, res) => {
   }
 };
 
-// Get all reviews made by the logged-in user
+// Get the reviews made by the logged-in user, newest first, one page at a time
 export const getReviewsByUser = async (req, res) => {
   try {
     const userId = req.user.userId;
 
-    // Find all hostels containing at least one review by this user
-    const hostels = await Hostel.find({
-      "reviews.userId": userId,
-    }).select("name reviews");
+    const page = await findPage(Review, { userId }, {
+      cursor: req.query.cursor,
+      limit: req.query.limit,
+      populate: [["hostelId", "name"]],
+    });
+    if (!page) {
+      return res.status(400).json({ success: false, message: "Invalid cursor" });
+    }
 
-    if (!hostels || hostels.length === 0) {
+    if (page.first && page.items.length === 0) {
       return res.status(200).json({
         success: true,
         reviews: [],
+        nextCursor: null,
         message: "No reviews by this user",
       });
     }
 
-    // Extract only this user's reviews from each hostel
-    const userReviews = [];
-
-    hostels.forEach((hostel) => {
-      hostel.reviews.forEach((rev) => {
-        if (rev.userId.toString() === userId) {
-          userReviews.push({
-            reviewId: rev._id,
-            hostelId: hostel._id,
-            hostelName: hostel.name,
-            rating: rev.rating,
-            text: rev.text,
-            createdAt: rev.createdAt,
-          });
-        }
-      });
-    });
-
     res.status(200).json({
       success: true,
-      reviews: userReviews,
+      reviews: page.items.map((rev) => ({
+        reviewId: rev._id,
+        hostelId: rev.hostelId?._id ?? rev.hostelId,
+        hostelName: rev.hostelId?.name,
+        rating: rev.rating,
+        text: rev.text,
+        createdAt: rev.createdAt,
+      })),
+      nextCursor: page.nextCursor,
     });
   } catch (error) {
     console.error("Get reviews by user error:", error);
@@ -1,4 +1,20 @@
-import Sale from "../models/Sales.js";
+import SalesRollup from "../models/SalesRollup.js";
+
+// Lifetime totals and the monthly revenue breakdown, newest month first.
+// Read from the monthly rollups, so the cost grows with months, not sales.
+export const computeSalesStats = async () => {
+  const months = await SalesRollup.find().sort({ year: -1, month: -1 }).lean();
+
+  return {
+    totalRevenue: months.reduce((sum, m) => sum + m.revenue, 0),
+    totalBoostsSold: months.reduce((sum, m) => sum + m.boostCount, 0),
+    monthlyRevenue: months.map((m) => ({
+      _id: { year: m.year, month: m.month },
+      revenue: m.revenue,
+      boostCount: m.boostCount,
+    })),
+  };
+};
 
 export const getSalesStats = async (req, res) => {
   try {
@@ -7,34 +23,9 @@ export const getSalesStats = async (req, res) => {
       return res.status(403).json({ success: false, message: "Only admin can view sales stats" });
     }
 
-    // Total revenue (sum of all sales)
-    const totalRevenue = await Sale.aggregate([
-      { $group: { _id: null, total: { $sum: "$amount" } } }
-    ]);
-
-    // Total number of boost purchases
-    const totalBoostsSold = await Sale.countDocuments();
-
-    // Monthly revenue breakdown
-    const monthlyRevenue = await Sale.aggregate([
-      {
-        $group: {
-          _id: {
-            year: { $year: "$createdAt" },
-            month: { $month: "$createdAt" },
-          },
-          revenue: { $sum: "$amount" },
-          boostCount: { $sum: 1 }
-        }
-      },
-      { $sort: { "_id.year": -1, "_id.month": -1 } }
-    ]);
-
     res.status(200).json({
       success: true,
-      totalRevenue: totalRevenue[0]?.total || 0,
-      totalBoostsSold,
-      monthlyRevenue,
+      ...(await computeSalesStats()),
     });
   } catch (error) {
     console.error("Sales stats error:", error);
@@ -1,5 +1,7 @@
+import mongoose from "mongoose";
 import User from "../models/User.js";
 import Hostel from "../models/Hostel.js";
+import { LIST_FIELDS, toSummary } from "./hostelController.js";
 
 // Add a hostel to wishlist
 export const addToWishlist = async (req, res) => {
@@ -7,24 +9,27 @@ export const addToWishlist = async (req, res) => {
     const userId = req.user.userId;
     const { hostelId } = req.body;
 
-    // Check if hostel exists
-    const hostel = await Hostel.findById(hostelId);
-    if (!hostel) {
-      return res.status(404).json({ success: false, message: "Hostel not found" });
+    if (!mongoose.isValidObjectId(hostelId)) {
+      return res.status(400).json({ success: false, message: "Invalid hostel ID" });
     }
 
-    // Add to wishlist if not already added
-    const user = await User.findById(userId);
-    if (user.wishlist.includes(hostelId)) {
+    // Only matches when the hostel is not already saved, so concurrent clicks
+    // add it (and count the shortlist) once
+    const user = await User.findOneAndUpdate(
+      { _id: userId, wishlist: { $ne: hostelId } },
+      { $push: { wishlist: hostelId } },
+      { new: true, projection: { wishlist: 1 } }
+    );
+    if (!user) {
       return res.status(400).json({ success: false, message: "Hostel already in wishlist" });
     }
 
-    user.wishlist.push(hostelId);
-    await user.save();
-
     // Increment shortlists
-    hostel.shortlists = (hostel.shortlists || 0) + 1;
-    await hostel.save();
+    const { matchedCount } = await Hostel.updateOne({ _id: hostelId }, { $inc: { shortlists: 1 } });
+    if (matchedCount === 0) {
+      await User.updateOne({ _id: userId }, { $pull: { wishlist: hostelId } });
+      return res.status(404).json({ success: false, message: "Hostel not found" });
+    }
 
     res.status(200).json({ success: true, message: "Hostel added to wishlist", wishlist: user.wishlist });
   } catch (error) {
@@ -39,20 +44,21 @@ export const removeFromWishlist = async (req, res) => {
     const userId = req.user.userId;
     const { hostelId } = req.params;
 
-    const user = await User.findById(userId);
-    if (!user.wishlist.includes(hostelId)) {
-      return res.status(400).json({ success: false, message: "Hostel not in wishlist" });
+    if (!mongoose.isValidObjectId(hostelId)) {
+      return res.status(400).json({ success: false, message: "Invalid hostel ID" });
     }
 
-    user.wishlist = user.wishlist.filter(id => id.toString() !== hostelId);
-    await user.save();
+    const user = await User.findOneAndUpdate(
+      { _id: userId, wishlist: hostelId },
+      { $pull: { wishlist: hostelId } },
+      { new: true, projection: { wishlist: 1 } }
+    );
+    if (!user) {
+      return res.status(400).json({ success: false, message: "Hostel not in wishlist" });
+    }
 
     // Decrement shortlists
-    const hostel = await Hostel.findById(hostelId);
-    if (hostel && hostel.shortlists > 0) {
-      hostel.shortlists -= 1;
-      await hostel.save();
-    }
+    await Hostel.updateOne({ _id: hostelId, shortlists: { $gt: 0 } }, { $inc: { shortlists: -1 } });
 
     res.status(200).json({ success: true, message: "Hostel removed from wishlist", wishlist: user.wishlist });
   } catch (error) {
@@ -61,20 +67,106 @@ export const removeFromWishlist = async (req, res) => {
   }
 };
 
-// Get all hostels in user's wishlist
+// Add and remove several hostels at once: { add: [ids], remove: [ids] }
+export const syncWishlist = async (req, res) => {
+  try {
+    const userId = req.user.userId;
+    const { add = [], remove = [] } = req.body;
+
+    if (!Array.isArray(add) || !Array.isArray(remove)) {
+      return res.status(400).json({ success: false, message: "add and remove must be arrays" });
+    }
+    if (![...add, ...remove].every((id) => mongoose.isValidObjectId(id))) {
+      return res.status(400).json({ success: false, message: "Invalid hostel ID" });
+    }
+
+    const removeIds = [...new Set(remove.map(String))].map((id) => new mongoose.Types.ObjectId(id));
+    const removeSet = new Set(removeIds.map(String));
+    const existing = await Hostel.find({
+      _id: { $in: [...new Set(add.map(String))].filter((id) => !removeSet.has(id)) },
+    }).distinct("_id");
+
+    // One atomic update of the wishlist; the document from before it tells us
+    // exactly which ids this request added or removed
+    const before = await User.findOneAndUpdate(
+      { _id: userId },
+      [
+        {
+          $set: {
+            wishlist: {
+              $concatArrays: [
+                {
+                  $filter: {
+                    input: { $ifNull: ["$wishlist", []] },
+                    cond: { $not: { $in: ["$$this", removeIds] } },
+                  },
+                },
+                {
+                  $filter: {
+                    input: existing,
+                    cond: { $not: { $in: ["$$this", { $ifNull: ["$wishlist", []] }] } },
+                  },
+                },
+              ],
+            },
+          },
+        },
+      ],
+      { new: false, projection: { wishlist: 1 }, updatePipeline: true }
+    );
+    if (!before) {
+      return res.status(404).json({ success: false, message: "User not found" });
+    }
+
+    const saved = new Set(before.wishlist.map(String));
+    const added = existing.filter((id) => !saved.has(String(id)));
+    const removed = removeIds.filter((id) => saved.has(String(id)));
+
+    const counters = [];
+    if (added.length) {
+      counters.push({ updateMany: { filter: { _id: { $in: added } }, update: { $inc: { shortlists: 1 } } } });
+    }
+    if (removed.length) {
+      counters.push({
+        updateMany: {
+          filter: { _id: { $in: removed }, shortlists: { $gt: 0 } },
+          update: { $inc: { shortlists: -1 } },
+        },
+      });
+    }
+    if (counters.length) await Hostel.bulkWrite(counters, { ordered: false });
+
+    const removedSet = new Set(removed.map(String));
+    res.status(200).json({
+      success: true,
+      message: "Wishlist updated",
+      added,
+      removed,
+      wishlist: [...before.wishlist.filter((id) => !removedSet.has(String(id))), ...added],
+    });
+  } catch (error) {
+    console.error("Sync wishlist error:", error);
+    res.status(500).json({ success: false, message: "Server error" });
+  }
+};
+
+// Get all hostels in user's wishlist, as listing summaries
 export const getWishlist = async (req, res) => {
   try {
     const userId = req.user.userId;
 
-    const user = await User.findById(userId).populate("wishlist");
-    res.status(200).json({ success: true, wishlist: user.wishlist });
+    const user = await User.findById(userId)
+      .select("wishlist")
+      .populate({ path: "wishlist", select: LIST_FIELDS })
+      .lean();
+    const now = new Date();
+    res.status(200).json({ success: true, wishlist: user.wishlist.map((h) => toSummary(h, now)) });
   } catch (error) {
     console.error("Get wishlist error:", error);
     res.status(500).json({ success: false, message: "Server error" });
   }
 };
 
-
 // Get the number of plain users (role: 'user') — admin only
 export const getPlainUserCount = async (req, res) => {
   try {
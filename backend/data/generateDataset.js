@@ -0,0 +1,428 @@
+// Deterministic synthetic dataset for performance runs.
+//
+//   node data/generateDataset.js --tier 10k --seed 42 --out data/generated/10k
+//
+// Writes one NDJSON file per collection (users, hostels, reviews, questions,
+// visits, sales, faqs)
+// in MongoDB extended JSON, plus a manifest. The same tier, seed and date always
+// produce byte-identical files. Load them with `node seed.js --dataset <dir>`
+// or with mongoimport, e.g.
+//
+//   mongoimport --uri "$MONGO_URI" --collection hostels --file hostels.ndjson
+import fs from "fs";
+import path from "path";
+import crypto from "crypto";
+import { once } from "events";
+import bcrypt from "bcryptjs";
+
+import { users as testAccounts } from "./users.js";
+
+export const TIERS = {
+  "1k": { hostels: 1000, owners: 100, users: 2000, visits: 5000, pastSales: 500 },
+  "10k": { hostels: 10000, owners: 1000, users: 20000, visits: 50000, pastSales: 5000 },
+  "100k": { hostels: 100000, owners: 10000, users: 200000, visits: 500000, pastSales: 50000 },
+};
+
+export const COLLECTIONS = ["users", "hostels", "reviews", "questions", "visits", "sales", "faqs"];
+
+const UNIVERSITIES = [
+  "NUST",
+  "FAST",
+  "COMSATS",
+  "NUML",
+  "Air University",
+  "Bahria University",
+  "Quaid-e-Azam University (QAU)",
+  "Riphah International University",
+  "SZABIST",
+  "Institute of Space Technology (IST)",
+  "PIEAS",
+  "Al-Nafees Medical College",
+  "Fazaia Medical College",
+  "Shifa College of Medicine",
+  "HBS Medical College",
+  "Islamabad Medical & Dental College (IMDC)",
+];
+
+const AMENITIES = [
+  "Wi-Fi", "Laundry", "Mess", "Parking", "Security",
+  "AC Rooms", "CCTV", "Housekeeping", "Study Area",
+  "Common Room", "Kitchenette",
+];
+
+const AREAS = [
+  "G-6", "G-7", "G-8", "G-9", "G-10", "G-11", "G-13", "G-14",
+  "F-6", "F-7", "F-8", "F-10", "F-11", "E-7", "E-11",
+  "H-8", "H-9", "H-11", "I-8", "I-9", "I-10", "Blue Area",
+  "Bahria Town", "DHA Phase 2", "PWD", "Saddar",
+];
+
+const NAME_STYLES = ["Residency", "Hostel", "Inn", "Lodge", "House", "Dormitory", "Suites", "Residence"];
+const NAME_PREFIXES = ["Green", "Royal", "Comfort", "City", "Capital", "Margalla", "Crescent", "Executive", "Scholars", "Elite"];
+const FIRST_NAMES = ["Ali", "Ahmed", "Hassan", "Usman", "Bilal", "Hamza", "Zain", "Fatima", "Ayesha", "Sana", "Hira", "Maryam", "Zara", "Omar", "Sara", "Danish"];
+const LAST_NAMES = ["Khan", "Raza", "Malik", "Ahmed", "Butt", "Qureshi", "Sheikh", "Chaudhry", "Abbasi", "Mirza", "Siddiqui", "Javed"];
+
+const REVIEW_TEXTS = [
+  "Great place to live! Very clean and cooperative management.",
+  "Good facilities, but the mess food could be better.",
+  "Quiet and safe, ideal for studying.",
+  "Wi-Fi is slow in the evenings.",
+  "Rooms are spacious and well maintained.",
+  "Management responds quickly to complaints.",
+  "A bit far from the main road but good value for the rent.",
+  "Would not recommend, frequent power outages.",
+];
+
+const QUESTIONS = [
+  ["Is there a generator for backup power?", "Yes, 24/7 backup available."],
+  ["Are meals included in the rent?", "Breakfast and dinner are included."],
+  ["Is there a curfew?", "Gates close at 11 PM."],
+  ["Are single rooms available?", "Only shared rooms at the moment."],
+  ["Is parking available for bikes?", "Yes, covered parking is available."],
+];
+
+const HOSTEL_FAQS = [
+  ["Are visitors allowed?", "Yes, with security permission."],
+  ["Is Wi-Fi unlimited?", "Yes, unlimited high-speed Wi-Fi included."],
+  ["Is housekeeping included?", "Yes, daily housekeeping is included."],
+  ["What is the security deposit?", "One month's rent, refundable."],
+  ["Is laundry free?", "Two loads per week are free."],
+];
+
+const SITE_FAQS = [
+  ["How do I book a visit?", "Open a hostel's page and use the Book Visit button."],
+  ["How are hostels approved?", "An admin reviews every new listing before it goes live."],
+  ["What does boosting a hostel do?", "Boosted hostels are listed first for the boost duration."],
+  ["Can I edit my review?", "Delete it from your dashboard and post a new one."],
+];
+
+const BOOST_PACKAGES = [7, 15, 30];
+const PASSWORD = "abcd123";
+const DAY = 24 * 60 * 60 * 1000;
+
+// Same pricing as calculateBoostPrice in hostelController
+const boostPrice = (days) => (days <= 7 ? 500 : days <= 15 ? 900 : 1500);
+
+// mulberry32: small, fast and good enough for synthetic data
+const createRandom = (seed) => {
+  let state = seed >>> 0;
+  const next = () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+  const int = (min, max) => min + Math.floor(next() * (max - min + 1));
+  const pick = (list) => list[Math.floor(next() * list.length)];
+  const chance = (p) => next() < p;
+  const sample = (list, count) => {
+    const copy = [...list];
+    for (let i = copy.length - 1; i > 0; i--) {
+      const j = Math.floor(next() * (i + 1));
+      [copy[i], copy[j]] = [copy[j], copy[i]];
+    }
+    return copy.slice(0, count);
+  };
+  // Long-tailed counts: most hostels get a few reviews, popular ones get many
+  const skewed = (max) => Math.floor(max * next() ** 3);
+  return { next, int, pick, chance, sample, skewed };
+};
+
+// ObjectIds built from the seed, a per-collection tag and the document's index,
+// so references can be computed without keeping earlier documents in memory.
+// The timestamp part is the reference date, as if everything was created then.
+const createIds = (seed, referenceDate) => {
+  const timestamp = Math.floor(referenceDate.getTime() / 1000).toString(16).padStart(8, "0");
+  const seedPart = crypto.createHash("sha1").update(String(seed)).digest("hex").slice(0, 6);
+  const TAGS = { user: "01", hostel: "02", visit: "03", sale: "04", faq: "05", review: "06", question: "07", hostelFaq: "08" };
+  return (kind, index) => ({
+    $oid: timestamp + seedPart + TAGS[kind] + (index >>> 0).toString(16).padStart(8, "0"),
+  });
+};
+
+const $date = (date) => ({ $date: date.toISOString() });
+
+const writeLine = async (stream, doc) => {
+  if (!stream.write(JSON.stringify(doc) + "\n")) {
+    await once(stream, "drain");
+  }
+};
+
+const closeStream = (stream) => new Promise((resolve, reject) => {
+  stream.on("error", reject);
+  stream.end(resolve);
+});
+
+export const generateDataset = async ({ tier = "1k", seed = 42, out, date = "2025-12-01" }) => {
+  const size = TIERS[tier];
+  if (!size) {
+    throw new Error(`Unknown tier "${tier}", expected one of ${Object.keys(TIERS).join(", ")}`);
+  }
+  if (!Number.isInteger(seed)) {
+    throw new Error(`Invalid seed "${seed}", expected an integer`);
+  }
+  const referenceDate = new Date(date);
+  if (Number.isNaN(referenceDate.getTime())) {
+    throw new Error(`Invalid --date "${date}"`);
+  }
+
+  const random = createRandom(seed);
+  const id = createIds(seed, referenceDate);
+  const daysAgo = (max) => new Date(referenceDate.getTime() - random.int(0, max * 24 * 60) * 60 * 1000);
+
+  // One hash for every account; a fixed salt keeps the output reproducible
+  const salt = "$2b$10$" + crypto.createHash("sha256").update(`salt:${seed}`).digest("base64")
+    .replace(/[^A-Za-z0-9]/g, ".").slice(0, 22);
+  const passwordHash = bcrypt.hashSync(PASSWORD, salt);
+
+  fs.mkdirSync(out, { recursive: true });
+  const streams = Object.fromEntries(
+    COLLECTIONS.map((name) => [name, fs.createWriteStream(path.join(out, `${name}.ndjson`))])
+  );
+  const counts = Object.fromEntries(COLLECTIONS.map((name) => [name, 0]));
+  const write = async (name, doc) => {
+    await writeLine(streams[name], doc);
+    counts[name]++;
+  };
+
+  // Users: the regular test accounts first (same emails and password), then
+  // owners, then students and professionals. Owners come right after them.
+  const adminIndex = testAccounts.findIndex((u) => u.role === "admin");
+  const testOwners = testAccounts.map((u, i) => (u.role === "owner" ? i : -1)).filter((i) => i >= 0);
+  const ownerStart = testAccounts.length;
+  const userStart = ownerStart + size.owners;
+  const totalUsers = userStart + size.users;
+  const ownerIndexes = [...testOwners, ...Array.from({ length: size.owners }, (_, i) => ownerStart + i)];
+  const regularIndexes = (i) => (i < ownerStart ? testAccounts[i].role === "user" : i >= userStart);
+
+  for (let i = 0; i < totalUsers; i++) {
+    const createdAt = daysAgo(730);
+    let name, email, role;
+    if (i < ownerStart) {
+      ({ name, email, role } = testAccounts[i]);
+    } else {
+      role = i < userStart ? "owner" : "user";
+      name = `${random.pick(FIRST_NAMES)} ${random.pick(LAST_NAMES)}`;
+      email = `${role}${i - (role === "owner" ? ownerStart : userStart) + 1}@example.com`;
+    }
+    const wishlist = regularIndexes(i)
+      ? Array.from({ length: random.skewed(8) }, () => random.int(0, size.hostels - 1))
+      : [];
+    await write("users", {
+      _id: id("user", i),
+      name,
+      email,
+      password: passwordHash,
+      role,
+      wishlist: [...new Set(wishlist)].map((h) => id("hostel", h)),
+      createdAt: $date(createdAt),
+      updatedAt: $date(createdAt),
+    });
+  }
+
+  const randomRegularUser = () => random.chance(0.02)
+    ? random.pick(testAccounts.map((u, i) => (u.role === "user" ? i : -1)).filter((i) => i >= 0))
+    : random.int(userStart, totalUsers - 1);
+
+  // Hostels. Owner and status are kept per index for visits and sales.
+  const hostelOwner = new Int32Array(size.hostels);
+  const hostelApproved = new Uint8Array(size.hostels);
+  let reviewIndex = 0;
+  let questionIndex = 0;
+  let faqIndex = 0;
+  const activeBoosts = [];
+
+  for (let i = 0; i < size.hostels; i++) {
+    const owner = random.pick(ownerIndexes);
+    const area = random.pick(AREAS);
+    const gender = random.chance(0.6) ? "Male" : "Female";
+    const status = random.chance(0.85) ? "approved" : random.chance(0.6) ? "pending" : "rejected";
+    const createdAt = daysAgo(720);
+    hostelOwner[i] = owner;
+    hostelApproved[i] = status === "approved" ? 1 : 0;
+
+    const reviewers = new Set();
+    const reviewCount = status === "approved" ? random.skewed(60) : 0;
+    while (reviewers.size < reviewCount) reviewers.add(randomRegularUser());
+    const reviews = [...reviewers].map((userId) => {
+      const reviewedAt = $date(daysAgo(365));
+      return {
+        _id: id("review", reviewIndex++),
+        hostelId: id("hostel", i),
+        userId: id("user", userId),
+        rating: random.pick([1, 2, 3, 3, 4, 4, 4, 5, 5, 5]),
+        text: random.pick(REVIEW_TEXTS),
+        createdAt: reviewedAt,
+        updatedAt: reviewedAt,
+      };
+    });
+
+    const questions = Array.from({ length: status === "approved" ? random.skewed(8) : 0 }, () => {
+      const [text, answer] = random.pick(QUESTIONS);
+      const asked = daysAgo(365);
+      const answered = random.chance(0.6);
+      const answeredAt = answered ? $date(new Date(asked.getTime() + random.int(1, 72) * 60 * 60 * 1000)) : null;
+      return {
+        _id: id("question", questionIndex++),
+        hostelId: id("hostel", i),
+        ownerId: id("user", owner),
+        userId: id("user", randomRegularUser()),
+        text,
+        answer: answered ? answer : null,
+        answered,
+        answeredAt,
+        createdAt: $date(asked),
+        updatedAt: answeredAt ?? $date(asked),
+      };
+    });
+
+    const faqs = random.sample(HOSTEL_FAQS, random.int(0, 3)).map(([question, answer]) => ({
+      _id: id("hostelFaq", faqIndex++),
+      question,
+      answer,
+      createdAt: $date(createdAt),
+      updatedAt: $date(createdAt),
+    }));
+
+    // ~5% boosted at the reference date, ~2% waiting for approval
+    let boost = { isActive: false, status: "pending" };
+    if (status === "approved" && random.chance(0.07)) {
+      const durationDays = random.pick(BOOST_PACKAGES);
+      if (random.chance(0.7)) {
+        const startDate = new Date(referenceDate.getTime() - random.int(0, durationDays - 1) * DAY);
+        boost = {
+          isActive: true,
+          status: "approved",
+          startDate: $date(startDate),
+          endDate: $date(new Date(startDate.getTime() + durationDays * DAY)),
+          durationDays,
+        };
+        activeBoosts.push({ hostel: i, owner, durationDays, purchasedAt: startDate });
+      } else {
+        boost = { isActive: true, status: "pending", durationDays };
+      }
+    }
+
+    const ratingHistogram = { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 };
+    reviews.forEach((r) => ratingHistogram[r.rating]++);
+    const ratingSum = reviews.reduce((sum, r) => sum + r.rating, 0);
+
+    await write("hostels", {
+      _id: id("hostel", i),
+      name: `${random.pick(NAME_PREFIXES)} ${area} ${gender === "Male" ? "Boys" : "Girls"} ${random.pick(NAME_STYLES)}`,
+      area,
+      rent: random.int(16, 90) * 500,
+      gender,
+      profession: random.pick(["Student", "Professional", "Both"]),
+      description: `A ${random.pick(["modern", "clean", "quiet", "affordable", "spacious"])} hostel in ${area}, close to public transport and markets.`,
+      image: "https://placehold.co/600x400/4f46e5/ffffff?text=Hostel+Image",
+      amenities: random.sample(AMENITIES, random.int(2, AMENITIES.length)),
+      nearbyUniversities: random.sample(UNIVERSITIES, random.int(1, 4)),
+      views: random.skewed(5000),
+      shortlists: random.skewed(300),
+      ownerId: id("user", owner),
+      status,
+      faqs,
+      avgRating: reviews.length ? ratingSum / reviews.length : 0,
+      reviewCount: reviews.length,
+      ratingSum,
+      ratingHistogram,
+      boostRank: boost.status === "approved" ? 1 : 0,
+      contact: `03${random.int(0, 4)}${random.int(0, 9)}-${String(random.int(0, 9999999)).padStart(7, "0")}`,
+      boost,
+      createdAt: $date(createdAt),
+      updatedAt: $date(createdAt),
+    });
+    for (const review of reviews) await write("reviews", review);
+    for (const question of questions) await write("questions", question);
+  }
+
+  const approvedHostel = () => {
+    let h = random.int(0, size.hostels - 1);
+    while (!hostelApproved[h]) h = (h + 1) % size.hostels;
+    return h;
+  };
+
+  for (let i = 0; i < size.visits; i++) {
+    const hostel = approvedHostel();
+    const createdAt = daysAgo(180);
+    const status = random.pick(["pending", "approved", "approved", "cancelled", "completed", "completed"]);
+    await write("visits", {
+      _id: id("visit", i),
+      user: id("user", randomRegularUser()),
+      owner: id("user", hostelOwner[hostel]),
+      hostel: id("hostel", hostel),
+      date: $date(new Date(createdAt.getTime() + random.int(1, 14) * DAY)),
+      status,
+      completed: status === "completed",
+      createdAt: $date(createdAt),
+      updatedAt: $date(createdAt),
+    });
+  }
+
+  // One sale per active boost, plus earlier boosts that have since expired
+  const pastSales = Array.from({ length: size.pastSales }, () => {
+    const hostel = approvedHostel();
+    return { hostel, owner: hostelOwner[hostel], durationDays: random.pick(BOOST_PACKAGES), purchasedAt: daysAgo(365) };
+  });
+  let saleIndex = 0;
+  for (const sale of [...pastSales, ...activeBoosts]) {
+    await write("sales", {
+      _id: id("sale", saleIndex++),
+      hostelId: id("hostel", sale.hostel),
+      ownerId: id("user", sale.owner),
+      durationDays: sale.durationDays,
+      amount: boostPrice(sale.durationDays),
+      purchasedAt: $date(sale.purchasedAt),
+      createdAt: $date(sale.purchasedAt),
+      updatedAt: $date(sale.purchasedAt),
+    });
+  }
+
+  for (const [i, [question, answer]] of SITE_FAQS.entries()) {
+    await write("faqs", {
+      _id: id("faq", i),
+      question,
+      answer,
+      createdBy: id("user", adminIndex),
+      createdAt: $date(referenceDate),
+      updatedAt: $date(referenceDate),
+    });
+  }
+
+  await Promise.all(Object.values(streams).map(closeStream));
+
+  const manifest = { tier, seed, date: referenceDate.toISOString(), password: PASSWORD, counts };
+  fs.writeFileSync(path.join(out, "manifest.json"), JSON.stringify(manifest, null, 2) + "\n");
+  return manifest;
+};
+
+const parseArgs = (argv) => {
+  const options = {};
+  for (let i = 0; i < argv.length; i += 2) {
+    const key = argv[i].replace(/^--/, "");
+    if (!["tier", "seed", "out", "date"].includes(key) || argv[i + 1] === undefined) {
+      throw new Error(`Usage: node data/generateDataset.js [--tier ${Object.keys(TIERS).join("|")}] [--seed N] [--date YYYY-MM-DD] [--out DIR]`);
+    }
+    options[key] = key === "seed" ? Number(argv[i + 1]) : argv[i + 1];
+  }
+  options.tier ??= "1k";
+  options.out ??= path.join("data", "generated", options.tier);
+  return options;
+};
+
+if (process.argv[1] && path.resolve(process.argv[1]) === path.resolve(new URL(import.meta.url).pathname)) {
+  try {
+    const options = parseArgs(process.argv.slice(2));
+    const started = Date.now();
+    const manifest = await generateDataset(options);
+    console.log(`📦 ${options.tier} dataset (seed ${manifest.seed}) written to ${options.out} in ${((Date.now() - started) / 1000).toFixed(1)}s`);
+    for (const [name, count] of Object.entries(manifest.counts)) {
+      console.log(`   ${name}: ${count}`);
+    }
+  } catch (err) {
+    console.error("❌ Dataset generation error:", err.message);
+    process.exit(1);
+  }
+}
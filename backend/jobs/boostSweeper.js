@@ -0,0 +1,78 @@
+import Hostel from "../models/Hostel.js";
+import { invalidateCache, HOSTEL_LIST_TAG, HOSTEL_DETAILS_TAG } from "../middleware/cache.js";
+
+const DEFAULT_INTERVAL_MS = 60 * 1000;
+
+const stats = {
+  sweeps: 0,
+  expired: 0,
+  lastRunAt: null,
+  lastExpired: 0,
+  lastDurationMs: 0,
+  lastError: null,
+};
+
+let timer = null;
+let running = false;
+
+// Expire every boost whose endDate has passed, in a single write
+// (served by the partial index on boost.endDate)
+export const sweepExpiredBoosts = async (now = new Date()) => {
+  const started = process.hrtime.bigint();
+
+  const result = await Hostel.updateMany(
+    { "boost.isActive": true, "boost.endDate": { $lt: now } },
+    {
+      $set: {
+        boostRank: 0,
+        "boost.isActive": false,
+        "boost.status": "none",
+        "boost.durationDays": null,
+        "boost.startDate": null,
+        "boost.endDate": null,
+      },
+    }
+  );
+
+  const durationMs = Number(process.hrtime.bigint() - started) / 1e6;
+  return { expired: result.modifiedCount, durationMs };
+};
+
+const runSweep = async () => {
+  // A slow sweep should not overlap the next one
+  if (running) return;
+  running = true;
+  try {
+    const { expired, durationMs } = await sweepExpiredBoosts();
+    stats.sweeps += 1;
+    stats.expired += expired;
+    stats.lastRunAt = new Date();
+    stats.lastExpired = expired;
+    stats.lastDurationMs = Math.round(durationMs * 10) / 10;
+    stats.lastError = null;
+    if (expired > 0) {
+      invalidateCache(HOSTEL_LIST_TAG, HOSTEL_DETAILS_TAG);
+      console.log(`⏰ Boost sweep expired ${expired} boost(s) in ${stats.lastDurationMs}ms`);
+    }
+  } catch (error) {
+    stats.lastError = error.message;
+    console.error("Boost sweep error:", error);
+  } finally {
+    running = false;
+  }
+};
+
+export const startBoostSweeper = (intervalMs = Number(process.env.BOOST_SWEEP_INTERVAL_MS) || DEFAULT_INTERVAL_MS) => {
+  if (timer) return;
+  runSweep();
+  timer = setInterval(runSweep, intervalMs);
+  // Never keep the process alive just for the sweeper
+  timer.unref();
+};
+
+export const stopBoostSweeper = () => {
+  clearInterval(timer);
+  timer = null;
+};
+
+export const boostSweeperStats = () => ({ ...stats });
@@ -0,0 +1,107 @@
+import Hostel from "../models/Hostel.js";
+
+const DEFAULT_FLUSH_INTERVAL_MS = 250;
+const DEFAULT_MAX_PENDING = 1000;
+
+// Each detail page view counts half a view (the page reports a view on load)
+const VIEW_WEIGHT = 0.5;
+
+const flushIntervalMs = Number(process.env.VIEW_FLUSH_INTERVAL_MS) || DEFAULT_FLUSH_INTERVAL_MS;
+const maxPending = Number(process.env.VIEW_FLUSH_MAX_EVENTS) || DEFAULT_MAX_PENDING;
+
+const stats = {
+  recorded: 0,
+  flushes: 0,
+  written: 0,
+  lastFlushAt: null,
+  lastFlushHostels: 0,
+  lastDurationMs: 0,
+  lastError: null,
+};
+
+let pending = new Map(); // hostel id -> views not yet written
+let pendingEvents = 0;
+let timer = null;
+let flushing = null;
+
+// Hostel ids of the batch whose $inc did not land. An unordered bulkWrite
+// that fails part-way has still applied the other updates (as has one that
+// only missed its write concern), so only the ops listed in writeErrors are
+// retried. Any other error (e.g. the connection dropped) retries the batch.
+const failedIds = (error, ids) => {
+  if (error?.name !== "MongoBulkWriteError" && !error?.writeErrors) return ids;
+  return [].concat(error.writeErrors || []).map((writeError) => ids[writeError.index]);
+};
+
+// Write every buffered count in one bulkWrite. Counts whose update failed go
+// back into the buffer so the next flush retries them.
+export const flushViews = async () => {
+  while (flushing) await flushing;
+  if (pending.size === 0) return;
+
+  const batch = pending;
+  pending = new Map();
+  pendingEvents = 0;
+
+  const ids = [...batch.keys()];
+  const started = process.hrtime.bigint();
+  flushing = Hostel.bulkWrite(
+    ids.map((id) => ({
+      updateOne: { filter: { _id: id }, update: { $inc: { views: batch.get(id) * VIEW_WEIGHT } } },
+    })),
+    { ordered: false }
+  )
+    .then(() => {
+      stats.flushes += 1;
+      stats.written += batch.size;
+      stats.lastFlushAt = new Date();
+      stats.lastFlushHostels = batch.size;
+      stats.lastDurationMs = Math.round((Number(process.hrtime.bigint() - started) / 1e6) * 10) / 10;
+      stats.lastError = null;
+    })
+    .catch((error) => {
+      stats.lastError = error.message;
+      console.error("View flush error:", error);
+      for (const id of failedIds(error, ids)) {
+        const count = batch.get(id);
+        pending.set(id, (pending.get(id) || 0) + count);
+        pendingEvents += count;
+      }
+    })
+    .finally(() => {
+      flushing = null;
+    });
+
+  await flushing;
+};
+
+// Buffer one view; a full buffer is flushed straight away instead of waiting
+// for the timer
+export const recordView = (id) => {
+  pending.set(id, (pending.get(id) || 0) + 1);
+  pendingEvents += 1;
+  stats.recorded += 1;
+  if (pendingEvents >= maxPending) flushViews();
+};
+
+export const startViewCounter = (intervalMs = flushIntervalMs) => {
+  if (timer) return;
+  timer = setInterval(flushViews, intervalMs);
+  // Never keep the process alive just for the counter
+  timer.unref();
+};
+
+// Stop the timer and write whatever is still buffered
+export const stopViewCounter = async () => {
+  clearInterval(timer);
+  timer = null;
+  await flushViews();
+};
+
+export const viewCounterStats = () => ({
+  ...stats,
+  pendingHostels: pending.size,
+  pendingEvents,
+  flushIntervalMs,
+  maxPending,
+});
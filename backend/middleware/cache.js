@@ -0,0 +1,149 @@
+import crypto from "crypto";
+import { onPrimaryMessage, sendToPrimary } from "../utils/cluster.js";
+
+// In-process LRU cache for public GET responses. Entries expire after a TTL,
+// the cache is bounded by entry count and total body size, and every entry
+// carries tags so write controllers can drop exactly what they changed.
+class ResponseCache {
+  constructor({ ttlMs, maxEntries, maxBytes }) {
+    this.ttlMs = ttlMs;
+    this.maxEntries = maxEntries;
+    this.maxBytes = maxBytes;
+    this.entries = new Map(); // key -> entry, least recently used first
+    this.bytes = 0;
+    this.generation = 0; // bumped on every invalidation
+    this.counters = { hits: 0, misses: 0, notModified: 0, evictions: 0, expired: 0, invalidations: 0 };
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return null;
+    if (entry.expiresAt <= Date.now()) {
+      this.delete(key);
+      this.counters.expired++;
+      return null;
+    }
+    // Move to the most recently used end
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry;
+  }
+
+  set(key, body, tags) {
+    const size = Buffer.byteLength(body) + key.length;
+    if (size > this.maxBytes) return null;
+
+    this.delete(key);
+    const entry = {
+      body,
+      etag: `"${crypto.createHash("sha1").update(body).digest("base64url")}"`,
+      tags,
+      size,
+      expiresAt: Date.now() + this.ttlMs,
+    };
+    this.entries.set(key, entry);
+    this.bytes += size;
+
+    while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+      this.delete(this.entries.keys().next().value);
+      this.counters.evictions++;
+    }
+    return entry;
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return;
+    this.entries.delete(key);
+    this.bytes -= entry.size;
+  }
+
+  invalidate(tags) {
+    this.generation++;
+    for (const [key, entry] of this.entries) {
+      if (entry.tags.some((tag) => tags.includes(tag))) {
+        this.delete(key);
+        this.counters.invalidations++;
+      }
+    }
+  }
+
+  stats() {
+    const lookups = this.counters.hits + this.counters.misses;
+    return {
+      ...this.counters,
+      hitRate: lookups ? Math.round((this.counters.hits / lookups) * 1000) / 1000 : 0,
+      entries: this.entries.size,
+      bytes: this.bytes,
+      maxEntries: this.maxEntries,
+      maxBytes: this.maxBytes,
+      ttlMs: this.ttlMs,
+    };
+  }
+}
+
+const cache = new ResponseCache({
+  ttlMs: Number(process.env.CACHE_TTL_MS) || 60 * 1000,
+  maxEntries: Number(process.env.CACHE_MAX_ENTRIES) || 1000,
+  maxBytes: Number(process.env.CACHE_MAX_BYTES) || 32 * 1024 * 1024,
+});
+
+// Tags used by the cached routes and the controllers that invalidate them.
+// View and shortlist counters do not invalidate; they catch up within the TTL.
+export const HOSTEL_LIST_TAG = "hostels";
+export const HOSTEL_DETAILS_TAG = "hostel-details";
+export const FAQ_TAG = "faqs";
+export const ADMIN_SUMMARY_TAG = "admin-summary";
+export const hostelTag = (id) => `hostel:${id}`;
+
+const send = (req, res, entry) => {
+  res.set("ETag", entry.etag);
+  res.set("Cache-Control", "no-cache");
+  res.type("application/json");
+  // Express answers 304 itself when If-None-Match matches the ETag
+  if (req.fresh) cache.counters.notModified++;
+  return res.send(entry.body);
+};
+
+// Middleware for GET routes whose response is the same for everyone allowed
+// to call them (public reads, or admin reads behind authorize("admin")).
+// `tags(req)` names the data the response depends on.
+export const cacheResponse = (tags) => (req, res, next) => {
+  if (req.method !== "GET") return next();
+
+  const key = req.originalUrl;
+  const hit = cache.get(key);
+  if (hit) {
+    cache.counters.hits++;
+    return send(req, res, hit);
+  }
+  cache.counters.misses++;
+
+  // A write that lands while this request is reading must not leave its
+  // older result in the cache
+  const generation = cache.generation;
+  const json = res.json.bind(res);
+  res.json = (data) => {
+    if (res.statusCode !== 200 || cache.generation !== generation) return json(data);
+
+    const entry = cache.set(key, JSON.stringify(data), tags(req));
+    if (!entry) return json(data);
+    return send(req, res, entry);
+  };
+  next();
+};
+
+// In cluster mode every worker has its own cache. Invalidations apply here
+// at once and reach the other workers through the primary a moment later.
+const invalidateEverywhere = (tags) => {
+  cache.invalidate(tags);
+  sendToPrimary("cache:invalidate", tags);
+};
+onPrimaryMessage("cache:invalidate", (tags) => cache.invalidate(tags));
+
+export const invalidateCache = (...tags) => invalidateEverywhere(tags);
+
+export const invalidateHostel = (id) =>
+  invalidateEverywhere([HOSTEL_LIST_TAG, hostelTag(id)]);
+
+export const cacheStats = () => cache.stats();
@@ -0,0 +1,47 @@
+import { performance } from "perf_hooks";
+
+// Request load of this process, for the health endpoints. Rates are taken
+// over windows of at least SAMPLE_MS, refreshed whenever they are read.
+const SAMPLE_MS = 1000;
+
+let inFlight = 0;
+let requests = 0;
+
+let sample = { at: Date.now(), elu: performance.eventLoopUtilization(), requests: 0 };
+let rates = { requestsPerSecond: 0, eventLoopUtilization: 0 };
+
+const round = (value, places) => Math.round(value * 10 ** places) / 10 ** places;
+
+const resample = () => {
+  const now = Date.now();
+  if (now - sample.at < SAMPLE_MS) return;
+  const elu = performance.eventLoopUtilization();
+  rates = {
+    requestsPerSecond: round(((requests - sample.requests) * 1000) / (now - sample.at), 1),
+    // Share of the window the event loop spent running code rather than idle
+    eventLoopUtilization: round(performance.eventLoopUtilization(elu, sample.elu).utilization, 3),
+  };
+  sample = { at: now, elu, requests };
+};
+
+export const trackLoad = (req, res, next) => {
+  inFlight++;
+  requests++;
+  // "close" fires for finished and aborted responses alike
+  res.once("close", () => inFlight--);
+  next();
+};
+
+export const loadStats = () => {
+  resample();
+  const memory = process.memoryUsage();
+  return {
+    pid: process.pid,
+    uptimeS: Math.round(process.uptime()),
+    inFlight,
+    requests,
+    ...rates,
+    rssMb: round(memory.rss / 1024 / 1024, 1),
+    heapUsedMb: round(memory.heapUsed / 1024 / 1024, 1),
+  };
+};
@@ -0,0 +1,26 @@
+// One-off backfill of boostRank for hostels boosted before the field existed.
+// Safe to run again.
+//   node migrations/backfillBoostRank.js
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import Hostel from "../models/Hostel.js";
+
+dotenv.config();
+await connectDB();
+
+try {
+  const now = new Date();
+  const boosted = await Hostel.updateMany(
+    { "boost.status": "approved", "boost.endDate": { $gt: now } },
+    { $set: { boostRank: 1 } }
+  );
+  const others = await Hostel.updateMany(
+    { $nor: [{ "boost.status": "approved", "boost.endDate": { $gt: now } }] },
+    { $set: { boostRank: 0 } }
+  );
+  console.log(`🚀 boostRank set on ${boosted.modifiedCount + others.modifiedCount} hostels`);
+  process.exit(0);
+} catch (err) {
+  console.error("❌ Backfill error:", err);
+  process.exit(1);
+}
@@ -0,0 +1,30 @@
+// One-off backfill of avgRating, reviewCount, ratingSum and ratingHistogram
+// from the Review collection. Refuses to run while any hostel still has
+// embedded reviews: run migrations/migrateReviews.js first, or those hostels
+// would be reset to no reviews. Safe to run again.
+//   node migrations/backfillRatings.js
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import Hostel from "../models/Hostel.js";
+import { rebuildRatings } from "../models/Review.js";
+
+dotenv.config();
+await connectDB();
+
+try {
+  const unmigrated = await Hostel.countDocuments({ reviews: { $exists: true } });
+  if (unmigrated) {
+    console.error(
+      `❌ ${unmigrated} hostel(s) still have embedded reviews; run npm run migrate:reviews first`
+    );
+    process.exit(1);
+  }
+
+  await rebuildRatings();
+  await Hostel.createIndexes();
+  console.log(`⭐ Rating aggregates backfilled for ${await Hostel.countDocuments()} hostels`);
+  process.exit(0);
+} catch (err) {
+  console.error("❌ Backfill error:", err);
+  process.exit(1);
+}
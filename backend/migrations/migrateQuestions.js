@@ -0,0 +1,86 @@
+// Moves questions embedded in hostels into the Question collection, keeping
+// their _id and copying the hostel's ownerId onto each. Works one hostel at a
+// time, so it can run while the server is up: questionController answers in
+// the embedded array for hostels not reached yet. Safe to run again.
+//   node migrations/migrateQuestions.js
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import Hostel from "../models/Hostel.js";
+import Question from "../models/Question.js";
+
+dotenv.config();
+await connectDB();
+
+const toCopy = (hostel, q) => ({
+  _id: q._id,
+  hostelId: hostel._id,
+  ownerId: hostel.ownerId,
+  userId: q.userId,
+  text: q.text,
+  answer: q.answer ?? null,
+  answered: Boolean(q.answer),
+  answeredAt: q.answeredAt ?? null,
+  createdAt: q.createdAt,
+  updatedAt: q.answeredAt ?? q.createdAt,
+});
+
+try {
+  await Question.createIndexes();
+
+  let hostels = 0;
+  let moved = 0;
+  const cursor = Hostel.find({ questions: { $exists: true } })
+    .select("+questions ownerId")
+    .lean()
+    .cursor();
+
+  for await (const hostel of cursor) {
+    const copies = hostel.questions.map((q) => toCopy(hostel, q));
+    if (copies.length) {
+      // Insert-if-missing by _id: a rerun after a crash neither duplicates
+      // a question nor overwrites an answer given since the first run
+      await Question.collection.bulkWrite(
+        copies.map(({ _id, ...fields }) => ({
+          updateOne: { filter: { _id }, update: { $setOnInsert: fields }, upsert: true },
+        })),
+        { ordered: false }
+      );
+    }
+
+    // Drop the array, getting back what it held at that moment, and bring the
+    // copies in line: questions deleted since we read them go, and answers
+    // written to the array in the meantime are carried over
+    const before = await Hostel.findOneAndUpdate(
+      { _id: hostel._id },
+      { $unset: { questions: 1 } },
+      { new: false, projection: { questions: 1, ownerId: 1 } }
+    ).lean();
+    const final = new Map((before?.questions || []).map((q) => [String(q._id), q]));
+
+    const fixes = [];
+    for (const copy of copies) {
+      const latest = final.get(String(copy._id));
+      if (!latest) {
+        fixes.push({ deleteOne: { filter: { _id: copy._id } } });
+      } else if (latest.answer && latest.answer !== copy.answer) {
+        fixes.push({
+          updateOne: {
+            filter: { _id: copy._id, answered: false },
+            update: { $set: { answer: latest.answer, answered: true, answeredAt: latest.answeredAt } },
+          },
+        });
+      }
+    }
+    if (fixes.length) await Question.collection.bulkWrite(fixes, { ordered: false });
+
+    hostels += 1;
+    moved += final.size;
+    if (hostels % 1000 === 0) console.log(`   ${hostels} hostels, ${moved} questions so far`);
+  }
+
+  console.log(`❓ Moved ${moved} questions from ${hostels} hostels`);
+  process.exit(0);
+} catch (err) {
+  console.error("❌ Question migration error:", err);
+  process.exit(1);
+}
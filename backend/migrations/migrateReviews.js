@@ -0,0 +1,86 @@
+// Moves reviews embedded in hostels into the Review collection, keeping their
+// _id. Works one hostel at a time, so it can run while the server is up:
+// reviewController reads the embedded array for hostels not reached yet.
+// The rating aggregates already count these reviews and are left alone.
+// A hostel whose reviews cannot all be copied (two reviews by the same user
+// clash on the unique (hostelId, userId) index) keeps its embedded array and
+// is listed at the end. Safe to run again.
+//   node migrations/migrateReviews.js
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import Hostel from "../models/Hostel.js";
+import Review from "../models/Review.js";
+
+dotenv.config();
+await connectDB();
+
+// Insert the copies, then return the ones that are not in the collection
+// under their own _id. A duplicate _id means an earlier run copied it; any
+// other duplicate key is a clash with a different review.
+const insertCopies = async (reviews) => {
+  try {
+    await Review.collection.insertMany(reviews, { ordered: false });
+  } catch (err) {
+    if (!err.writeErrors || [].concat(err.writeErrors).some((e) => e.code !== 11000)) throw err;
+  }
+  const stored = await Review.find({ _id: { $in: reviews.map((r) => r._id) } }, { _id: 1 }).lean();
+  const ids = new Set(stored.map((r) => String(r._id)));
+  return reviews.filter((r) => !ids.has(String(r._id)));
+};
+
+try {
+  await Review.createIndexes();
+
+  let hostels = 0;
+  let moved = 0;
+  const conflicts = [];
+  const cursor = Hostel.find({ reviews: { $exists: true } }).select("+reviews").lean().cursor();
+
+  for await (const hostel of cursor) {
+    const copies = hostel.reviews.map((r) => ({
+      _id: r._id,
+      hostelId: hostel._id,
+      userId: r.userId,
+      rating: r.rating,
+      text: r.text,
+      createdAt: r.createdAt,
+      updatedAt: r.createdAt,
+    }));
+    const missing = copies.length ? await insertCopies(copies) : [];
+    if (missing.length) {
+      // Keep the array so no review is lost; the copies already made share
+      // their _id with it and are skipped when this runs again
+      conflicts.push({ hostelId: hostel._id, reviewIds: missing.map((r) => r._id) });
+      continue;
+    }
+
+    // Drop the array, getting back what it held at that moment. A review
+    // deleted from it after we read it must not survive in the collection.
+    const before = await Hostel.findOneAndUpdate(
+      { _id: hostel._id },
+      { $unset: { reviews: 1 } },
+      { new: false, projection: { reviews: 1 } }
+    ).lean();
+    const kept = new Set((before?.reviews || []).map((r) => String(r._id)));
+    const gone = copies.filter((r) => !kept.has(String(r._id))).map((r) => r._id);
+    if (gone.length) await Review.deleteMany({ _id: { $in: gone } });
+
+    hostels += 1;
+    moved += copies.length - gone.length;
+    if (hostels % 1000 === 0) console.log(`   ${hostels} hostels, ${moved} reviews so far`);
+  }
+
+  console.log(`📝 Moved ${moved} reviews from ${hostels} hostels`);
+  if (conflicts.length) {
+    console.warn(`⚠️  ${conflicts.length} hostel(s) kept their embedded reviews: another review by the same user already exists`);
+    for (const { hostelId, reviewIds } of conflicts) {
+      console.warn(`   hostel ${hostelId}: reviews ${reviewIds.join(", ")}`);
+    }
+    console.warn("   Remove the duplicates from those hostels' reviews array, run this again, then npm run migrate:ratings.");
+    process.exit(1);
+  }
+  process.exit(0);
+} catch (err) {
+  console.error("❌ Review migration error:", err);
+  process.exit(1);
+}
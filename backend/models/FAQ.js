@@ -22,4 +22,6 @@ const faqSchema = new mongoose.Schema(
   { timestamps: true }
 );
 
+faqSchema.index({ createdAt: -1 });
+
 export default mongoose.model("FAQ", faqSchema);
@@ -80,57 +80,69 @@ const hostelSchema = new mongoose.Schema(
       enum: ["pending", "approved", "rejected"],
       default: "pending",
     },
-    reviews: [
-      {
-        userId: {
-          type: mongoose.Schema.Types.ObjectId,
-          ref: "User",
-          required: true,
-        },
-        rating: {
-          type: Number,
-          required: true,
-          min: 1,
-          max: 5,
-        },
-        text: {
-          type: String,
-          required: true,
-          trim: true,
-        },
-        createdAt: {
-          type: Date,
-          default: Date.now,
-        },
-      },
-    ],
-    questions: [
-      {
-        userId: {
-          type: mongoose.Schema.Types.ObjectId,
-          ref: "User",
-          required: true,
-        },
-        text: {
-          type: String,
-          required: true,
-          trim: true,
-        },
-        answer: {
-          type: String,
-          default: null,
-          trim: true,
+    // Legacy: reviews now live in the Review collection. Only hostels that
+    // migrations/migrateReviews.js has not reached yet still have this array.
+    reviews: {
+      type: [
+        {
+          userId: {
+            type: mongoose.Schema.Types.ObjectId,
+            ref: "User",
+            required: true,
+          },
+          rating: {
+            type: Number,
+            required: true,
+            min: 1,
+            max: 5,
+          },
+          text: {
+            type: String,
+            required: true,
+            trim: true,
+          },
+          createdAt: {
+            type: Date,
+            default: Date.now,
+          },
         },
-        createdAt: {
-          type: Date,
-          default: Date.now,
-        },
-        answeredAt: {
-          type: Date,
-          default: null,
+      ],
+      default: undefined,
+      select: false,
+    },
+    // Legacy: questions now live in the Question collection. Only hostels
+    // that migrations/migrateQuestions.js has not reached yet still have this.
+    questions: {
+      type: [
+        {
+          userId: {
+            type: mongoose.Schema.Types.ObjectId,
+            ref: "User",
+            required: true,
+          },
+          text: {
+            type: String,
+            required: true,
+            trim: true,
+          },
+          answer: {
+            type: String,
+            default: null,
+            trim: true,
+          },
+          createdAt: {
+            type: Date,
+            default: Date.now,
+          },
+          answeredAt: {
+            type: Date,
+            default: null,
+          },
         },
-      },
-    ],
+      ],
+      default: undefined,
+      select: false,
+    },
     faqs: [
       {
         question: {
@@ -160,6 +172,23 @@ const hostelSchema = new mongoose.Schema(
       trim: true,
     },
 
+    // Kept in step with the Review collection by reviewController, so listing
+    // can sort and filter on ratings without reading any reviews
+    avgRating: { type: Number, default: 0 },
+    reviewCount: { type: Number, default: 0 },
+    ratingSum: { type: Number, default: 0 },
+    ratingHistogram: {
+      1: { type: Number, default: 0 },
+      2: { type: Number, default: 0 },
+      3: { type: Number, default: 0 },
+      4: { type: Number, default: 0 },
+      5: { type: Number, default: 0 },
+    },
+
+    // 1 while an approved boost is running, 0 otherwise. Set by the boost
+    // routes and the sweeper so the listing sort can come from an index.
+    boostRank: { type: Number, default: 0 },
+
     boost: {
       isActive: { type: Boolean, default: false },
       status: { type: String, enum: ["pending", "approved"], default: "pending" },
@@ -173,4 +202,34 @@ const hostelSchema = new mongoose.Schema(
   }
 );
 
+// Listing order (see getAllHostels): public listing, with an area filter,
+// and the admin listing that includes every status
+hostelSchema.index({ status: 1, boostRank: -1, avgRating: -1, createdAt: -1, _id: -1 });
+hostelSchema.index({ status: 1, area: 1, boostRank: -1, avgRating: -1, createdAt: -1, _id: -1 });
+hostelSchema.index({ boostRank: -1, avgRating: -1, createdAt: -1, _id: -1 });
+
+// Full-text search, weighted towards the fields people search by
+hostelSchema.index(
+  {
+    name: "text",
+    area: "text",
+    nearbyUniversities: "text",
+    amenities: "text",
+    description: "text",
+  },
+  {
+    name: "hostel_text",
+    weights: { name: 10, area: 6, nearbyUniversities: 4, amenities: 2, description: 1 },
+  }
+);
+
+// Owner dashboard
+hostelSchema.index({ ownerId: 1, createdAt: -1 });
+
+// Lets the boost sweeper find expired boosts without scanning every hostel
+hostelSchema.index(
+  { "boost.endDate": 1 },
+  { partialFilterExpression: { "boost.isActive": true } }
+);
+
 export default mongoose.model("Hostel", hostelSchema);
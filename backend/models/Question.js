@@ -0,0 +1,51 @@
+import mongoose from "mongoose";
+
+// Questions used to be embedded in their hostel; migrations/migrateQuestions.js
+// moves them here keeping their _id. ownerId is copied from the hostel so an
+// owner's unanswered questions come straight from an index.
+const questionSchema = new mongoose.Schema(
+  {
+    hostelId: {
+      type: mongoose.Schema.Types.ObjectId,
+      ref: "Hostel",
+      required: true,
+    },
+    ownerId: {
+      type: mongoose.Schema.Types.ObjectId,
+      ref: "User",
+      required: true,
+    },
+    userId: {
+      type: mongoose.Schema.Types.ObjectId,
+      ref: "User",
+      required: true,
+    },
+    text: {
+      type: String,
+      required: true,
+      trim: true,
+    },
+    answer: {
+      type: String,
+      default: null,
+      trim: true,
+    },
+    answered: {
+      type: Boolean,
+      default: false,
+    },
+    answeredAt: {
+      type: Date,
+      default: null,
+    },
+  },
+  { timestamps: true }
+);
+
+// Owner inbox (unanswered first-asked-first), a hostel's questions and a
+// user's questions
+questionSchema.index({ ownerId: 1, answered: 1, createdAt: 1, _id: 1 });
+questionSchema.index({ hostelId: 1, createdAt: -1, _id: -1 });
+questionSchema.index({ userId: 1, createdAt: -1, _id: -1 });
+
+export default mongoose.model("Question", questionSchema);
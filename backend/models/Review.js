@@ -0,0 +1,96 @@
+import mongoose from "mongoose";
+import Hostel from "./Hostel.js";
+
+// Reviews used to be embedded in their hostel; migrations/migrateReviews.js
+// moves them here keeping their _id. The hostel keeps only the rating
+// aggregates (avgRating, reviewCount, ratingSum, ratingHistogram).
+const reviewSchema = new mongoose.Schema(
+  {
+    hostelId: {
+      type: mongoose.Schema.Types.ObjectId,
+      ref: "Hostel",
+      required: true,
+    },
+    userId: {
+      type: mongoose.Schema.Types.ObjectId,
+      ref: "User",
+      required: true,
+    },
+    rating: {
+      type: Number,
+      required: true,
+      min: 1,
+      max: 5,
+    },
+    text: {
+      type: String,
+      required: true,
+      trim: true,
+    },
+  },
+  { timestamps: true }
+);
+
+// A hostel's reviews and a user's reviews, newest first (keyset pages)
+reviewSchema.index({ hostelId: 1, createdAt: -1, _id: -1 });
+reviewSchema.index({ userId: 1, createdAt: -1, _id: -1 });
+// Latest reviews across all hostels (admin dashboard)
+reviewSchema.index({ createdAt: -1 });
+// One review per user per hostel
+reviewSchema.index({ hostelId: 1, userId: 1 }, { unique: true });
+
+const Review = mongoose.model("Review", reviewSchema);
+
+// Recompute the rating aggregates of the given hostels (default: every
+// hostel) from the Review collection
+export const rebuildRatings = async (hostelIds) => {
+  const hostels = hostelIds ? { _id: { $in: hostelIds } } : {};
+  await Hostel.updateMany(
+    hostels,
+    {
+      $set: {
+        avgRating: 0,
+        reviewCount: 0,
+        ratingSum: 0,
+        ratingHistogram: { 1: 0, 2: 0, 3: 0, 4: 0, 5: 0 },
+      },
+    }
+  );
+
+  const histogramCount = (stars) => ({ $sum: { $cond: [{ $eq: ["$rating", stars] }, 1, 0] } });
+  await Review.aggregate([
+    ...(hostelIds ? [{ $match: { hostelId: { $in: hostelIds } } }] : []),
+    {
+      $group: {
+        _id: "$hostelId",
+        reviewCount: { $sum: 1 },
+        ratingSum: { $sum: "$rating" },
+        r1: histogramCount(1),
+        r2: histogramCount(2),
+        r3: histogramCount(3),
+        r4: histogramCount(4),
+        r5: histogramCount(5),
+      },
+    },
+    {
+      $project: {
+        reviewCount: 1,
+        ratingSum: 1,
+        avgRating: { $divide: ["$ratingSum", "$reviewCount"] },
+        ratingHistogram: {
+          $arrayToObject: [[1, 2, 3, 4, 5].map((stars) => ({ k: String(stars), v: `$r${stars}` }))],
+        },
+      },
+    },
+    {
+      $merge: {
+        into: Hostel.collection.name,
+        on: "_id",
+        whenMatched: "merge",
+        whenNotMatched: "discard",
+      },
+    },
+  ]);
+};
+
+export default Review;
@@ -11,4 +11,7 @@ const salesSchema = new mongoose.Schema(
   { timestamps: true }
 );
 
+// No secondary indexes: sales stats are read from SalesRollup, and only
+// rebuildSalesRollups() reads this collection, all of it at once
+
 export default mongoose.model("Sale", salesSchema);
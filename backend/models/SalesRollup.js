@@ -0,0 +1,58 @@
+import mongoose from "mongoose";
+import Sale from "./Sales.js";
+
+// One document per calendar month (UTC) of boost sales. approveBoost adds to
+// it as each sale is recorded, so the sales stats read months, not sales.
+const salesRollupSchema = new mongoose.Schema(
+  {
+    year: { type: Number, required: true },
+    month: { type: Number, required: true, min: 1, max: 12 },
+    revenue: { type: Number, default: 0 },
+    boostCount: { type: Number, default: 0 },
+  },
+  { timestamps: true }
+);
+
+// Newest month first, and one document per month
+salesRollupSchema.index({ year: -1, month: -1 }, { unique: true });
+
+const SalesRollup = mongoose.model("SalesRollup", salesRollupSchema);
+
+// Add a newly created sale to its month
+export const recordSale = (sale) => {
+  const at = sale.createdAt || new Date();
+  return SalesRollup.updateOne(
+    { year: at.getUTCFullYear(), month: at.getUTCMonth() + 1 },
+    { $inc: { revenue: sale.amount || 0, boostCount: 1 } },
+    { upsert: true }
+  );
+};
+
+// Recompute every month from the raw sales, replacing the current rollups
+export const rebuildSalesRollups = async () => {
+  const now = new Date();
+  await Sale.aggregate([
+    {
+      $group: {
+        _id: { year: { $year: "$createdAt" }, month: { $month: "$createdAt" } },
+        revenue: { $sum: "$amount" },
+        boostCount: { $sum: 1 },
+      },
+    },
+    {
+      $project: {
+        _id: 0,
+        year: "$_id.year",
+        month: "$_id.month",
+        revenue: 1,
+        boostCount: 1,
+        createdAt: now,
+        updatedAt: now,
+      },
+    },
+    { $out: SalesRollup.collection.name },
+  ]);
+  return SalesRollup.countDocuments();
+};
+
+export default SalesRollup;
@@ -38,4 +38,6 @@ const userSchema = new mongoose.Schema(
   }
 );
 
+userSchema.index({ role: 1 });
+
 export default mongoose.model("User", userSchema);
@@ -39,4 +39,7 @@ const visitSchema = new mongoose.Schema(
   { timestamps: true }
 );
 
+visitSchema.index({ owner: 1, createdAt: -1 });
+visitSchema.index({ user: 1, createdAt: -1 });
+
 export default mongoose.model("Visit", visitSchema);
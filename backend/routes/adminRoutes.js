@@ -0,0 +1,18 @@
+import express from "express";
+import { getAdminSummary } from "../controllers/adminController.js";
+import { authenticate, authorize } from "../middleware/auth.js";
+import { cacheResponse, ADMIN_SUMMARY_TAG, HOSTEL_LIST_TAG } from "../middleware/cache.js";
+
+const router = express.Router();
+
+// Admin-only: dashboard stats and moderation queues. Every hostel write
+// invalidates the listing tag, so the summary is dropped along with it.
+router.get(
+  "/summary",
+  authenticate,
+  authorize("admin"),
+  cacheResponse(() => [ADMIN_SUMMARY_TAG, HOSTEL_LIST_TAG]),
+  getAdminSummary
+);
+
+export default router;
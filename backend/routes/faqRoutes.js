@@ -7,11 +7,12 @@ import {
   deleteFAQ,
 } from "../controllers/faqController.js";
 import { authenticate, authorize } from "../middleware/auth.js";
+import { cacheResponse, FAQ_TAG } from "../middleware/cache.js";
 
 const router = express.Router();
 
 // Public: list faqs
-router.get("/", getFAQs);
+router.get("/", cacheResponse(() => [FAQ_TAG]), getFAQs);
 
 // Admin routes
 router.post("/", authenticate, authorize("admin"), createFAQ);
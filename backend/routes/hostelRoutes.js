@@ -1,6 +1,8 @@
 import express from "express";
 import {
   getAllHostels,
+  searchHostels,
+  getHostelFacets,
   getHostelById,
   createHostel,
   updateHostel,
@@ -24,16 +26,29 @@ import {
 } from "../controllers/hostelController.js";
 
 import { authenticate, authorize } from "../middleware/auth.js";
-import {addQuestion, answerQuestion, getQuestionsByUser} from "../controllers/questionController.js";
+import { cacheResponse, hostelTag, HOSTEL_LIST_TAG, HOSTEL_DETAILS_TAG } from "../middleware/cache.js";
+import {
+  addQuestion,
+  answerQuestion,
+  getHostelQuestions,
+  getOwnerQuestions,
+  getQuestionsByUser,
+} from "../controllers/questionController.js";
 
 const router = express.Router();
 
+// Public reads are cached until a write to the hostel invalidates them
+const cacheList = cacheResponse(() => [HOSTEL_LIST_TAG]);
+const cacheDetails = cacheResponse((req) => [hostelTag(req.params.id), HOSTEL_DETAILS_TAG]);
+
 // Admin all hostels
 router.get("/admin", authenticate, authorize("admin"), getAllHostels);
 
 // Public routes
-router.get("/", getAllHostels);
-router.get("/:id", getHostelById);
+router.get("/", cacheList, getAllHostels);
+router.get("/search", cacheList, searchHostels); // before /:id
+router.get("/facets", cacheList, getHostelFacets); // before /:id
+router.get("/:id", cacheDetails, getHostelById);
 router.patch("/:id/views", increaseViewCount);
 
 // Protected routes
@@ -54,6 +69,8 @@ router.patch("/:id/boost/approve", authenticate, authorize("admin"), approveBoos
 router.patch("/:id/boost/reject", authenticate, authorize("admin"), rejectBoost); // admin rejects boost
 
 // Question routes
+router.get("/owner/questions", authenticate, authorize("owner"), getOwnerQuestions); // before /:id/questions
+router.get("/:id/questions", getHostelQuestions);
 router.post("/:id/questions", authenticate, addQuestion);
 router.post("/:id/questions/:questionId/answer", authenticate, authorize("owner", "admin"), answerQuestion);
 router.get("/user/my-questions", authenticate, getQuestionsByUser);
@@ -87,6 +104,6 @@ router.patch("/visits/:visitId/complete", authenticate, authorize("user"), compl
 router.get("/user/my-visits", authenticate, authorize("user"), getMyVisitsForUser);
 
 // SINGLE HOSTEL – MUST COME LAST!
-router.get("/:id", getHostelById);
+router.get("/:id", cacheDetails, getHostelById);
 
 export default router;
@@ -4,6 +4,7 @@ import {
   deleteReview,
   getReviews,
   getReviewsByUser,   // <-- NEW
+  getMyReview,
 } from "../controllers/reviewController.js";
 
 import { authenticate, authorize } from "../middleware/auth.js";
@@ -13,6 +14,9 @@ const router = express.Router();
 // Get all reviews for a hostel (public)
 router.get("/hostel/:id", getReviews);
 
+// Whether the logged-in user has reviewed this hostel
+router.get("/hostel/:id/mine", authenticate, authorize("user"), getMyReview);
+
 // Add review (authenticated users only)
 router.post("/hostel/:id", authenticate, authorize("user"), addReview);
 
@@ -2,6 +2,7 @@ import express from "express";
 import { 
   addToWishlist, 
   removeFromWishlist, 
+  syncWishlist,
   getWishlist,
   getPlainUserCount,
   getOwnerCount
@@ -12,6 +13,7 @@ const router = express.Router();
 
 // Only "user" role can manage wishlist
 router.post("/wishlist", authenticate, authorize("user"), addToWishlist);
+router.post("/wishlist/batch", authenticate, authorize("user"), syncWishlist);
 router.delete("/wishlist/:hostelId", authenticate, authorize("user"), removeFromWishlist);
 router.get("/wishlist", authenticate, authorize("user"), getWishlist);
 
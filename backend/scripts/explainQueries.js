@@ -0,0 +1,214 @@
+// Runs explain("executionStats") for the queries behind the controllers and
+// flags collection scans and in-memory sorts. Seed (or load a generated
+// dataset) first so the planner has real data to choose from.
+//   node scripts/explainQueries.js [--json report.json]
+import fs from "fs";
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import syncIndexes from "../config/indexes.js";
+
+import Hostel from "../models/Hostel.js";
+import User from "../models/User.js";
+import Visit from "../models/Visit.js";
+import SalesRollup from "../models/SalesRollup.js";
+import FAQ from "../models/FAQ.js";
+import Review from "../models/Review.js";
+import Question from "../models/Question.js";
+import { LISTING_SORT, afterCursor } from "../controllers/hostelController.js";
+
+dotenv.config();
+
+// Stages that mean the query reads more than its index gives it
+const PROBLEM_STAGES = {
+  COLLSCAN: "collection scan",
+  SORT: "in-memory sort",
+  $sort: "in-memory sort (aggregation)",
+};
+
+// Walk the winning plan (rejected plans are not what ran) collecting stage names
+const collectStages = (node, stages = []) => {
+  if (Array.isArray(node)) {
+    node.forEach((child) => collectStages(child, stages));
+  } else if (node && typeof node === "object") {
+    for (const [key, value] of Object.entries(node)) {
+      if (key === "rejectedPlans" || key === "allPlansExecution") continue;
+      if (key === "stage" && typeof value === "string") stages.push(value);
+      else if (key === "$sort") stages.push("$sort");
+      else collectStages(value, stages);
+    }
+  }
+  return stages;
+};
+
+const findExecutionStats = (node) => {
+  if (!node || typeof node !== "object") return null;
+  if (node.executionStats) return node.executionStats;
+  for (const [key, value] of Object.entries(node)) {
+    if (key === "rejectedPlans") continue;
+    const found = findExecutionStats(value);
+    if (found) return found;
+  }
+  return null;
+};
+
+const buildQueries = async () => {
+  const hostel = await Hostel.findOne({ status: "approved" }).lean();
+  const review = await Review.findOne().lean();
+  const question = await Question.findOne().lean();
+  const visit = await Visit.findOne().lean();
+  const user = await User.findOne({ role: "user" }).lean();
+
+  if (!hostel || !user) {
+    throw new Error("No data to explain against, run the seed first");
+  }
+
+  const firstPage = await Hostel.find({ status: "approved" }).sort(LISTING_SORT).limit(20).lean();
+  const last = firstPage[firstPage.length - 1];
+
+  return [
+    {
+      name: "getAllHostels (public)",
+      run: () => Hostel.find({ status: "approved" }).sort(LISTING_SORT).limit(21),
+    },
+    {
+      name: "getAllHostels (next page)",
+      run: () => Hostel.find({ $and: [{ status: "approved" }, afterCursor(last)] }).sort(LISTING_SORT).limit(21),
+    },
+    {
+      name: "getAllHostels (area filter)",
+      run: () => Hostel.find({ status: "approved", area: hostel.area }).sort(LISTING_SORT).limit(21),
+    },
+    {
+      name: "getAllHostels (admin)",
+      run: () => Hostel.find({}).sort(LISTING_SORT).limit(21),
+    },
+    {
+      name: "getHostelsByOwner",
+      run: () => Hostel.find({ ownerId: hostel.ownerId }).sort({ createdAt: -1 }),
+    },
+    {
+      name: "getReviews",
+      run: () => Review.find({ hostelId: review?.hostelId ?? hostel._id }).sort({ createdAt: -1, _id: -1 }).limit(21),
+    },
+    {
+      name: "getReviewsByUser",
+      run: () => Review.find({ userId: review?.userId ?? user._id }).sort({ createdAt: -1, _id: -1 }).limit(21),
+    },
+    {
+      name: "admin summary (recent reviews)",
+      run: () => Review.find().sort({ createdAt: -1 }).limit(5),
+    },
+    {
+      name: "getHostelQuestions",
+      run: () => Question.find({ hostelId: question?.hostelId ?? hostel._id }).sort({ createdAt: -1, _id: -1 }).limit(21),
+    },
+    {
+      name: "getOwnerQuestions",
+      run: () => Question.find({ ownerId: question?.ownerId ?? hostel.ownerId, answered: false })
+        .sort({ createdAt: 1, _id: 1 })
+        .limit(21),
+    },
+    {
+      name: "getQuestionsByUser",
+      run: () => Question.find({ userId: question?.userId ?? user._id }).sort({ createdAt: -1, _id: -1 }).limit(21),
+    },
+    {
+      name: "boost sweeper",
+      run: () => Hostel.find({ "boost.isActive": true, "boost.endDate": { $lt: new Date() } }),
+    },
+    {
+      name: "getMyVisitsForOwner",
+      run: () => Visit.find({ owner: visit?.owner ?? hostel.ownerId }).sort({ createdAt: -1 }),
+    },
+    {
+      name: "getMyVisitsForUser",
+      run: () => Visit.find({ user: visit?.user ?? user._id }).sort({ createdAt: -1 }),
+    },
+    {
+      name: "login",
+      run: () => User.findOne({ email: user.email }),
+    },
+    {
+      name: "getPlainUserCount",
+      run: () => User.aggregate([{ $match: { role: "user" } }, { $count: "count" }]),
+    },
+    {
+      name: "getSalesStats (rollups)",
+      run: () => SalesRollup.find().sort({ year: -1, month: -1 }),
+    },
+    {
+      name: "getFAQs",
+      run: () => FAQ.find().sort({ createdAt: -1 }),
+    },
+  ];
+};
+
+const explainAll = async () => {
+  const results = [];
+  for (const query of await buildQueries()) {
+    const explain = await query.run().explain("executionStats");
+    const plan = Array.isArray(explain) ? explain[0] : explain;
+    const stats = findExecutionStats(plan) || {};
+    const stages = collectStages(plan.queryPlanner?.winningPlan ? plan.queryPlanner.winningPlan : plan);
+    const problems = [...new Set(stages.filter((stage) => PROBLEM_STAGES[stage]))]
+      .map((stage) => PROBLEM_STAGES[stage]);
+
+    results.push({
+      name: query.name,
+      stages: [...new Set(stages)],
+      keysExamined: stats.totalKeysExamined ?? null,
+      docsExamined: stats.totalDocsExamined ?? null,
+      returned: stats.nReturned ?? null,
+      ms: stats.executionTimeMillis ?? null,
+      problems,
+    });
+  }
+  return results;
+};
+
+const printResults = (results) => {
+  const header = ["Query", "Returned", "Keys", "Docs", "ms", "Plan"];
+  const rows = results.map((r) => [
+    (r.problems.length ? "✗ " : "✓ ") + r.name,
+    String(r.returned ?? "-"),
+    String(r.keysExamined ?? "-"),
+    String(r.docsExamined ?? "-"),
+    String(r.ms ?? "-"),
+    r.stages.join(" > "),
+  ]);
+  const widths = header.map((h, i) => Math.max(h.length, ...rows.map((row) => row[i].length)));
+  const line = (cells) => cells.map((cell, i) => cell.padEnd(widths[i])).join("  ");
+
+  console.log(line(header));
+  console.log(widths.map((w) => "-".repeat(w)).join("  "));
+  rows.forEach((row) => console.log(line(row)));
+
+  const flagged = results.filter((r) => r.problems.length);
+  console.log();
+  if (flagged.length === 0) {
+    console.log("✅ Every query is served by an index");
+  } else {
+    for (const r of flagged) {
+      console.log(`⚠️  ${r.name}: ${r.problems.join(", ")}`);
+    }
+  }
+  return flagged.length;
+};
+
+try {
+  await connectDB();
+  await syncIndexes();
+
+  const results = await explainAll();
+  const flagged = printResults(results);
+
+  const jsonFlag = process.argv.indexOf("--json");
+  if (jsonFlag !== -1 && process.argv[jsonFlag + 1]) {
+    fs.writeFileSync(process.argv[jsonFlag + 1], JSON.stringify(results, null, 2));
+  }
+
+  process.exit(flagged ? 1 : 0);
+} catch (err) {
+  console.error("❌ Explain error:", err);
+  process.exit(1);
+}
@@ -0,0 +1,18 @@
+// Recomputes the monthly sales rollups from the raw sales, e.g. after sales
+// were imported or edited directly. Safe to run again.
+//   node scripts/rebuildSalesRollups.js
+import dotenv from "dotenv";
+import connectDB from "../config/db.js";
+import { rebuildSalesRollups } from "../models/SalesRollup.js";
+
+dotenv.config();
+await connectDB();
+
+try {
+  const months = await rebuildSalesRollups();
+  console.log(`📊 Sales rollups rebuilt for ${months} month(s)`);
+  process.exit(0);
+} catch (err) {
+  console.error("❌ Rollup rebuild error:", err);
+  process.exit(1);
+}
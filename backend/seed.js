@@ -1,10 +1,20 @@
+import fs from "fs";
+import path from "path";
+import readline from "readline";
 import mongoose from "mongoose";
 import dotenv from "dotenv";
 import bcrypt from "bcryptjs";
+import { EJSON } from "mongodb";
 import connectDB from "./config/db.js";
 
 import User from "./models/User.js";
 import Hostel from "./models/Hostel.js";
+import Review, { rebuildRatings } from "./models/Review.js";
+import Question from "./models/Question.js";
+import Visit from "./models/Visit.js";
+import Sale from "./models/Sales.js";
+import { rebuildSalesRollups } from "./models/SalesRollup.js";
+import FAQ from "./models/FAQ.js";
 
 import { users } from "./data/users.js";
 import { hostels } from "./data/hostelMock.js";
@@ -17,6 +27,8 @@ const seedData = async () => {
     // Clear old data
     await User.deleteMany();
     await Hostel.deleteMany();
+    await Review.deleteMany();
+    await Question.deleteMany();
     console.log("🧹 Old data cleared");
 
     // Hash passwords
@@ -37,27 +49,13 @@ const seedData = async () => {
       userIdMap[index + 1] = u._id;
     });
 
-    // Fix hostels' ownerId, reviews, and questions
-    const hostelsWithFixedIds = hostels.map((h) => ({
+    // Fix hostels' ownerId (reviews and questions go to their own collections)
+    const hostelsWithFixedIds = hostels.map(({ reviews, questions, ...h }) => ({
       ...h,
 
       // Map numeric ownerId to actual ObjectId
       ownerId: userIdMap[h.ownerId],
 
-      // Map review userIds
-      reviews:
-        h.reviews?.map((r) => ({
-          ...r,
-          userId: userIdMap[r.userId],
-        })) || [],
-
-      // Map question userIds
-      questions:
-        h.questions?.map((q) => ({
-          ...q,
-          userId: userIdMap[q.userId],
-        })) || [],
-
       // FAQs (keep as is)
       faqs: h.faqs || [],
 
@@ -68,9 +66,36 @@ const seedData = async () => {
     }));
 
     // Insert hostels
-    await Hostel.insertMany(hostelsWithFixedIds);
+    const createdHostels = await Hostel.insertMany(hostelsWithFixedIds);
     console.log("🏠 Hostels inserted");
 
+    // Insert reviews, mapping userIds, then compute the rating aggregates
+    await Review.insertMany(
+      hostels.flatMap((h, index) =>
+        (h.reviews || []).map((r) => ({
+          ...r,
+          hostelId: createdHostels[index]._id,
+          userId: userIdMap[r.userId],
+        }))
+      )
+    );
+    await rebuildRatings();
+    console.log("⭐ Reviews inserted");
+
+    // Insert questions, filed under each hostel's owner
+    await Question.insertMany(
+      hostels.flatMap((h, index) =>
+        (h.questions || []).map((q) => ({
+          ...q,
+          hostelId: createdHostels[index]._id,
+          ownerId: createdHostels[index].ownerId,
+          userId: userIdMap[q.userId],
+          answered: Boolean(q.answer),
+        }))
+      )
+    );
+    console.log("❓ Questions inserted");
+
     console.log("🌱 Seeding completed successfully!");
     process.exit(0);
   } catch (err) {
@@ -79,4 +104,69 @@ const seedData = async () => {
   }
 };
 
-seedData();
+// Bulk-load a dataset written by data/generateDataset.js:
+//   node seed.js --dataset data/generated/10k
+const DATASET_MODELS = {
+  users: User,
+  hostels: Hostel,
+  reviews: Review,
+  questions: Question,
+  visits: Visit,
+  sales: Sale,
+  faqs: FAQ,
+};
+const BATCH_SIZE = 1000;
+
+const loadCollection = async (Model, file) => {
+  const lines = readline.createInterface({ input: fs.createReadStream(file), crlfDelay: Infinity });
+  let batch = [];
+  let count = 0;
+
+  for await (const line of lines) {
+    if (!line) continue;
+    batch.push(EJSON.parse(line));
+    if (batch.length === BATCH_SIZE) {
+      // The generator writes schema-valid documents, so skip Mongoose casting
+      await Model.collection.insertMany(batch, { ordered: false });
+      count += batch.length;
+      batch = [];
+    }
+  }
+  if (batch.length) {
+    await Model.collection.insertMany(batch, { ordered: false });
+    count += batch.length;
+  }
+  return count;
+};
+
+const seedDataset = async (dir) => {
+  try {
+    const manifest = JSON.parse(fs.readFileSync(path.join(dir, "manifest.json"), "utf-8"));
+
+    for (const Model of Object.values(DATASET_MODELS)) {
+      await Model.deleteMany();
+    }
+    console.log("🧹 Old data cleared");
+
+    for (const [name, Model] of Object.entries(DATASET_MODELS)) {
+      const count = await loadCollection(Model, path.join(dir, `${name}.ndjson`));
+      console.log(`📥 ${name}: ${count} inserted`);
+    }
+
+    const months = await rebuildSalesRollups();
+    console.log(`📊 Sales rollups rebuilt for ${months} month(s)`);
+
+    console.log(`🌱 ${manifest.tier} dataset (seed ${manifest.seed}) loaded successfully!`);
+    process.exit(0);
+  } catch (err) {
+    console.error("❌ Seeding error:", err);
+    process.exit(1);
+  }
+};
+
+const datasetFlag = process.argv.indexOf("--dataset");
+if (datasetFlag !== -1) {
+  seedDataset(process.argv[datasetFlag + 1] || path.join("data", "generated", "1k"));
+} else {
+  seedData();
+}
@@ -1,18 +1,39 @@
+// Load .env before any other module: several read their settings from
+// process.env when they are first imported (cache, view counter)
+import "dotenv/config";
 import express from "express";
 import cors from "cors";
-import dotenv from "dotenv";
 import connectDB from "./config/db.js";
+import syncIndexes from "./config/indexes.js";
+import backfillListingFields from "./config/backfill.js";
 import authRoutes from "./routes/authRoutes.js";
 import hostelRoutes from "./routes/hostelRoutes.js";
 import reviewRoutes from "./routes/reviewRoutes.js";
 import faqRoutes from "./routes/faqRoutes.js";
 import userRoutes from "./routes/userRoutes.js";
 import salesRoutes from "./routes/salesRoutes.js";
+import adminRoutes from "./routes/adminRoutes.js";
+import { startBoostSweeper, boostSweeperStats } from "./jobs/boostSweeper.js";
+import { startViewCounter, stopViewCounter, viewCounterStats } from "./jobs/viewCounter.js";
+import { cacheStats } from "./middleware/cache.js";
+import { trackLoad, loadStats } from "./middleware/load.js";
+import { isWorker, workerSlot, sendToPrimary, askPrimary } from "./utils/cluster.js";
 
-dotenv.config();
+// Under cluster.js every worker runs this file; database-wide work happens
+// in slot 0 only. View counts are buffered per worker.
+const runsSharedJobs = workerSlot === 0;
+let shuttingDown = false;
 
 // Connect Database
-connectDB();
+connectDB().then(async () => {
+  if (!runsSharedJobs) return;
+  await backfillListingFields();
+  await syncIndexes();
+});
+
+// Background jobs
+if (runsSharedJobs) startBoostSweeper();
+startViewCounter();
 
 const app = express();
 
@@ -22,6 +43,12 @@ app.use(cors({
   credentials: true,
 }));
 app.use(express.json());
+app.use(trackLoad);
+// While draining, tell clients not to reuse their connection
+app.use((req, res, next) => {
+  if (shuttingDown) res.set("Connection", "close");
+  next();
+});
 
 // Routes
 app.use("/api/auth", authRoutes);
@@ -30,15 +57,41 @@ app.use("/api/reviews", reviewRoutes);
 app.use("/api/faqs", faqRoutes);
 app.use("/api/users", userRoutes);
 app.use("/api/sales", salesRoutes);
+app.use("/api/admin", adminRoutes);
 
-// Health check endpoint
+const workerHealth = () => ({
+  slot: workerSlot,
+  ...loadStats(),
+  jobs: {
+    boostSweeper: runsSharedJobs ? boostSweeperStats() : null,
+    viewCounter: viewCounterStats(),
+  },
+  cache: cacheStats(),
+});
+
+// Health check endpoint (the worker that answers)
 app.get("/api/health", (req, res) => {
+  const { jobs, cache, ...worker } = workerHealth();
   res.status(200).json({ 
     success: true, 
-    message: "Server is running" 
+    message: "Server is running",
+    worker,
+    jobs,
+    cache,
   });
 });
 
+// Every worker's latest health, as last reported to the cluster primary
+app.get("/api/health/workers", async (req, res) => {
+  try {
+    const workers = isWorker ? await askPrimary("cluster:workers") : [{ status: "up", ...workerHealth() }];
+    res.status(200).json({ success: true, count: workers.length, workers });
+  } catch (error) {
+    console.error("Worker health error:", error);
+    res.status(503).json({ success: false, message: "Worker health unavailable" });
+  }
+});
+
 // 404 handler
 app.use((req, res) => {
   res.status(404).json({ 
@@ -48,8 +101,42 @@ app.use((req, res) => {
 });
 
 const PORT = process.env.PORT || 5000;
+const HEALTH_REPORT_INTERVAL_MS = 1000;
+const SHUTDOWN_TIMEOUT_MS = Number(process.env.SHUTDOWN_TIMEOUT_MS) || 10 * 1000;
 
-app.listen(PORT, () => {
-  console.log(`🚀 Server running on port ${PORT}`);
+const server = app.listen(PORT, () => {
+  console.log(`🚀 Server running on port ${PORT}${isWorker ? ` (worker ${workerSlot}, pid ${process.pid})` : ""}`);
 });
 
+if (isWorker) {
+  setInterval(() => sendToPrimary("worker:health", workerHealth()), HEALTH_REPORT_INTERVAL_MS).unref();
+}
+
+// Stop accepting connections, let in-flight requests finish (up to
+// SHUTDOWN_TIMEOUT_MS), then write buffered view counts and exit
+const shutdown = (signal) => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`🛑 ${signal} received, draining connections`);
+
+  const forceClose = setTimeout(() => {
+    console.log("⏱️  Drain timed out, closing remaining connections");
+    server.closeAllConnections();
+  }, SHUTDOWN_TIMEOUT_MS);
+  forceClose.unref();
+
+  // Keep-alive connections would hold close() open; drop each one as soon
+  // as its last request has been answered
+  const closeIdle = setInterval(() => server.closeIdleConnections(), 100);
+
+  server.close(() => {
+    clearTimeout(forceClose);
+    clearInterval(closeIdle);
+    stopViewCounter()
+      .catch((error) => console.error("Shutdown error:", error))
+      .finally(() => process.exit(0));
+  });
+};
+process.on("SIGINT", shutdown);
+process.on("SIGTERM", shutdown);
+
@@ -0,0 +1,52 @@
+import cluster from "cluster";
+
+// Worker side of the messages exchanged with the cluster primary (cluster.js).
+// When the server runs as a single process (npm start) there is no primary:
+// messages are dropped and the process acts as the only worker, slot 0.
+export const isWorker = cluster.isWorker;
+export const workerSlot = isWorker ? Number(process.env.WORKER_SLOT) || 0 : 0;
+
+const ASK_TIMEOUT_MS = 2000;
+
+const handlers = new Map(); // type -> handler(data)
+const pending = new Map(); // request id -> { resolve, reject, timer }
+let nextRequestId = 0;
+
+if (isWorker) {
+  process.on("message", (message) => {
+    if (message?.replyTo !== undefined) {
+      const request = pending.get(message.replyTo);
+      if (!request) return;
+      pending.delete(message.replyTo);
+      clearTimeout(request.timer);
+      request.resolve(message.data);
+      return;
+    }
+    handlers.get(message?.type)?.(message.data);
+  });
+}
+
+// Fire-and-forget message to the primary
+export const sendToPrimary = (type, data) => {
+  if (isWorker && process.connected) process.send({ type, data });
+};
+
+// Handle a message the primary sends (or relays from another worker)
+export const onPrimaryMessage = (type, handler) => {
+  handlers.set(type, handler);
+};
+
+// Ask the primary for something and wait for its reply
+export const askPrimary = (type, data) =>
+  new Promise((resolve, reject) => {
+    if (!isWorker || !process.connected) {
+      return reject(new Error("Not running under the cluster primary"));
+    }
+    const id = nextRequestId++;
+    const timer = setTimeout(() => {
+      pending.delete(id);
+      reject(new Error(`No reply from the cluster primary to ${type}`));
+    }, ASK_TIMEOUT_MS);
+    pending.set(id, { resolve, reject, timer });
+    process.send({ type, id, data });
+  });
@@ -0,0 +1,59 @@
+import mongoose from "mongoose";
+
+const DEFAULT_PAGE_SIZE = 20;
+const MAX_PAGE_SIZE = 100;
+
+// Keyset pagination over (createdAt, _id), for lists such as reviews and
+// questions. _id breaks ties so every document has exactly one position.
+// The hostel listing has its own cursor (see hostelController).
+export const newestFirst = { createdAt: -1, _id: -1 };
+export const oldestFirst = { createdAt: 1, _id: 1 };
+
+export const pageSize = (limit) =>
+  Math.min(Math.max(parseInt(limit, 10) || DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+
+// Cursors are the sort key of the last document on the previous page
+export const encodeCursor = (doc) =>
+  Buffer.from(JSON.stringify([doc.createdAt.toISOString(), String(doc._id)])).toString("base64url");
+
+export const decodeCursor = (cursor) => {
+  try {
+    const [createdAt, id] = JSON.parse(Buffer.from(cursor, "base64url").toString("utf-8"));
+    const date = new Date(createdAt);
+    if (Number.isNaN(date.getTime()) || !mongoose.isValidObjectId(id)) return null;
+    return { createdAt: date, _id: new mongoose.Types.ObjectId(id) };
+  } catch {
+    return null;
+  }
+};
+
+// Everything that sorts after the cursor in the given order
+export const afterCursor = ({ createdAt, _id }, sort = newestFirst) => {
+  const op = sort.createdAt === 1 ? "$gt" : "$lt";
+  return { $or: [{ createdAt: { [op]: createdAt } }, { createdAt, _id: { [op]: _id } }] };
+};
+
+// Fetch one page of `model` documents matching `filter`, in `sort` order.
+// Returns the page and the next cursor, or null if `cursor` is invalid.
+export const findPage = async (model, filter, { cursor, limit, sort = newestFirst, populate } = {}) => {
+  let position = null;
+  if (cursor) {
+    position = decodeCursor(cursor);
+    if (!position) return null;
+  }
+
+  const size = pageSize(limit);
+  let query = model
+    .find(position ? { $and: [filter, afterCursor(position, sort)] } : filter)
+    .sort(sort)
+    .limit(size + 1);
+  for (const [path, select] of populate || []) query = query.populate(path, select);
+  const docs = await query.lean();
+
+  const items = docs.slice(0, size);
+  return {
+    items,
+    first: !position,
+    nextCursor: docs.length > size ? encodeCursor(items[items.length - 1]) : null,
+  };
+};
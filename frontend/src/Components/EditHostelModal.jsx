@@ -105,7 +105,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
         onClick={(e) => e.stopPropagation()}
         className="bg-gray-800 rounded-lg shadow-xl w-full max-w-lg p-6 border border-gray-700 max-h-[80vh] overflow-y-auto"
       >
-        <h3 className="text-2xl font-bold text-white mb-4">Update Hostel Details</h3>
+        <h3 data-testid="edit-hostel-title" className="text-2xl font-bold text-white mb-4">Update Hostel Details</h3>
 
         <form onSubmit={handleSubmit} className="space-y-4">
 
@@ -114,6 +114,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
             <div>
               <label className="block text-sm text-gray-300">Hostel Name</label>
               <input
+                data-testid="hostel-name"
                 value={name}
                 onChange={(e) => setName(e.target.value)}
                 className="w-full p-2 bg-gray-700 text-white border border-gray-600 rounded-md"
@@ -124,6 +125,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
             <div>
               <label className="block text-sm text-gray-300">Area</label>
               <input
+                data-testid="hostel-area"
                 value={area}
                 onChange={(e) => setArea(e.target.value)}
                 className="w-full p-2 bg-gray-700 text-white border border-gray-600 rounded-md"
@@ -136,6 +138,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
           <div>
             <label className="block text-sm text-gray-300">Contact Number</label>
             <input
+              data-testid="hostel-contact"
               type="text"
               value={contact}
               onChange={(e) => setContact(e.target.value)}
@@ -149,6 +152,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
           <div>
             <label className="block text-sm text-gray-300">Monthly Rent (PKR)</label>
             <input
+              data-testid="hostel-rent"
               type="number"
               value={rent}
               onChange={(e) => setRent(Number(e.target.value))}
@@ -162,6 +166,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
             <div>
               <label className="block text-sm text-gray-300">Gender</label>
               <select
+                data-testid="hostel-gender"
                 value={gender}
                 onChange={(e) => setGender(e.target.value)}
                 className="w-full p-2 bg-gray-700 text-white border border-gray-600 rounded-md"
@@ -174,6 +179,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
             <div>
               <label className="block text-sm text-gray-300">Profession</label>
               <select
+                data-testid="hostel-profession"
                 value={profession}
                 onChange={(e) => setProfession(e.target.value)}
                 className="w-full p-2 bg-gray-700 text-white border border-gray-600 rounded-md"
@@ -189,6 +195,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
           <div>
             <label className="block text-sm text-gray-300">Description</label>
             <textarea
+              data-testid="hostel-description"
               rows="3"
               value={desc}
               onChange={(e) => setDesc(e.target.value)}
@@ -235,6 +242,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
           {/* Buttons */}
           <div className="flex justify-end space-x-2 mt-6">
             <button
+              data-testid="hostel-form-cancel"
               type="button"
               onClick={closeModal}
               className="px-4 py-2 bg-red-600 text-white rounded-lg"
@@ -243,6 +251,7 @@ export default function EditHostelModal({ hostel, closeModal, updateHostel }) {
             </button>
 
             <button
+              data-testid="hostel-form-submit"
               disabled={loading}
               className="px-4 py-2 bg-blue-600 text-white rounded-lg disabled:opacity-50"
             >
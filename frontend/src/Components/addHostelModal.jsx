@@ -96,7 +96,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
         className="modal bg-gray-800 rounded-lg shadow-xl w-full max-w-lg p-6 border border-gray-700 max-h-[80vh] overflow-y-auto"
         onClick={(e) => e.stopPropagation()}
       >
-        <h3 className="text-2xl font-bold text-white mb-4">List a New Hostel</h3>
+        <h3 data-testid="add-hostel-title" className="text-2xl font-bold text-white mb-4">List a New Hostel</h3>
 
         <form onSubmit={handleSubmit} className="space-y-4">
 
@@ -105,6 +105,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
             <div>
               <label className="block text-sm font-medium text-gray-300">Hostel Name</label>
               <input
+                data-testid="hostel-name"
                 type="text"
                 className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
                 value={name}
@@ -116,6 +117,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
             <div>
               <label className="block text-sm font-medium text-gray-300">Area</label>
               <input
+                data-testid="hostel-area"
                 type="text"
                 className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
                 value={area}
@@ -129,6 +131,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
           <div>
             <label className="block text-sm font-medium text-gray-300">Contact Number</label>
             <input
+              data-testid="hostel-contact"
               type="text"
               className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
               value={contact}
@@ -142,6 +145,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
           <div>
             <label className="block text-sm font-medium text-gray-300">Monthly Rent (PKR)</label>
             <input
+              data-testid="hostel-rent"
               type="number"
               className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
               value={rent}
@@ -156,6 +160,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
             <div>
               <label className="block text-sm font-medium text-gray-300">Gender</label>
               <select
+                data-testid="hostel-gender"
                 className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
                 value={gender}
                 onChange={(e) => setGender(e.target.value)}
@@ -168,6 +173,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
             <div>
               <label className="block text-sm font-medium text-gray-300">Profession</label>
               <select
+                data-testid="hostel-profession"
                 className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
                 value={profession}
                 onChange={(e) => setProfession(e.target.value)}
@@ -183,6 +189,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
           <div>
             <label className="block text-sm font-medium text-gray-300">Description</label>
             <textarea
+              data-testid="hostel-description"
               rows="3"
               className="w-full p-2 border border-gray-600 bg-gray-700 text-white rounded-md"
               value={desc}
@@ -230,6 +237,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
           {/* BUTTONS */}
           <div className="flex justify-end space-x-2 mt-6">
             <button
+              data-testid="hostel-form-cancel"
               type="button"
               onClick={closeModal}
               className="px-4 py-2 bg-red-600 text-white rounded-lg hover:bg-red-500"
@@ -238,6 +246,7 @@ export default function AddHostelModal({ closeModal, addHostel, currentUser }) {
             </button>
 
             <button
+              data-testid="hostel-form-submit"
               type="submit"
               disabled={loading}
               className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50"
@@ -37,12 +37,13 @@ export default function BoostModal({ hostelId, onClose, refreshHostels }) {
     <div className="fixed inset-0 flex items-center h-full justify-center bg-black bg-opacity-50 z-50">
       <div className="bg-gray-800 rounded-lg shadow-lg p-6 w-96 relative">
         <button
+          data-testid="boost-modal-close"
           className="absolute top-2 right-2 text-gray-500 hover:text-gray-700"
           onClick={onClose}
         >
           ✕
         </button>
-        <h2 className="text-xl font-semibold mb-4 text-center">Boost Your Hostel</h2>
+        <h2 data-testid="boost-modal-title" className="text-xl font-semibold mb-4 text-center">Boost Your Hostel</h2>
         {message && (
           <p className="text-center mb-4 text-green-600">{message}</p>
         )}
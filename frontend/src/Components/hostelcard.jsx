@@ -14,10 +14,8 @@ export default function HostelCard({ hostel }) {
   const [wishlistLoading, setWishlistLoading] = useState(false);
 
   const avgRating =
-    hostel.reviews?.length > 0
-      ? (
-          hostel.reviews.reduce((sum, r) => sum + r.rating, 0) / hostel.reviews.length
-        ).toFixed(1) + ` (${hostel.reviews.length})`
+    hostel.reviewCount > 0
+      ? hostel.avgRating.toFixed(1) + ` (${hostel.reviewCount})`
       : "N/A";
 
   useEffect(() => {
@@ -105,6 +103,7 @@ export default function HostelCard({ hostel }) {
 
         <div className="mt-auto pt-4 border-t border-gray-700 flex justify-between items-center">
           <Link
+            data-testid="hostel-view-details"
             to={`/hostel/${hostelIdString}`}
             className="text-sm font-medium text-slate-300 hover:text-white"
           >
@@ -70,6 +70,7 @@ export default function Navbar() {
             <>
               {currentUser.role === "admin" && (
                 <NavLink
+                  data-testid="nav-admin"
                   to="/admin"
                   className= {({ isActive }) =>
                     `text-sm font-medium transition ${
@@ -85,6 +86,7 @@ export default function Navbar() {
 
               {currentUser.role === "owner" && (
                 <NavLink
+                  data-testid="nav-owner"
                   to="/owner"
                   className= {({ isActive }) =>
                     `text-sm font-medium transition ${
@@ -100,6 +102,7 @@ export default function Navbar() {
 
               {currentUser.role === "user" && (
                 <NavLink
+                  data-testid="nav-dashboard"
                   to="/dashboard"
                   className= {({ isActive }) =>
                     `text-sm font-medium transition ${
@@ -150,6 +153,7 @@ export default function Navbar() {
               </span>
 
               <button
+                data-testid="nav-logout"
                 onClick={logout}
                 className="px-4 py-2 rounded-lg bg-red-700 hover:bg-red-600 text-white"
               >
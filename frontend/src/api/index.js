@@ -4,10 +4,18 @@ const API = axios.create({
   baseURL: process.env.REACT_APP_API_URL || "http://localhost:5000/api",
 });
 
+// Count in-flight requests so end-to-end tests can wait until the page settles
+window.__pendingRequests = 0;
+
+const requestFinished = () => {
+  window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+};
+
 
 // 1. Automatically attach token to every request
 API.interceptors.request.use(
   (config) => {
+    window.__pendingRequests += 1;
     const token = localStorage.getItem("token");
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
@@ -21,9 +29,13 @@ API.interceptors.request.use(
 // 2. Handle expired/invalid tokens properly
 
 API.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    requestFinished();
+    return response;
+  },
 
   (error) => {
+    requestFinished();
     const status = error.response?.status;
     const token = localStorage.getItem("token");
 
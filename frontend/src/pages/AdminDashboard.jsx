@@ -1,13 +1,11 @@
 import { useState, useEffect } from "react";
 import { Navigate } from "react-router-dom";
 import { useAuth } from "../Components/AuthContext";
-import { getPlainUserCount, getOwnerCount } from "../services/userService";
-import { getSalesStats } from "../services/salesService";
+import { getAdminSummary } from "../services/adminService";
 import AdminDashboardSkeleton from "../Components/adminDashboardSkeleton";
 
 // HOSTEL ACTIONS
 import {
-  getAllHostels,
   approveHostel,
   rejectHostel,
   approveBoost,
@@ -25,10 +23,8 @@ import {
 
 export default function AdminDashboard() {
   const { currentUser } = useAuth();
-  const [hostels, setHostels] = useState([]);
-  const [users, setUsers] = useState({ users: 0, owners: 0 });
+  const [summary, setSummary] = useState(null);
   const [loading, setLoading] = useState(true);
-  const [salesStats, setSalesStats] = useState(null);
 
 
   // FAQ STATES
@@ -39,29 +35,28 @@ export default function AdminDashboard() {
   const [confirmDeleteId, setConfirmDeleteId] = useState(null);
 
   // ---------------- LOAD DATA ----------------
+  // Stats, queues and recent reviews come from one summary request; after
+  // any action it is fetched again (the write has invalidated its cache)
+  const loadSummary = async () => {
+    try {
+      setSummary(await getAdminSummary());
+    } catch (error) {
+      console.error(error);
+    }
+  };
+
   useEffect(() => {
     const fetchData = async () => {
       try {
         setLoading(true);
 
-        const hostelsData = await getAllHostels();
-        const [plainCount, ownerCount] = await Promise.all([
-          getPlainUserCount(),
-          getOwnerCount(),
+        const [summaryData, faqData] = await Promise.all([
+          getAdminSummary(),
+          getFAQs(),
         ]);
 
-        setHostels(hostelsData);
-
-        // placeholder numbers
-        setUsers({ users: plainCount, owners: ownerCount });
-
-        const faqData = await getFAQs();
+        setSummary(summaryData);
         setFaqs(Array.isArray(faqData) ? faqData : []);
-
-        const stats = await getSalesStats();
-        setSalesStats(stats);
-
-
       } catch (error) {
         console.error(error);
       } finally {
@@ -76,31 +71,19 @@ export default function AdminDashboard() {
   if (!currentUser) return <Navigate to="/login" replace />;
   if (currentUser.role !== "admin") return <Navigate to="/" replace />;
 
-  // ---------------- FILTER PENDING HOSTELS ----------------
-  const pendingHostels = hostels.filter((h) => {
-    const status = h.status?.toLowerCase();
-    return !status || status === "pending";
-  });
-
-  // ---------------- RECENT REVIEWS ----------------
-  const recentReviews = hostels
-    .flatMap((h) =>
-      (h.reviews || []).map((r) => ({
-        ...r,
-        hostelName: h.name,
-        hostelId: h._id,
-        reviewId: r._id,
-      }))
-    )
-    .slice(0, 5);
+  // ---------------- SUMMARY ----------------
+  const counts = summary?.hostels || { total: 0, pending: 0, pendingBoosts: 0, activeBoosts: 0 };
+  const users = summary?.users || { users: 0, owners: 0 };
+  const salesStats = summary?.sales || null;
+  const pendingHostels = summary?.pendingHostels || [];
+  const boostQueue = summary?.boostQueue || [];
+  const recentReviews = summary?.recentReviews || [];
 
   // ---------------- HOSTEL ACTIONS ----------------
   const handleApproveHostel = async (id) => {
     try {
       await approveHostel(id);
-      setHostels((prev) =>
-        prev.map((h) => (h._id === id ? { ...h, status: "approved" } : h))
-      );
+      await loadSummary();
     } catch (e) {
       console.error(e);
       alert("Failed to approve hostel");
@@ -111,7 +94,7 @@ export default function AdminDashboard() {
     if (!window.confirm("Reject this hostel?")) return;
     try {
       await rejectHostel(id);
-      setHostels((prev) => prev.filter((h) => h._id !== id));
+      await loadSummary();
     } catch (e) {
       console.error(e);
       alert("Failed to reject hostel");
@@ -121,45 +104,8 @@ export default function AdminDashboard() {
   // ---------------- BOOST ACTIONS ----------------
   const handleApproveBoost = async (id) => {
     try {
-      // backend returns updated hostel or updated boost object
-      const updatedBoost = await approveBoost(id);
-
-      setHostels((prev) =>
-        prev.map((h) =>
-          h._id === id
-            ? {
-                ...h,
-                boost: {
-                  ...h.boost,
-                  ...updatedBoost.boost, // <-- FIX: replace with the latest backend boost object
-                },
-              }
-            : h
-        )
-      );
-
-      const duration = updatedBoost.boost?.durationDays || 0;
-      let price = 0;
-      if (duration === 7) price = 500;
-      else if (duration === 15) price = 900;
-      else if (duration === 30) price = 1500;
-
-      setSalesStats((prev) => {
-        if (!prev) return prev;
-
-        return {
-          ...prev,
-          totalBoostsSold: prev.totalBoostsSold + 1,
-          totalRevenue: prev.totalRevenue + price,
-          monthlyRevenue: [
-            {
-              month: prev.monthlyRevenue[0].month,
-              revenue: (prev.monthlyRevenue[0] ? prev.monthlyRevenue[0].revenue : 0) + price,
-            },
-          ],
-        };
-      });
-
+      await approveBoost(id);
+      await loadSummary();
     } catch (e) {
       console.error(e);
       alert("Failed to approve boost");
@@ -171,20 +117,7 @@ export default function AdminDashboard() {
     if (!window.confirm("Remove this boost request?")) return;
     try {
       await rejectBoost(id);
-      setHostels((prev) =>
-        prev.map((h) =>
-          h._id === id
-            ? {
-                ...h,
-                boost: {
-                  ...h.boost,
-                  status: "rejected",
-                  isActive: false,
-                },
-              }
-            : h
-        )
-      );
+      await loadSummary();
     } catch (e) {
       console.error(e);
       alert("Failed to remove boost");
@@ -195,13 +128,7 @@ export default function AdminDashboard() {
   const handleRemoveReview = async (hostelId, reviewId) => {
     try {
       await deleteReview(hostelId, reviewId);
-      setHostels((prev) =>
-        prev.map((h) =>
-          h._id === hostelId
-            ? { ...h, reviews: (h.reviews || []).filter((r) => r._id !== reviewId) }
-            : h
-        )
-      );
+      await loadSummary();
     } catch (e) {
       console.error(e);
       alert("Failed to remove review");
@@ -264,15 +191,15 @@ export default function AdminDashboard() {
       <div className="max-w-6xl mx-auto space-y-8">
         {/* ------------ STATS ------------- */}
         <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
-          <StatCard value={hostels.length} label="Total Hostels" />
+          <StatCard value={counts.total} label="Total Hostels" />
           <StatCard value={users.users} label="Total Users" />
           <StatCard value={users.owners} label="Total Owners" />
         </div>
 
         {/* ------------ PENDING HOSTELS ------------- */}
-        <div className="bg-gray-800 p-6 rounded-lg border border-gray-700">
+        <div data-testid="pending-hostels" className="bg-gray-800 p-6 rounded-lg border border-gray-700">
           <h3 className="text-2xl font-bold mb-4">
-            Pending Hostel Listings ({pendingHostels.length})
+            Pending Hostel Listings ({counts.pending})
           </h3>
 
           <div className="space-y-3">
@@ -288,6 +215,7 @@ export default function AdminDashboard() {
 
                   <div>
                     <button
+                      data-testid="approve-hostel"
                       onClick={() => handleApproveHostel(h._id)}
                       className="px-3 py-1 bg-green-600 rounded"
                     >
@@ -295,6 +223,7 @@ export default function AdminDashboard() {
                     </button>
 
                     <button
+                      data-testid="reject-hostel"
                       onClick={() => handleRejectHostel(h._id)}
                       className="ml-2 px-3 py-1 bg-red-600 rounded"
                     >
@@ -308,17 +237,16 @@ export default function AdminDashboard() {
         </div>
 
         {/* ------------ BOOST REQUESTS ------------- */}
-        <div className="bg-gray-800 p-6 rounded-lg border border-gray-700">
+        <div data-testid="boost-requests" className="bg-gray-800 p-6 rounded-lg border border-gray-700">
           <h3 className="text-2xl font-bold mb-4">
-            Boost Requests ({hostels.filter((h) => h.boost.isActive).length})
+            Boost Requests ({counts.pendingBoosts + counts.activeBoosts})
           </h3>
 
           <div className="space-y-3">
-            {hostels.filter((h) => h.boost.isActive).length === 0 ? (
+            {boostQueue.length === 0 ? (
               <p className="text-gray-400">No boost activity.</p>
             ) : (
-              hostels
-                .filter((h) => h.boost.isActive)
+              boostQueue
                 .map((h) => (
                   <div
                     key={h._id}
@@ -358,6 +286,7 @@ export default function AdminDashboard() {
                     <div className="flex gap-2">
                       {h.boost.status === "pending" && (
                         <button
+                          data-testid="approve-boost"
                           onClick={() => handleApproveBoost(h._id)}
                           className="px-3 py-1 bg-green-600 rounded"
                         >
@@ -366,6 +295,7 @@ export default function AdminDashboard() {
                       )}
 
                       <button
+                        data-testid="remove-boost"
                         onClick={() => handleRejectBoost(h._id)}
                         className="px-3 py-1 bg-red-600 rounded"
                       >
@@ -379,7 +309,7 @@ export default function AdminDashboard() {
         </div>
 
         {/* ------------ SALES STATS ------------- */}
-        <div className="bg-gray-800 p-6 rounded-lg border border-gray-700">
+        <div data-testid="sales-stats" className="bg-gray-800 p-6 rounded-lg border border-gray-700">
           <h3 className="text-2xl font-bold mb-4">Sales Statistics</h3>
           {!salesStats ? (
             <p className="text-gray-400">Loading sales stats...</p>
@@ -412,7 +342,7 @@ export default function AdminDashboard() {
 
 
         {/* ------------ RECENT REVIEWS ------------- */}
-        <div className="bg-gray-800 p-6 rounded-lg border border-gray-700">
+        <div data-testid="recent-ratings" className="bg-gray-800 p-6 rounded-lg border border-gray-700">
           <h3 className="text-2xl font-bold mb-4">Recent Ratings</h3>
 
           <div className="space-y-3">
@@ -421,7 +351,7 @@ export default function AdminDashboard() {
             ) : (
               recentReviews.map((r) => (
                 <div
-                  key={r.reviewId}
+                  key={r._id}
                   className="flex justify-between items-center p-3 bg-gray-700 rounded-lg"
                 >
                   <p className="text-gray-300">
@@ -429,7 +359,8 @@ export default function AdminDashboard() {
                   </p>
 
                   <button
-                    onClick={() => handleRemoveReview(r.hostelId, r.reviewId)}
+                    data-testid="remove-review"
+                    onClick={() => handleRemoveReview(r.hostelId, r._id)}
                     className="px-3 py-1 bg-red-600 rounded"
                   >
                     Remove
@@ -441,7 +372,7 @@ export default function AdminDashboard() {
         </div>
 
         {/* ------------ FAQ MANAGEMENT ------------- */}
-        <div className="bg-gray-800 p-6 rounded-lg border border-gray-700">
+        <div data-testid="admin-faqs" className="bg-gray-800 p-6 rounded-lg border border-gray-700">
           <h3 className="text-2xl font-bold mb-4">Manage FAQs</h3>
 
           {/* Add/Edit Form */}
@@ -550,7 +481,7 @@ export default function AdminDashboard() {
 
 function StatCard({ value, label }) {
   return (
-    <div className="bg-gray-800 border border-gray-700 p-6 rounded-lg text-center">
+    <div data-testid="stat-card" className="bg-gray-800 border border-gray-700 p-6 rounded-lg text-center">
       <p className="text-3xl font-bold">{value}</p>
       <p className="text-gray-400">{label}</p>
     </div>
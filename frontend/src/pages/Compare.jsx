@@ -1,90 +1,127 @@
 import { useEffect, useState, useRef } from "react";
 import { useNavigate } from "react-router-dom";
-import { getHostels } from "../services/hostelService";
+import { getHostelsPage, searchHostels } from "../services/hostelService";
 
-export default function Compare() {
-  const navigate = useNavigate();
-  const [hostels, setHostels] = useState([]);
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState("");
-
-  const [selected1, setSelected1] = useState(null);
-  const [selected2, setSelected2] = useState(null);
+// A page of the listing, or of ranked search results when there is a query
+const fetchHostels = (query, cursor) => {
+  const q = query.trim();
+  return q ? searchHostels(q, { cursor }) : getHostelsPage({ cursor });
+};
 
-  const [search1, setSearch1] = useState("");
-  const [search2, setSearch2] = useState("");
+// Hostel selector: the first page of the listing, or ranked search results
+// once the user types, with more loaded on demand. Nothing is fetched until
+// the dropdown is opened.
+function HostelPicker({ label, selected, onSelect, excludeId }) {
+  const [query, setQuery] = useState("");
+  const [open, setOpen] = useState(false);
+  const [results, setResults] = useState([]);
+  const [cursor, setCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const ref = useRef();
 
-  const [dropdown1Open, setDropdown1Open] = useState(false);
-  const [dropdown2Open, setDropdown2Open] = useState(false);
-
-  const ref1 = useRef();
-  const ref2 = useRef();
-
-  // ------------------------------------------------ LOAD ALL HOSTELS
+  // ------------------------------------------------ FIRST PAGE (waits for a pause in typing)
   useEffect(() => {
-    const loadHostels = async () => {
+    if (!open) return;
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      setLoading(true);
       try {
-        const data = await getHostels();
-        setHostels(data);
-      } catch {
-        setError("Failed to load hostels");
+        const page = await fetchHostels(query);
+        if (cancelled) return;
+        setResults(page.hostels);
+        setCursor(page.nextCursor);
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
+    }, query.trim() ? 300 : 0);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
     };
-    loadHostels();
-  }, []);
+  }, [open, query]);
+
+  const loadMore = async () => {
+    if (!cursor || loading) return;
+    setLoading(true);
+    try {
+      const page = await fetchHostels(query, cursor);
+      setResults((prev) => [...prev, ...page.hostels]);
+      setCursor(page.nextCursor);
+    } finally {
+      setLoading(false);
+    }
+  };
 
   // ------------------------------------------------ CLOSE DROPDOWN ON OUTSIDE CLICK
   useEffect(() => {
     const handleClickOutside = (e) => {
-      if (ref1.current && !ref1.current.contains(e.target)) setDropdown1Open(false);
-      if (ref2.current && !ref2.current.contains(e.target)) setDropdown2Open(false);
+      if (ref.current && !ref.current.contains(e.target)) setOpen(false);
     };
     document.addEventListener("mousedown", handleClickOutside);
     return () => document.removeEventListener("mousedown", handleClickOutside);
   }, []);
 
-  const calcAvgRating = (reviews) => {
-    if (!reviews || reviews.length === 0) return "N/A";
-    const total = reviews.reduce((s, r) => s + (r.rating || 0), 0);
-    return (total / reviews.length).toFixed(1);
-  };
+  const options = results.filter((h) => h._id !== excludeId);
 
-  const filtered1 = hostels.filter(
-    (h) =>
-      h.name.toLowerCase().includes(search1.toLowerCase()) &&
-      (!selected2 || h._id !== selected2._id)
+  return (
+    <div ref={ref} className="relative">
+      <label className="text-white font-semibold mb-2 block">{label}</label>
+      <input
+        type="text"
+        placeholder="Search hostel..."
+        value={selected ? selected.name : query}
+        onFocus={() => setOpen(true)}
+        onChange={(e) => {
+          onSelect(null);
+          setQuery(e.target.value);
+          setOpen(true);
+        }}
+        className="w-full bg-gray-800 text-white px-3 py-2 rounded focus:outline-none focus:ring-2 focus:ring-indigo-600 cursor-pointer"
+      />
+      {open && (
+        <div className="absolute z-50 w-full max-h-48 overflow-y-auto bg-gray-700 mt-1 rounded shadow-lg">
+          {options.map((h) => (
+            <div
+              key={h._id}
+              onClick={() => {
+                onSelect(h);
+                setQuery("");
+                setOpen(false);
+              }}
+              className="px-3 py-2 hover:bg-gray-600 cursor-pointer text-gray-200"
+            >
+              {h.name}
+            </div>
+          ))}
+          {!loading && options.length === 0 && (
+            <p className="px-3 py-2 text-gray-400">No hostels found</p>
+          )}
+          {(loading || cursor) && (
+            <button
+              onClick={loadMore}
+              disabled={loading}
+              className="w-full px-3 py-2 text-left text-indigo-300 hover:bg-gray-600 disabled:opacity-50"
+            >
+              {loading ? "Loading..." : "Load more"}
+            </button>
+          )}
+        </div>
+      )}
+    </div>
   );
+}
 
-  const filtered2 = hostels.filter(
-    (h) =>
-      h.name.toLowerCase().includes(search2.toLowerCase()) &&
-      (!selected1 || h._id !== selected1._id)
-  );
+export default function Compare() {
+  const navigate = useNavigate();
 
-  // ------------------------------------------------ LOADING SCREEN
-  if (loading) {
-    return (
-      <div className="bg-gray-900 min-h-screen flex items-center justify-center p-8">
-        <p className="text-gray-300 text-lg animate-pulse">Loading comparison...</p>
-      </div>
-    );
-  }
+  const [selected1, setSelected1] = useState(null);
+  const [selected2, setSelected2] = useState(null);
 
-  if (error) {
-    return (
-      <div className="bg-gray-900 min-h-screen flex flex-col items-center justify-center p-8">
-        <p className="text-red-400 text-xl mb-4">{error}</p>
-        <button
-          onClick={() => navigate("/hostels")}
-          className="bg-indigo-600 text-white px-6 py-2 rounded-lg hover:bg-indigo-700 transition"
-        >
-          Back to Hostels
-        </button>
-      </div>
-    );
-  }
+  const calcAvgRating = (hostel) => {
+    if (!hostel.reviewCount) return "N/A";
+    return hostel.avgRating.toFixed(1);
+  };
 
   return (
     <div className="bg-gray-900 min-h-screen p-8">
@@ -95,73 +132,18 @@ export default function Compare() {
 
         {/* ------------------------------------------------ HOSTEL SELECTORS */}
         <div className="grid grid-cols-1 md:grid-cols-2 gap-8 mb-10">
-          {/* HOSTEL 1 */}
-          <div ref={ref1} className="relative">
-            <label className="text-white font-semibold mb-2 block">Select Hostel 1</label>
-            <input
-              type="text"
-              placeholder="Search hostel..."
-              value={selected1 ? selected1.name : search1}
-              onFocus={() => setDropdown1Open(true)}
-              onChange={(e) => {
-                setSelected1(null);
-                setSearch1(e.target.value);
-                setDropdown1Open(true);
-              }}
-              className="w-full bg-gray-800 text-white px-3 py-2 rounded focus:outline-none focus:ring-2 focus:ring-indigo-600 cursor-pointer"
-            />
-            {dropdown1Open && (
-              <div className="absolute z-50 w-full max-h-48 overflow-y-auto bg-gray-700 mt-1 rounded shadow-lg">
-                {filtered1.map((h) => (
-                  <div
-                    key={h._id}
-                    onClick={() => {
-                      setSelected1(h);
-                      setSearch1("");
-                      setDropdown1Open(false);
-                    }}
-                    className="px-3 py-2 hover:bg-gray-600 cursor-pointer text-gray-200"
-                  >
-                    {h.name}
-                  </div>
-                ))}
-              </div>
-            )}
-          </div>
-
-          {/* HOSTEL 2 */}
-          <div ref={ref2} className="relative">
-            <label className="text-white font-semibold mb-2 block">Select Hostel 2</label>
-            <input
-              type="text"
-              placeholder="Search hostel..."
-              value={selected2 ? selected2.name : search2}
-              onFocus={() => setDropdown2Open(true)}
-              onChange={(e) => {
-                setSelected2(null);
-                setSearch2(e.target.value);
-                setDropdown2Open(true);
-              }}
-              className="w-full bg-gray-800 text-white px-3 py-2 rounded focus:outline-none focus:ring-2 focus:ring-indigo-600 cursor-pointer"
-            />
-            {dropdown2Open && (
-              <div className="absolute z-50 w-full max-h-48 overflow-y-auto bg-gray-700 mt-1 rounded shadow-lg">
-                {filtered2.map((h) => (
-                  <div
-                    key={h._id}
-                    onClick={() => {
-                      setSelected2(h);
-                      setSearch2("");
-                      setDropdown2Open(false);
-                    }}
-                    className="px-3 py-2 hover:bg-gray-600 cursor-pointer text-gray-200"
-                  >
-                    {h.name}
-                  </div>
-                ))}
-              </div>
-            )}
-          </div>
+          <HostelPicker
+            label="Select Hostel 1"
+            selected={selected1}
+            onSelect={setSelected1}
+            excludeId={selected2?._id}
+          />
+          <HostelPicker
+            label="Select Hostel 2"
+            selected={selected2}
+            onSelect={setSelected2}
+            excludeId={selected1?._id}
+          />
         </div>
 
         {/* ------------------------------------------------ ONE HOSTEL SELECTED */}
@@ -270,8 +252,8 @@ export default function Compare() {
                 {/* RATING */}
                 <tr className="animate-row">
                   <td className="p-4">Rating</td>
-                  <td className="p-4 text-center text-white">⭐ {calcAvgRating(selected1.reviews)}</td>
-                  <td className="p-4 text-center text-white">⭐ {calcAvgRating(selected2.reviews)}</td>
+                  <td className="p-4 text-center text-white">⭐ {calcAvgRating(selected1)}</td>
+                  <td className="p-4 text-center text-white">⭐ {calcAvgRating(selected2)}</td>
                 </tr>
 
                 {/* AREA */}
@@ -13,6 +13,7 @@ import {
   getMyHostels, 
   deleteHostel, 
   answerQuestion,
+  getOwnerQuestions,
   getOwnerVisitRequests, 
   approveVisit, 
   ownerCancelVisit 
@@ -34,6 +35,11 @@ export default function OwnerDashboard() {
   const [showBoostModal, setShowBoostModal] = useState(false);
   const [boostHostelId, setBoostHostelId] = useState(null);
 
+  // Unanswered questions inbox, one page at a time
+  const [pendingQuestions, setPendingQuestions] = useState([]);
+  const [pendingCount, setPendingCount] = useState(0);
+  const [questionsCursor, setQuestionsCursor] = useState(null);
+
   const [ownerVisits, setOwnerVisits] = useState([]);
   const [visitsLoading, setVisitsLoading] = useState(true);
 
@@ -52,6 +58,16 @@ export default function OwnerDashboard() {
     fetchHostels();   
   }, []);
 
+  useEffect(() => {
+    const fetchQuestions = async () => {
+      const inbox = await getOwnerQuestions();
+      setPendingQuestions(inbox.questions);
+      setPendingCount(inbox.count);
+      setQuestionsCursor(inbox.nextCursor);
+    };
+    fetchQuestions();
+  }, []);
+
 useEffect(() => {
   const fetchOwnerVisits = async () => {
     try {
@@ -80,16 +96,12 @@ useEffect(() => {
     return <Navigate to="/login" replace />;
   }
 
-  const unansweredQuestions = hostels.flatMap((h) =>
-    (h.questions || [])
-      .filter((q) => !q.answer)
-      .map((q) => ({
-        ...q,
-        hostelName: h.name,
-        hostelId: h._id || h.id,
-        questionId: q._id || q.id,
-      }))
-  );
+  const loadMoreQuestions = async () => {
+    const inbox = await getOwnerQuestions({ cursor: questionsCursor });
+    setPendingQuestions((prev) => prev.concat(inbox.questions));
+    setPendingCount(inbox.count);
+    setQuestionsCursor(inbox.nextCursor);
+  };
 
   const handleDeleteHostel = async (id) => {
     if (!window.confirm("Are you sure you want to delete this hostel?")) return;
@@ -107,8 +119,8 @@ useEffect(() => {
     try {
       const result = await answerQuestion(hostelId, questionId, text);
       if (result.success) {
-        const data = await getMyHostels();
-        setHostels(data);
+        setPendingQuestions((prev) => prev.filter((q) => String(q.questionId) !== String(questionId)));
+        setPendingCount((prev) => Math.max(prev - 1, 0));
       }
     } catch (error) {
       console.error("Error answering question:", error);
@@ -161,7 +173,7 @@ useEffect(() => {
 
         {/* --- My Hostel Listings --- */}
         <div className="bg-gray-800 p-6 rounded-lg shadow-lg border border-gray-700">
-          <h3 className="text-2xl font-bold mb-4">My Hostel Listings</h3>
+          <h3 data-testid="owner-hostels-title" className="text-2xl font-bold mb-4">My Hostel Listings</h3>
 
           <div className="space-y-4">
             {hostels.length === 0 && (
@@ -204,6 +216,7 @@ useEffect(() => {
 
                   <div className="flex flex-wrap items-center space-x-2 gap-2">
                     <button
+                      data-testid="hostel-update"
                       onClick={() => {
                         setEditHostel(h);
                         setShowEditModal(true);
@@ -223,6 +236,7 @@ useEffect(() => {
                     {/* Boost Button */}
                     {h.status === "approved" && !h.boost.isActive && (
                       <button
+                        data-testid="hostel-boost"
                         onClick={() => {
                           setBoostHostelId(hostelId);
                           setShowBoostModal(true);
@@ -235,6 +249,7 @@ useEffect(() => {
 
                     {h.status === "approved" && (
                       <button
+                        data-testid="hostel-manage-faqs"
                         onClick={() => {
                           setFaqHostelId(hostelId);
                           setShowFaqModal(true);
@@ -251,6 +266,7 @@ useEffect(() => {
           </div>
 
           <button
+            data-testid="add-hostel"
             onClick={() => setShowAddModal(true)}
             className="mt-4 px-4 py-2 bg-blue-600 rounded-lg hover:bg-blue-700"
           >
@@ -297,13 +313,15 @@ useEffect(() => {
 
         {/* --- Pending Questions Section --- */}
         <div className="bg-gray-800 p-6 rounded-lg shadow-lg border border-gray-700">
-          <h3 className="text-2xl font-bold mb-4">Pending Questions</h3>
+          <h3 data-testid="pending-questions-title" className="text-2xl font-bold mb-4">
+            Pending Questions{pendingCount > 0 && ` (${pendingCount})`}
+          </h3>
 
-          {unansweredQuestions.length === 0 ? (
+          {pendingQuestions.length === 0 ? (
             <p className="text-gray-400">No unanswered questions at the moment.</p>
           ) : (
             <div className="space-y-4">
-              {unansweredQuestions.map((q) => (
+              {pendingQuestions.map((q) => (
                 <PendingQuestionCard
                   key={q.questionId}
                   q={q}
@@ -312,11 +330,21 @@ useEffect(() => {
               ))}
             </div>
           )}
+
+          {questionsCursor && (
+            <button
+              data-testid="load-more-questions"
+              onClick={loadMoreQuestions}
+              className="mt-4 w-full py-2 bg-gray-700 hover:bg-gray-600 rounded-lg text-gray-300 transition"
+            >
+              Load more questions
+            </button>
+          )}
         </div>
 
           {/* --- Scheduled Visits Section --- */}
         <div className="bg-gray-800 p-6 rounded-lg shadow-lg border border-gray-700 mt-8">
-          <h3 className="text-2xl font-bold mb-4">Scheduled Visits</h3>
+          <h3 data-testid="owner-visits-title" className="text-2xl font-bold mb-4">Scheduled Visits</h3>
 
           {visitsLoading ? (
             <p className="text-gray-400">Loading visits...</p>
@@ -353,6 +381,7 @@ useEffect(() => {
                   {v.status === "pending" && (
                     <div className="flex gap-2 mt-3">
                       <button
+                        data-testid="visit-approve"
                         onClick={() => handleApprove(v._id)}
                         className="px-3 py-1 bg-green-600 hover:bg-green-700 rounded"
                       >
@@ -392,6 +421,7 @@ function PendingQuestionCard({ q, submitAnswer }) {
 
       <div className="flex items-center">
         <textarea
+          data-testid="answer-text"
           rows="1"
           className="w-full p-2 border border-gray-600 bg-gray-800 text-white rounded-md mr-2"
           placeholder="Your answer..."
@@ -400,6 +430,7 @@ function PendingQuestionCard({ q, submitAnswer }) {
         />
 
         <button
+          data-testid="answer-submit"
           className="px-4 py-2 bg-slate-600 rounded-lg hover:bg-slate-700 flex-shrink-0"
           onClick={async () => {
             if (text.trim() !== "") {
@@ -126,7 +126,7 @@ export default function UserDashboard() {
 
         {/* Header */}
         <div className="flex justify-between items-center mb-10">
-          <h1 className="text-4xl font-bold">User Dashboard</h1>
+          <h1 data-testid="dashboard-title" className="text-4xl font-bold">User Dashboard</h1>
 
           <button
             onClick={logout}
@@ -140,15 +140,15 @@ export default function UserDashboard() {
         {/* Profile */}
         <div className="bg-gray-800 p-6 rounded-xl shadow-lg border border-gray-700 mb-10 
                         transition-all duration-300 hover:shadow-2xl hover:scale-[1.01]">
-          <h2 className="text-2xl font-semibold mb-3">Your Profile</h2>
+          <h2 data-testid="profile-title" className="text-2xl font-semibold mb-3">Your Profile</h2>
           <p className="text-gray-300"><strong>Name:</strong> {currentUser.name}</p>
-          <p className="text-gray-300"><strong>Email:</strong> {currentUser.email}</p>
+          <p data-testid="profile-email" className="text-gray-300"><strong>Email:</strong> {currentUser.email}</p>
           <p className="text-gray-300"><strong>Role:</strong> {currentUser.role}</p>
         </div>
 
         {/* Wishlist */}
         <div className="bg-gray-800 p-6 rounded-xl shadow-lg border border-gray-700 mb-10">
-          <h2 className="text-2xl font-semibold mb-4">My Wishlist</h2>
+          <h2 data-testid="wishlist-title" className="text-2xl font-semibold mb-4">My Wishlist</h2>
 
           {wishlist.length === 0 ? (
             <p className="text-gray-400">You haven't saved any hostels yet.</p>
@@ -210,7 +210,7 @@ export default function UserDashboard() {
               {/* Reviews */}
               {reviews.length > 0 && (
                 <div>
-                  <h3 className="text-xl font-semibold mb-2">Your Reviews</h3>
+                  <h3 data-testid="reviews-title" className="text-xl font-semibold mb-2">Your Reviews</h3>
                   <ul className="space-y-3">
                     {reviews.map((rev) => (
                       <li
@@ -230,7 +230,7 @@ export default function UserDashboard() {
               {/* Questions */}
               {questions.length > 0 && (
                 <div>
-                  <h3 className="text-xl font-semibold mb-2">Your Questions</h3>
+                  <h3 data-testid="questions-title" className="text-xl font-semibold mb-2">Your Questions</h3>
                   <ul className="space-y-3">
                     {questions.map((q) => (
                       <li
@@ -257,7 +257,7 @@ export default function UserDashboard() {
 
         {/* Visits */}
         <div className="bg-gray-800 p-6 rounded-xl shadow-lg border border-gray-700 mb-10 mt-10">
-          <h2 className="text-2xl font-semibold mb-4">My Visits</h2>
+          <h2 data-testid="visits-title" className="text-2xl font-semibold mb-4">My Visits</h2>
 
           {visitsLoading ? (
             <p className="text-gray-400">Loading visits...</p>
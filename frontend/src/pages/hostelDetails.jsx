@@ -1,7 +1,16 @@
 import { useParams } from "react-router-dom";
 import { useState, useEffect } from "react";
 import { useAuth } from "../Components/AuthContext";
-import { getHostelById, addQuestion, addReview, incrementViewCount, bookVisit } from "../services/hostelService";
+import {
+  getHostelById,
+  getReviews,
+  getMyReview,
+  getHostelQuestions,
+  addQuestion,
+  addReview,
+  incrementViewCount,
+  bookVisit,
+} from "../services/hostelService";
 
 export default function HostelDetail() {
   const { id } = useParams();
@@ -11,7 +20,12 @@ export default function HostelDetail() {
   const [loading, setLoading] = useState(true);
   const [selectedTab, setSelectedTab] = useState("reviews");
   const [reviews, setReviews] = useState([]);
+  const [reviewsCursor, setReviewsCursor] = useState(null);
+  const [loadingReviews, setLoadingReviews] = useState(false);
+  const [hasReviewed, setHasReviewed] = useState(false);
   const [questions, setQuestions] = useState([]);
+  const [questionsCursor, setQuestionsCursor] = useState(null);
+  const [loadingQuestions, setLoadingQuestions] = useState(false);
   const [faqs, setFaqs] = useState([]);
   const [showVisitModal, setShowVisitModal] = useState(false);
   const [visitDate, setVisitDate] = useState("");
@@ -27,11 +41,17 @@ export default function HostelDetail() {
           return;
         }
 
-        const hostelData = await getHostelById(id);
+        const [hostelData, reviewPage, questionPage] = await Promise.all([
+          getHostelById(id),
+          getReviews(id),
+          getHostelQuestions(id),
+        ]);
         if (hostelData) {
           setHostel(hostelData);
-          setReviews(hostelData.reviews || []);
-          setQuestions(hostelData.questions || []);
+          setReviews(reviewPage.reviews);
+          setReviewsCursor(reviewPage.nextCursor);
+          setQuestions(questionPage.questions);
+          setQuestionsCursor(questionPage.nextCursor);
           setFaqs(hostelData.faqs || []);
 
           incrementViewCount(id).catch(err => console.error("Failed to increment views:", err));
@@ -47,6 +67,20 @@ export default function HostelDetail() {
     fetchHostel();
   }, [id]);
 
+  // Reviews are paged, so ask the server rather than search the loaded ones
+  const isReviewer = currentUser?.role === "user";
+  useEffect(() => {
+    setHasReviewed(false);
+    if (!isReviewer || !id || id === "undefined") return;
+    let cancelled = false;
+    getMyReview(id).then((reviewed) => {
+      if (!cancelled) setHasReviewed(reviewed);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [id, isReviewer]);
+
   if (loading) {
     return (
       <div className="bg-gray-900 min-h-screen flex items-center justify-center animate-fadeIn">
@@ -69,35 +103,39 @@ export default function HostelDetail() {
   }
 
   const avgRating =
-    reviews.length > 0
-      ? (reviews.reduce((acc, r) => acc + r.rating, 0) / reviews.length).toFixed(1)
-      : "N/A";
-
-  const userHasReviewed =
-    currentUser && reviews.some((r) => {
-      const userId = typeof r.userId === "object" ? String(r.userId._id || r.userId.id) : String(r.userId);
-      return userId === String(currentUser.id);
-    });
+    hostel.reviewCount > 0 ? hostel.avgRating.toFixed(1) : "N/A";
 
   const handleAddReview = async (rating, text) => {
     try {
       const result = await addReview(id, rating, text);
       if (result.success) {
-        setReviews(result.hostel.reviews || []);
-        setHostel(result.hostel);
+        setReviews((prev) => [result.review, ...prev]);
+        setHostel((prev) => ({ ...prev, ...result.hostel }));
+        setHasReviewed(true);
       }
     } catch (error) {
       console.error("Error adding review:", error);
+      if (error.response?.status === 400) setHasReviewed(await getMyReview(id));
       alert(error.response?.data?.message || "Failed to add review");
     }
   };
 
+  const loadMoreReviews = async () => {
+    setLoadingReviews(true);
+    try {
+      const page = await getReviews(id, { cursor: reviewsCursor });
+      setReviews((prev) => prev.concat(page.reviews));
+      setReviewsCursor(page.nextCursor);
+    } finally {
+      setLoadingReviews(false);
+    }
+  };
+
   const handleAddQuestion = async (text) => {
     try {
       const result = await addQuestion(id, text);
       if (result.success) {
-        setQuestions(result.hostel.questions || []);
-        setHostel(result.hostel);
+        setQuestions((prev) => [result.question, ...prev]);
       }
     } catch (error) {
       console.error("Error adding question:", error);
@@ -105,6 +143,17 @@ export default function HostelDetail() {
     }
   };
 
+  const loadMoreQuestions = async () => {
+    setLoadingQuestions(true);
+    try {
+      const page = await getHostelQuestions(id, { cursor: questionsCursor });
+      setQuestions((prev) => prev.concat(page.questions));
+      setQuestionsCursor(page.nextCursor);
+    } finally {
+      setLoadingQuestions(false);
+    }
+  };
+
   const handleBookVisit = async () => {
     if (!visitDate) return alert("Select a date");
     if (!visitTime) return alert("Select a time");
@@ -152,7 +201,7 @@ export default function HostelDetail() {
               <div className="flex items-center text-lg mt-1">
                 <span className="text-yellow-400">⭐</span>
                 <span className="ml-1 font-semibold">{avgRating}</span>
-                <span className="ml-2 text-gray-400">({reviews.length} reviews)</span>
+                <span className="ml-2 text-gray-400">({hostel.reviewCount || 0} reviews)</span>
               </div>
             </div>
           </div>
@@ -221,6 +270,7 @@ export default function HostelDetail() {
               {/* Visit Button */}
               {currentUser?.role === "user" && (
                 <button
+                  data-testid="book-visit"
                   onClick={() => setShowVisitModal(true)}
                   className="mt-4 w-full bg-indigo-600 hover:bg-indigo-700 py-2 px-4 rounded-lg transition-all duration-300 hover:scale-105 hover-glow"
                 >
@@ -229,7 +279,7 @@ export default function HostelDetail() {
               )}
 
               {!currentUser && (
-                <p className="mt-6 text-center text-sm text-gray-300 p-4 bg-gray-800 rounded-md animate-slideUp">
+                <p data-testid="guest-login-prompt" className="mt-6 text-center text-sm text-gray-300 p-4 bg-gray-800 rounded-md animate-slideUp">
                   Please log in to review or ask questions.
                 </p>
               )}
@@ -242,6 +292,7 @@ export default function HostelDetail() {
               <nav className="-mb-px flex space-x-8">
                 {["reviews", "questions", "faqs"].map((tab) => (
                   <button
+                    data-testid={`tab-${tab}`}
                     key={tab}
                     className={`py-4 px-1 border-b-2 font-medium transition-all duration-300 hover:scale-105 ${
                       selectedTab === tab
@@ -259,7 +310,7 @@ export default function HostelDetail() {
             {/* Reviews */}
             {selectedTab === "reviews" && (
               <div className="py-6">
-                {currentUser?.role === "user" && !userHasReviewed && (
+                {isReviewer && !hasReviewed && (
                   <ReviewForm onSubmit={handleAddReview} />
                 )}
 
@@ -303,6 +354,17 @@ export default function HostelDetail() {
                   ) : (
                     <p className="text-gray-400 mt-4">No reviews yet. Be the first to write one!</p>
                   )}
+
+                  {reviewsCursor && (
+                    <button
+                      data-testid="load-more-reviews"
+                      onClick={loadMoreReviews}
+                      disabled={loadingReviews}
+                      className="w-full py-2 bg-gray-700 hover:bg-gray-600 rounded-lg text-gray-300 transition"
+                    >
+                      {loadingReviews ? "Loading..." : "Load more reviews"}
+                    </button>
+                  )}
                 </div>
               </div>
             )}
@@ -353,6 +415,17 @@ export default function HostelDetail() {
                   ) : (
                     <p className="text-gray-400">No questions asked yet.</p>
                   )}
+
+                  {questionsCursor && (
+                    <button
+                      data-testid="load-more-questions"
+                      onClick={loadMoreQuestions}
+                      disabled={loadingQuestions}
+                      className="w-full py-2 bg-gray-700 hover:bg-gray-600 rounded-lg text-gray-300 transition"
+                    >
+                      {loadingQuestions ? "Loading..." : "Load more questions"}
+                    </button>
+                  )}
                 </div>
               </div>
             )}
@@ -414,6 +487,7 @@ export default function HostelDetail() {
                 </button>
 
                 <button
+                  data-testid="visit-submit"
                   className="px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 transition-all duration-200 active:scale-95"
                   onClick={handleBookVisit}
                 >
@@ -519,6 +593,7 @@ function ReviewForm({ onSubmit }) {
       </div>
 
       <textarea
+        data-testid="review-text"
         rows="3"
         className="w-full p-2 border border-gray-600 bg-gray-800 text-white rounded-md"
         placeholder="Share your experience..."
@@ -527,6 +602,7 @@ function ReviewForm({ onSubmit }) {
       />
 
       <button
+        data-testid="review-submit"
         onClick={() => onSubmit(rating, text)}
         className="mt-2 px-4 py-2 bg-slate-600 text-white rounded-lg hover:bg-slate-700 transition-all duration-300 active:scale-95"
       >
@@ -547,6 +623,7 @@ function QuestionForm({ onSubmit }) {
       <h4 className="text-lg font-semibold mb-2">Ask a Question</h4>
 
       <textarea
+        data-testid="question-text"
         rows="3"
         className="w-full p-2 border border-gray-600 bg-gray-800 text-white rounded-md"
         placeholder="Type your question here..."
@@ -555,6 +632,7 @@ function QuestionForm({ onSubmit }) {
       />
 
       <button
+        data-testid="question-submit"
         onClick={() => {
           if (text.trim()) {
             onSubmit(text);
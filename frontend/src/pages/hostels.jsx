@@ -1,11 +1,14 @@
 import { useEffect, useRef, useState } from "react";
 import HostelCard from "../Components/hostelcard";
-import { getHostels } from "../services/hostelService";
+import { getHostelsPage, searchHostels, getHostelFacets } from "../services/hostelService";
 
 export default function Hostels() {
-  const [hostels, setHostels] = useState([]);
-  const [filteredHostels, setFilteredHostels] = useState([]);
+  const [hostels, setHostels] = useState([]); // pages loaded so far, already filtered
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [appliedFilters, setAppliedFilters] = useState({}); // what the loaded pages match
+  const listingRequest = useRef(0);
 
   // FILTER STATES
   const [gender, setGender] = useState("");
@@ -19,6 +22,7 @@ export default function Hostels() {
   // SEARCH STATES
   const [searchText, setSearchText] = useState("");
   const [searchResults, setSearchResults] = useState([]);
+  const [searchCursor, setSearchCursor] = useState(null);
   const [showSuggestions, setShowSuggestions] = useState(false);
   const [suggestions, setSuggestions] = useState([]);
   const [highlightIndex, setHighlightIndex] = useState(-1);
@@ -45,30 +49,52 @@ export default function Hostels() {
   const uniInputRef = useRef(null);
   const uniSuggestionsRef = useRef(null);
 
+  // Option -> hostel count, from the facets endpoint
+  const [facetCounts, setFacetCounts] = useState({ areas: {}, universities: {}, gender: {}, profession: {} });
+  const [matchCount, setMatchCount] = useState(null); // hostels matching the applied filters
+  const facetsRequest = useRef(0);
+
+
+  // AREAS, UNIVERSITIES AND COUNTS FOR THE CURRENT FILTERS (server-side,
+  // same filters as the listing so the counts match the results)
+  const loadFacets = async (filters = {}) => {
+    const request = ++facetsRequest.current;
+    const facets = await getHostelFacets(filters);
+    if (!facets || request !== facetsRequest.current) return;
+
+    const toCounts = (list) => Object.fromEntries(list.map((f) => [f.value, f.count]));
+    setAvailableAreas(facets.areas.map((f) => f.value).sort());
+    setAvailableUnis(facets.universities.map((f) => f.value).sort());
+    setFacetCounts({
+      areas: toCounts(facets.areas),
+      universities: toCounts(facets.universities),
+      gender: toCounts(facets.gender),
+      profession: toCounts(facets.profession),
+    });
+    setMatchCount(facets.total);
+  };
+
+  const withCount = (group, value) =>
+    facetCounts[group][value] !== undefined ? ` (${facetCounts[group][value]})` : "";
+
+  // FIRST PAGE FOR A SET OF FILTERS (starts over from the top of the listing)
+  const loadListing = async (filters = {}) => {
+    const request = ++listingRequest.current;
+    const page = await getHostelsPage(filters);
+    // Ignore a slower response to filters that have since changed
+    if (request !== listingRequest.current) return;
+    setHostels(page.hostels);
+    setNextCursor(page.nextCursor);
+    setAppliedFilters(filters);
+  };
 
-  // LOAD HOSTELS INITIALLY
+  // LOAD FIRST PAGE OF HOSTELS
   useEffect(() => {
     (async () => {
       try {
         setLoading(true);
-        const data = await getHostels();
-        setHostels(data);
-        setFilteredHostels(data);
-
-        // Extract unique areas
-        const uniqueAreas = [
-          ...new Set(
-            data.map((h) => h.area).filter((a) => typeof a === "string")
-          ),
-        ].sort();
-        
-        // Extract universities (all hostels have nearbyUniversities: [])
-        const allUnis = data.flatMap(h => h.nearbyUniversities || []);
-        const uniqueUnis = [...new Set(allUnis)].sort();
-        setAvailableUnis(uniqueUnis);
-
-
-        setAvailableAreas(uniqueAreas);
+        await loadListing();
+        loadFacets();
       } catch (err) {
         console.error(err);
       } finally {
@@ -77,40 +103,48 @@ export default function Hostels() {
     })();
   }, []);
 
-  // CALCULATE AVG RATING
-  const calcRating = (reviews) => {
-    if (!Array.isArray(reviews) || reviews.length === 0) return 0;
-    const total = reviews.reduce((sum, r) => sum + Number(r?.rating || 0), 0);
-    return total / reviews.length;
-  };
-
-  // APPLY FILTERS BUTTON LOGIC
-  const applyFilters = () => {
-    let result = [...hostels];
-
-    if (gender) result = result.filter((h) => h.gender === gender);
-
-    if (selectedAreas.length > 0)
-      result = result.filter((h) => selectedAreas.includes(h.area));
-
-    if (profession) result = result.filter((h) => h.profession === profession);
-
-    // University filter
-    if (selectedUnis.length > 0) {
-      result = result.filter(
-        h =>
-          Array.isArray(h.nearbyUniversities) &&
-          h.nearbyUniversities.some(u => selectedUnis.includes(u))
-      );
+  // LOAD NEXT PAGE (of search results while searching)
+  const loadMore = async () => {
+    if (searchText?.trim()) {
+      if (!searchCursor || loadingMore) return;
+      try {
+        setLoadingMore(true);
+        const page = await searchHostels(searchText.trim(), { cursor: searchCursor, ...appliedFilters });
+        setSearchResults((prev) => [...prev, ...page.hostels]);
+        setSearchCursor(page.nextCursor);
+      } finally {
+        setLoadingMore(false);
+      }
+      return;
     }
 
-    result = result.filter((h) => h.rent >= minRent && h.rent <= maxRent);
-
-    if (minRating) {
-      result = result.filter((h) => calcRating(h.reviews) >= Number(minRating));
+    if (!nextCursor || loadingMore) return;
+    const request = listingRequest.current;
+    try {
+      setLoadingMore(true);
+      const page = await getHostelsPage({ cursor: nextCursor, ...appliedFilters });
+      if (request !== listingRequest.current) return;
+      setHostels((prev) => [...prev, ...page.hostels]);
+      setNextCursor(page.nextCursor);
+    } finally {
+      setLoadingMore(false);
     }
+  };
 
-    setFilteredHostels(result);
+  // APPLY FILTERS BUTTON LOGIC (filtering happens on the server)
+  const applyFilters = () => {
+    const filters = {
+      areas: selectedAreas,
+      universities: selectedUnis,
+      gender,
+      profession,
+      minRating,
+      // The slider ends mean "no limit"
+      minRent: minRent > 0 ? minRent : undefined,
+      maxRent: maxRent < 100000 ? maxRent : undefined,
+    };
+    loadListing(filters);
+    loadFacets(filters);
   };
 
   const resetFilters = () => {
@@ -123,27 +157,37 @@ export default function Hostels() {
     setUniInput("");
     setMinRent(0);
     setMaxRent(100000);
-    setFilteredHostels(hostels);
+    loadListing();
+    loadFacets();
   };
 
-  // LIVE SEARCH (Independent)
+  // LIVE SEARCH (server-side, ranked; waits for a pause in typing)
   useEffect(() => {
-    const q = searchText?.trim()?.toLowerCase() || "";
+    const q = searchText?.trim() || "";
 
     if (!q) {
       setSearchResults([]);
+      setSearchCursor(null);
       setSuggestions([]);
       setShowSuggestions(false);
       return;
     }
 
-    const matches = hostels.filter((h) => h.name?.toLowerCase().includes(q));
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      const page = await searchHostels(q, appliedFilters);
+      if (cancelled) return;
 
-    setSuggestions(matches.slice(0, 6).map((m) => ({ name: m.name, id: m._id })));
+      setSuggestions(page.hostels.slice(0, 6).map((m) => ({ name: m.name, id: m._id })));
+      setSearchResults(page.hostels);
+      setSearchCursor(page.nextCursor);
+    }, 300);
 
-    setSearchResults(matches);
-    setShowSuggestions(true);
-  }, [searchText, hostels]);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchText, appliedFilters]);
 
   const handleSearchKeyDown = (e) => {
     if (!showSuggestions || suggestions.length === 0) return;
@@ -166,19 +210,10 @@ export default function Hostels() {
 
   const handleSuggestionClick = (name) => {
     setSearchText(name || "");
-    const q = name?.toLowerCase() || "";
-
-    const matches = hostels.filter((h) => h.name?.toLowerCase().includes(q));
-    setSearchResults(matches);
     setShowSuggestions(false);
   };
 
   const handleSearchClick = () => {
-    const q = searchText?.toLowerCase() || "";
-
-    const matches = hostels.filter((h) => h.name?.toLowerCase().includes(q));
-
-    setSearchResults(matches);
     setShowSuggestions(false);
   };
 
@@ -289,7 +324,7 @@ export default function Hostels() {
   const shownHostels =
     searchText?.trim()
       ? searchResults.filter((h) => h.status === "approved")
-      : filteredHostels.filter((h) => h.status === "approved");
+      : hostels.filter((h) => h.status === "approved");
 
   if (loading) return <HostelsSkeleton />;
 
@@ -308,10 +343,11 @@ export default function Hostels() {
             value={searchText}
             onChange={(e) => {
               setSearchText(e.target.value || "");
+              setShowSuggestions(Boolean(e.target.value?.trim()));
               setHighlightIndex(-1);
             }}
             onKeyDown={handleSearchKeyDown}
-            placeholder="Search hostels by name..."
+            placeholder="Search hostels by name, area, university or amenity..."
             className="w-full p-3 rounded bg-gray-800 text-white border border-gray-700 placeholder-gray-400 pr-12"
           />
 
@@ -366,8 +402,8 @@ export default function Hostels() {
               className="w-full mt-2 p-2 bg-gray-700 text-white rounded"
             >
               <option value="">All</option>
-              <option value="Male">Male Hostels</option>
-              <option value="Female">Female Hostels</option>
+              <option value="Male">Male Hostels{withCount("gender", "Male")}</option>
+              <option value="Female">Female Hostels{withCount("gender", "Female")}</option>
             </select>
           </div>
 
@@ -438,7 +474,7 @@ export default function Hostels() {
                       i === areaHighlightIndex ? "bg-[#0a1a3a]" : "hover:bg-gray-700"
                     } text-white`}
                   >
-                    {a}
+                    {a}{withCount("areas", a)}
                   </button>
                 ))}
               </div>
@@ -498,7 +534,7 @@ export default function Hostels() {
                       i === uniHighlightIndex ? "bg-[#0a1a3a]" : "hover:bg-gray-700"
                     } text-white`}
                   >
-                    {u}
+                    {u}{withCount("universities", u)}
                   </button>
                 ))}
               </div>
@@ -514,8 +550,8 @@ export default function Hostels() {
               className="w-full mt-2 p-2 bg-gray-700 text-white rounded"
             >
               <option value="">All</option>
-              <option value="Student">Student</option>
-              <option value="Professional">Professional</option>
+              <option value="Student">Student{withCount("profession", "Student")}</option>
+              <option value="Professional">Professional{withCount("profession", "Professional")}</option>
             </select>
           </div>
 
@@ -627,6 +663,11 @@ export default function Hostels() {
 
       {/* RENDER HOSTELS */}
       <div className="max-w-6xl mx-auto">
+        {!searchText?.trim() && matchCount !== null && (
+          <p className="text-gray-400 mb-4">
+            {matchCount} hostel{matchCount === 1 ? "" : "s"} found
+          </p>
+        )}
         {shownHostels.length === 0 ? (
           <p className="text-gray-300 text-center">
             No hostels match your search/filters.
@@ -638,6 +679,19 @@ export default function Hostels() {
             ))}
           </div>
         )}
+
+        {(searchText?.trim() ? searchCursor : nextCursor) && (
+          <div className="flex justify-center mt-8">
+            <button
+              data-testid="load-more"
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-indigo-600 px-6 py-2 rounded text-white disabled:opacity-50"
+            >
+              {loadingMore ? "Loading..." : "Load More"}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
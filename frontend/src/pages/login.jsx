@@ -42,10 +42,11 @@ export default function Login() {
 
         <h2 className="text-3xl font-bold text-white text-center mb-6">Login</h2>
 
-        {error && <p className="text-red-400 text-sm mb-3 text-center">{error}</p>}
+        {error && <p data-testid="login-error" className="text-red-400 text-sm mb-3 text-center">{error}</p>}
 
         <form onSubmit={handleLogin} className="space-y-4">
           <input
+            data-testid="login-email"
             type="email"
             className="w-full p-3 rounded-lg bg-gray-700 text-white border border-gray-600"
             placeholder="Email"
@@ -56,6 +57,7 @@ export default function Login() {
 
           <div className="relative">
             <input
+              data-testid="login-password"
               type={showPassword ? "text" : "password"}
               className="w-full p-3 pr-12 rounded-lg bg-gray-700 text-white border border-gray-600"
               placeholder="Password"
@@ -83,6 +85,7 @@ export default function Login() {
           </div>
 
           <button
+            data-testid="login-submit"
             type="submit"
             className="w-full bg-slate-700 hover:bg-slate-600 transition p-3 rounded-lg text-white"
           >
@@ -54,12 +54,13 @@ export default function Signup() {
         </h2>
 
         {error && (
-          <p className="text-red-400 text-sm mb-3 text-center">{error}</p>
+          <p data-testid="signup-error" className="text-red-400 text-sm mb-3 text-center">{error}</p>
         )}
 
         <form onSubmit={handleSignup} className="space-y-4">
           
           <input
+            data-testid="signup-name"
             type="text"
             className="w-full p-3 rounded-lg bg-gray-700 text-white border border-gray-600"
             placeholder="Full Name"
@@ -69,6 +70,7 @@ export default function Signup() {
           />
 
           <input
+            data-testid="signup-email"
             type="email"
             className="w-full p-3 rounded-lg bg-gray-700 text-white border border-gray-600"
             placeholder="Email"
@@ -78,6 +80,7 @@ export default function Signup() {
           />
 
           <input
+            data-testid="signup-password"
             type="password"
             className="w-full p-3 rounded-lg bg-gray-700 text-white border border-gray-600"
             placeholder="Password (min 6 characters)"
@@ -89,6 +92,7 @@ export default function Signup() {
 
           {/* ROLE SELECTION */}
           <select
+            data-testid="signup-role"
             className="w-full p-3 rounded-lg bg-gray-700 text-white border border-gray-600"
             value={role}
             onChange={(e) => setRole(e.target.value)}
@@ -99,6 +103,7 @@ export default function Signup() {
           </select>
 
           <button
+            data-testid="signup-submit"
             type="submit"
             className="w-full bg-slate-700 hover:bg-slate-600 transition p-3 rounded-lg text-white"
           >
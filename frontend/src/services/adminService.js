@@ -0,0 +1,13 @@
+// src/services/adminService.js
+import API from "../api";
+
+// Dashboard stats, moderation queues and recent reviews in one request (Admin only)
+export const getAdminSummary = async () => {
+  try {
+    const res = await API.get("/admin/summary");
+    return res.data;
+  } catch (err) {
+    console.error("getAdminSummary error:", err);
+    throw err;
+  }
+};
@@ -1,22 +1,47 @@
 import API from "../api";
 
-export const getHostels = async () => {
+// Filter panel state as /hostels and /hostels/facets query parameters
+const filterParams = ({ areas, universities, gender, profession, minRent, maxRent, minRating } = {}) => ({
+  area: areas?.length ? areas.join(",") : undefined,
+  universities: universities?.length ? universities.join(",") : undefined,
+  gender: gender || undefined,
+  profession: profession || undefined,
+  minRent,
+  maxRent,
+  minRating: minRating || undefined,
+});
+
+// One page of the listing; pass the previous page's nextCursor to continue.
+// Filters apply on the server, so every page matches them.
+export const getHostelsPage = async ({ cursor, limit, ...filters } = {}) => {
   try {
-    const res = await API.get("/hostels");
-    return res.data.hostels || [];
+    const res = await API.get("/hostels", { params: { cursor, limit, ...filterParams(filters) } });
+    return { hostels: res.data.hostels || [], nextCursor: res.data.nextCursor || null };
   } catch (error) {
     console.error("Error fetching hostels:", error);
-    return [];
+    return { hostels: [], nextCursor: null };
   }
 };
 
-export const getAllHostels = async () => {
+// Ranked full-text search; filters narrow the matches, cursor continues them
+export const searchHostels = async (q, { cursor, limit, ...filters } = {}) => {
   try {
-    const res = await API.get("/hostels/admin");
-    return res.data.hostels || [];
+    const res = await API.get("/hostels/search", { params: { q, cursor, limit, ...filterParams(filters) } });
+    return { hostels: res.data.hostels || [], nextCursor: res.data.nextCursor || null };
   } catch (error) {
-    console.error("Error fetching hostels:", error);
-    return [];
+    console.error("Error searching hostels:", error);
+    return { hostels: [], nextCursor: null };
+  }
+};
+
+// Filter panel option counts for the given filter state
+export const getHostelFacets = async (filters = {}) => {
+  try {
+    const res = await API.get("/hostels/facets", { params: filterParams(filters) });
+    return { ...res.data.facets, total: res.data.total };
+  } catch (error) {
+    console.error("Error fetching hostel facets:", error);
+    return null;
   }
 };
 
@@ -100,6 +125,33 @@ export const addQuestion = async (hostelId, text) => {
   }
 };
 
+// One page of a hostel's questions, newest first
+export const getHostelQuestions = async (hostelId, { cursor, limit } = {}) => {
+  try {
+    const res = await API.get(`/hostels/${hostelId}/questions`, { params: { cursor, limit } });
+    return { questions: res.data.questions || [], nextCursor: res.data.nextCursor || null };
+  } catch (error) {
+    console.error("Error fetching questions:", error);
+    return { questions: [], nextCursor: null };
+  }
+};
+
+// Owner inbox: unanswered questions on the owner's hostels, oldest first,
+// with the total still waiting
+export const getOwnerQuestions = async ({ cursor, limit, status } = {}) => {
+  try {
+    const res = await API.get("/hostels/owner/questions", { params: { cursor, limit, status } });
+    return {
+      questions: res.data.questions || [],
+      count: res.data.count || 0,
+      nextCursor: res.data.nextCursor || null,
+    };
+  } catch (error) {
+    console.error("Error fetching owner questions:", error);
+    return { questions: [], count: 0, nextCursor: null };
+  }
+};
+
 export const answerQuestion = async (hostelId, questionId, answer) => {
   try {
     const res = await API.post(`/hostels/${hostelId}/questions/${questionId}/answer`, { answer });
@@ -131,21 +183,34 @@ export const deleteReview = async (hostelId, reviewId) => {
   }
 };
 
-export const getReviews = async (hostelId) => {
+// Whether the logged-in user has already reviewed the hostel
+export const getMyReview = async (hostelId) => {
   try {
-    const res = await API.get(`/reviews/hostel/${hostelId}`);
-    return res.data.reviews || [];
+    const res = await API.get(`/reviews/hostel/${hostelId}/mine`);
+    return res.data.reviewed;
+  } catch (error) {
+    console.error("Error checking review:", error);
+    return false;
+  }
+};
+
+// One page of a hostel's reviews, newest first
+export const getReviews = async (hostelId, { cursor, limit } = {}) => {
+  try {
+    const res = await API.get(`/reviews/hostel/${hostelId}`, { params: { cursor, limit } });
+    return { reviews: res.data.reviews || [], nextCursor: res.data.nextCursor || null };
   } catch (error) {
     console.error("Error fetching reviews:", error);
-    return [];
+    return { reviews: [], nextCursor: null };
   }
 };
 
 // Increment hostel view count
 export const incrementViewCount = async (hostelId) => {
   try {
-    const res = await API.patch(`/hostels/${hostelId}/views`);
-    return res.data;
+    // 204 No Content: the server counts the view in its next batch
+    await API.patch(`/hostels/${hostelId}/views`);
+    return true;
   } catch (error) {
     console.error("Error incrementing view count:", error);
     // optional: don't throw, just fail silently to not break page load
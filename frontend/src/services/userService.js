@@ -33,10 +33,28 @@ export const removeFromWishlist = async (hostelId) => {
   }
 };
 
+// Add and remove several hostels in one request
+export const syncWishlist = async ({ add = [], remove = [] } = {}) => {
+  try {
+    const res = await API.post("/users/wishlist/batch", { add, remove });
+    return res.data;
+  } catch (error) {
+    console.error("Error syncing wishlist:", error);
+    throw error;
+  }
+};
+
+// Get all reviews written by the logged-in user, following the page cursors
 export const getUserReviews = async () => {
   try {
-    const res = await API.get(`/reviews/user/my-reviews`);
-    return res.data.reviews || [];
+    let reviews = [];
+    let cursor;
+    do {
+      const res = await API.get(`/reviews/user/my-reviews`, { params: { cursor, limit: 100 } });
+      reviews = reviews.concat(res.data.reviews || []);
+      cursor = res.data.nextCursor;
+    } while (cursor);
+    return reviews;
   } catch (error) {
     console.error("Error fetching user reviews:", error);
     return [];
@@ -46,8 +64,14 @@ export const getUserReviews = async () => {
 // Get all questions asked by the logged-in user
 export const getUserQuestions = async () => {
   try {
-    const res = await API.get(`/hostels/user/my-questions`);
-    return res.data.questions || [];
+    let questions = [];
+    let cursor;
+    do {
+      const res = await API.get(`/hostels/user/my-questions`, { params: { cursor, limit: 100 } });
+      questions = questions.concat(res.data.questions || []);
+      cursor = res.data.nextCursor;
+    } while (cursor);
+    return questions;
   } catch (error) {
     console.error("Error fetching user questions:", error);
     return [];
@@ -0,0 +1,60 @@
+import os
+import json
+import urllib.request
+
+API_URL = os.environ.get("API_URL", "http://localhost:5000/api")
+
+# Cached sessions handed to worker processes as JSON
+SESSIONS_ENV = "SELENIUM_AUTH_SESSIONS"
+
+# Seeded test accounts (backend/data/users.js)
+ACCOUNTS = {
+    "user": ("user@test.com", "abcd123"),
+    "owner": ("owner@test.com", "abcd123"),
+    "admin": ("admin@test.com", "abcd123"),
+}
+
+_sessions = json.loads(os.environ.get(SESSIONS_ENV) or "{}")
+
+
+def api_login(role):
+    """Log in through POST /api/auth/login once per role and cache the token and user"""
+    if role not in _sessions:
+        email, password = ACCOUNTS[role]
+        request = urllib.request.Request(
+            f"{API_URL}/auth/login",
+            data=json.dumps({"email": email, "password": password}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            data = json.load(response)
+
+        _sessions[role] = {"token": data["token"], "user": data["user"]}
+    return _sessions[role]
+
+
+def export_sessions():
+    """Log in every role and return the cache as JSON for SELENIUM_AUTH_SESSIONS"""
+    for role in ACCOUNTS:
+        api_login(role)
+    return json.dumps(_sessions)
+
+
+def login_as(driver, role, base_url, path="/"):
+    """Open `path` already authenticated as `role`, skipping the login form.
+
+    The token and user are written to localStorage under the same keys that
+    AuthContext and the axios interceptor in frontend/src/api/index.js read.
+    """
+    session = api_login(role)
+
+    # localStorage is per origin, so load a small static file from the app first
+    driver.get(f"{base_url}/robots.txt")
+    driver.execute_script(
+        "window.localStorage.setItem('token', arguments[0]);"
+        "window.localStorage.setItem('user', arguments[1]);",
+        session["token"],
+        json.dumps(session["user"]),
+    )
+    driver.get(f"{base_url}{path}")
@@ -0,0 +1,165 @@
+import os
+import time
+import atexit
+from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from perf_metrics import install_collector
+
+# Set to "1" to start Chrome without a visible window (used by parallel workers)
+HEADLESS_ENV = "SELENIUM_HEADLESS"
+
+# Set to "fast" for a tuned headless profile that skips images and fonts
+PROFILE_ENV = "SELENIUM_PROFILE"
+
+FAST_PROFILE_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1366,900",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+# Assets none of the assertions look at, blocked over the DevTools protocol
+BLOCKED_URL_PATTERNS = [
+    "*placehold.co*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+
+
+def is_headless():
+    return os.environ.get(HEADLESS_ENV) == "1" or is_fast_profile()
+
+
+def is_fast_profile():
+    return os.environ.get(PROFILE_ENV) == "fast"
+
+
+def create_driver():
+    """Start a Chrome session, headless when SELENIUM_HEADLESS=1 or SELENIUM_PROFILE=fast"""
+    options = webdriver.ChromeOptions()
+    if is_fast_profile():
+        for argument in FAST_PROFILE_ARGUMENTS:
+            options.add_argument(argument)
+    elif is_headless():
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+
+    driver = webdriver.Chrome(options=options)
+    install_collector(driver)
+    if is_fast_profile():
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    elif not is_headless():
+        driver.maximize_window()
+    return driver
+
+
+def reset_driver(driver):
+    """Bring a leased driver back to a blank, logged-out state"""
+    # Close any alerts a test left open
+    while True:
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            break
+
+    driver.delete_all_cookies()
+
+    # Web storage is per origin, so clear it before leaving the app's page
+    if driver.current_url.startswith("http"):
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """Session-scoped pool of Chrome drivers that test classes lease and give back."""
+
+    def __init__(self):
+        self._idle = []
+        self._sessions = []
+        self.launches = 0
+        self.leases = 0
+        self.launch_time = 0.0
+
+    def lease(self):
+        self.leases += 1
+        if self._idle:
+            return self._idle.pop()
+
+        start = time.time()
+        driver = create_driver()
+        self.launch_time += time.time() - start
+        self.launches += 1
+        self._sessions.append(driver)
+        return driver
+
+    def release(self, driver):
+        try:
+            reset_driver(driver)
+        except WebDriverException:
+            # A broken session is not worth reusing
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def _discard(self, driver):
+        if driver in self._sessions:
+            self._sessions.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def shutdown(self):
+        for driver in list(self._sessions):
+            self._discard(driver)
+        self._idle = []
+
+    def stats(self):
+        return {
+            "launches": self.launches,
+            "leases": self.leases,
+            "launch_time": self.launch_time,
+        }
+
+
+_pool = DriverPool()
+atexit.register(lambda: _pool.shutdown())
+
+
+def lease_driver():
+    return _pool.lease()
+
+
+def release_driver(driver):
+    _pool.release(driver)
+
+
+def shutdown_pool():
+    _pool.shutdown()
+
+
+def reset_pool():
+    """Start from an empty pool (forked workers must not reuse the parent's sessions)"""
+    global _pool
+    _pool = DriverPool()
+
+
+def pool_stats():
+    return _pool.stats()
+
+
+def startup_time_saved(stats):
+    """Estimated seconds saved by reusing sessions instead of launching one per lease"""
+    if not stats["launches"]:
+        return 0.0
+    avg_launch = stats["launch_time"] / stats["launches"]
+    return avg_launch * (stats["leases"] - stats["launches"])
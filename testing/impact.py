@@ -0,0 +1,281 @@
+import os
+import json
+import hashlib
+import subprocess
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(HERE)
+CACHE_FILE = os.path.join(HERE, ".selenium_cache.json")
+
+# Files every test class depends on: the harness, the app shell and the
+# backend plumbing behind login_as(). Paths ending in "/" cover a directory.
+SHARED_FILES = [
+    "testing/driver_factory.py",
+    "testing/waits.py",
+    "testing/auth_fixtures.py",
+    "testing/pages.py",
+    "testing/perf_metrics.py",
+    "testing/selenium_test_runner.py",
+    "testing/impact.py",
+    "frontend/package.json",
+    "frontend/package-lock.json",
+    "frontend/public/",
+    "frontend/src/App.js",
+    "frontend/src/App.css",
+    "frontend/src/index.js",
+    "frontend/src/index.css",
+    "frontend/src/api/",
+    "frontend/src/Components/AuthContext.jsx",
+    "frontend/src/Components/navbar.jsx",
+    "frontend/src/Components/footer.jsx",
+    "backend/package.json",
+    "backend/package-lock.json",
+    "backend/server.js",
+    "backend/seed.js",
+    "backend/config/",
+    "backend/data/",
+    "backend/middleware/",
+    "backend/jobs/",
+    "backend/utils/cluster.js",
+    "backend/models/User.js",
+    "backend/routes/authRoutes.js",
+    "backend/controllers/authController.js",
+]
+
+HOSTEL_API = [
+    "frontend/src/services/hostelService.js",
+    "backend/routes/hostelRoutes.js",
+    "backend/controllers/hostelController.js",
+    "backend/models/Hostel.js",
+]
+
+# Reviews and questions (collections of their own, keyset-paginated) behind
+# the detail page and the dashboards
+REVIEW_QUESTION_API = [
+    "backend/models/Review.js",
+    "backend/models/Question.js",
+    "backend/utils/pagination.js",
+]
+
+# The admin dashboard's summary endpoint and the sales rollups it reads
+ADMIN_API = [
+    "frontend/src/services/adminService.js",
+    "backend/routes/adminRoutes.js",
+    "backend/controllers/adminController.js",
+    "backend/controllers/salesController.js",
+    "backend/models/SalesRollup.js",
+]
+
+HOSTEL_PAGES = [
+    "frontend/src/pages/hostels.jsx",
+    "frontend/src/pages/hostelDetails.jsx",
+    "frontend/src/Components/hostelcard.jsx",
+]
+
+# Pages, components, routes and controllers each test class exercises
+CLASS_FILES = {
+    "TestUserAuthentication": [
+        "testing/test_01_user_authentication.py",
+        "frontend/src/pages/login.jsx",
+        "frontend/src/pages/signup.jsx",
+        "frontend/src/pages/UserDashboard.jsx",
+        "frontend/src/pages/OwnerDashboard.jsx",
+        "frontend/src/pages/AdminDashboard.jsx",
+        "frontend/src/Components/welcome.jsx",
+    ] + ADMIN_API,
+    "TestUserDashboard": [
+        "testing/test_02_user_dashboard.py",
+        "frontend/src/pages/UserDashboard.jsx",
+        "frontend/src/services/userService.js",
+        "backend/routes/userRoutes.js",
+        "backend/controllers/userController.js",
+        "backend/routes/reviewRoutes.js",
+        "backend/controllers/reviewController.js",
+        "backend/controllers/questionController.js",
+        "backend/models/Visit.js",
+    ] + REVIEW_QUESTION_API + HOSTEL_API,
+    "TestOwnerDashboard": [
+        "testing/test_03_owner_dashboard.py",
+        "frontend/src/pages/OwnerDashboard.jsx",
+        "frontend/src/Components/ownerDashboardSkeleton.jsx",
+        "frontend/src/Components/addHostelModal.jsx",
+        "frontend/src/Components/EditHostelModal.jsx",
+        "frontend/src/Components/ManageFaqModal.jsx",
+        "frontend/src/Components/boostModal.jsx",
+        "backend/controllers/questionController.js",
+        "backend/models/Visit.js",
+    ] + REVIEW_QUESTION_API + HOSTEL_API,
+    "TestAdminDashboard": [
+        "testing/test_04_admin_dashboard.py",
+        "frontend/src/pages/AdminDashboard.jsx",
+        "frontend/src/Components/adminDashboardSkeleton.jsx",
+        "frontend/src/services/userService.js",
+        "frontend/src/services/salesService.js",
+        "frontend/src/services/faqService.js",
+        "backend/routes/userRoutes.js",
+        "backend/controllers/userController.js",
+        "backend/routes/reviewRoutes.js",
+        "backend/controllers/reviewController.js",
+        "backend/routes/salesRoutes.js",
+        "backend/controllers/salesController.js",
+        "backend/models/Sales.js",
+        "backend/routes/faqRoutes.js",
+        "backend/controllers/faqController.js",
+        "backend/models/FAQ.js",
+    ] + ADMIN_API + REVIEW_QUESTION_API + HOSTEL_API,
+    "TestRoleBasedAccess": [
+        "testing/test_05_role_based_access.py",
+        "frontend/src/pages/UserDashboard.jsx",
+        "frontend/src/pages/OwnerDashboard.jsx",
+        "frontend/src/pages/AdminDashboard.jsx",
+        "frontend/src/Components/welcome.jsx",
+        "frontend/src/services/userService.js",
+    ] + ADMIN_API + REVIEW_QUESTION_API + HOSTEL_PAGES + HOSTEL_API,
+    "TestFormValidation": [
+        "testing/test_06_form_validation.py",
+        "frontend/src/pages/login.jsx",
+        "frontend/src/pages/signup.jsx",
+        "frontend/src/pages/OwnerDashboard.jsx",
+        "frontend/src/Components/addHostelModal.jsx",
+        "frontend/src/services/userService.js",
+        "backend/routes/reviewRoutes.js",
+        "backend/controllers/reviewController.js",
+        "backend/controllers/questionController.js",
+        "backend/models/Visit.js",
+    ] + REVIEW_QUESTION_API + HOSTEL_PAGES + HOSTEL_API,
+}
+
+# Changes outside these never affect a browser test (docs, budgets, other tooling)
+SOURCE_PREFIXES = ["frontend/src/", "frontend/public/", "frontend/package", "backend/"]
+
+# Backend docs and tools run by hand, never loaded by the server the tests talk to
+TOOLING_PATHS = ["backend/README.md", "backend/migrations/", "backend/scripts/", "backend/cluster.js"]
+
+
+def _matches(path, pattern):
+    return path.startswith(pattern) if pattern.endswith("/") else path == pattern
+
+
+def _is_source(path):
+    if path.startswith("testing/"):
+        return path.endswith(".py")
+    if any(_matches(path, pattern) for pattern in TOOLING_PATHS):
+        return False
+    return any(path.startswith(prefix) for prefix in SOURCE_PREFIXES)
+
+
+def _git(*args):
+    result = subprocess.run(
+        ["git", "-C", PROJECT_ROOT, *args],
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise ValueError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(rev):
+    """Files changed since `rev`, including uncommitted and untracked ones"""
+    changed = set(_git("diff", "--name-only", "--relative", rev))
+    changed.update(_git("ls-files", "--others", "--exclude-standard"))
+    return sorted(changed)
+
+
+def dependencies(class_name):
+    return SHARED_FILES + CLASS_FILES[class_name]
+
+
+def fingerprint(class_name):
+    """Hash of every file the class depends on, as they are on disk now"""
+    digest = hashlib.sha256()
+    for pattern in sorted(set(dependencies(class_name))):
+        target = os.path.join(PROJECT_ROOT, pattern)
+        if pattern.endswith("/"):
+            paths = sorted(
+                os.path.join(root, name)
+                for root, dirs, files in os.walk(target)
+                if "node_modules" not in root
+                for name in files
+            )
+        else:
+            paths = [target]
+
+        for path in paths:
+            digest.update(os.path.relpath(path, PROJECT_ROOT).encode())
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_results(records):
+    """Cache the records of every class that ran and passed; drop the rest"""
+    cache = load_cache()
+    by_class = {}
+    for record in records:
+        test_id = record[0]
+        if "(" in test_id:
+            # setUpClass errors are reported as "setUpClass (module.Class)"
+            class_name = test_id.partition("(")[2].rstrip(")").rsplit(".", 1)[-1]
+        else:
+            class_name = test_id.rsplit(".", 2)[-2]
+        by_class.setdefault(class_name, []).append(record)
+
+    for class_name, class_records in by_class.items():
+        if class_name not in CLASS_FILES:
+            continue
+        if all(record[2] == "PASSED" for record in class_records):
+            cache[class_name] = {
+                "fingerprint": fingerprint(class_name),
+                "saved": datetime.now().isoformat(timespec="seconds"),
+                "records": [list(record) for record in class_records],
+            }
+        else:
+            cache.pop(class_name, None)
+
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+
+def plan(rev, test_classes):
+    """Decide which classes to run after changes since `rev`.
+
+    Returns (classes to run, cached records to reuse, {class name: reason}).
+    """
+    changed = [path for path in changed_files(rev) if _is_source(path)]
+    known = set(SHARED_FILES).union(*CLASS_FILES.values())
+    unmapped = [path for path in changed if not any(_matches(path, pattern) for pattern in known)]
+    cache = load_cache()
+
+    to_run, reused, reasons = [], [], {}
+    for cls in test_classes:
+        name = cls.__name__
+        hits = [path for path in changed if any(_matches(path, pattern) for pattern in dependencies(name))]
+        cached = cache.get(name)
+
+        if name not in CLASS_FILES:
+            reasons[name] = "run: no impact mapping for this class"
+        elif unmapped:
+            reasons[name] = f"run: change to unmapped file {unmapped[0]}"
+        elif hits:
+            reasons[name] = f"run: {len(hits)} changed file(s), e.g. {hits[0]}"
+        elif not cached:
+            reasons[name] = "run: no cached result"
+        elif cached["fingerprint"] != fingerprint(name):
+            reasons[name] = "run: cached result was recorded against different files"
+        else:
+            reasons[name] = f"skipped: none of its files changed since {rev}, reusing result from {cached['saved']}"
+            reused.extend(tuple(record) for record in cached["records"])
+            continue
+        to_run.append(cls)
+
+    return to_run, reused, reasons
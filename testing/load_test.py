@@ -0,0 +1,416 @@
+"""Load generator for the Hostel Facilitator Express API.
+
+Runs a weighted mix of requests against a local backend, either closed-loop
+(a fixed number of concurrent clients) or open-loop (a target request rate),
+over a pool of keep-alive connections, and reports throughput, error rate and
+latency percentiles per endpoint.
+
+    python load_test.py --concurrency 50 --duration 30
+    python load_test.py --rps 200 --mix list=60,detail=30,views=10 --json load.json
+"""
+import os
+import json
+import ssl
+import random
+import asyncio
+import argparse
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from auth_fixtures import API_URL, ACCOUNTS
+
+DEFAULT_MIX = "list=50,detail=30,views=15,login=5"
+PERCENTILES = [50, 90, 95, 99]
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of latencies in microseconds.
+
+    Values below 2**SUB_BITS are stored exactly; larger values share a bucket
+    with everything within about 1.6% of them, so memory stays constant no
+    matter how many samples are recorded.
+    """
+
+    SUB_BITS = 7
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def record(self, micros):
+        micros = max(0, int(micros))
+        shift = max(0, micros.bit_length() - self.SUB_BITS)
+        key = (shift, micros >> shift)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.total += 1
+        self.sum += micros
+        self.max = max(self.max, micros)
+
+    def percentile(self, p):
+        if not self.total:
+            return 0
+        target = max(1, -(-self.total * p // 100))
+        seen = 0
+        for shift, top in sorted(self.counts, key=lambda k: k[1] << k[0]):
+            seen += self.counts[(shift, top)]
+            if seen >= target:
+                # Highest value that falls in the bucket, capped at the real maximum
+                return min(((top + 1) << shift) - 1, self.max)
+        return self.max
+
+    def mean(self):
+        return self.sum / self.total if self.total else 0
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.statuses = {}
+        self.errors = 0
+
+    def record(self, status, micros):
+        self.latency.record(micros)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not (isinstance(status, int) and status < 400):
+            self.errors += 1
+
+    def summary(self, duration):
+        count = self.latency.total
+        return {
+            "requests": count,
+            "throughput_rps": round(count / duration, 2) if duration else 0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items(), key=lambda item: str(item[0]))},
+            "latency_ms": {
+                **{f"p{p}": round(self.latency.percentile(p) / 1000, 2) for p in PERCENTILES},
+                "max": round(self.latency.max / 1000, 2),
+                "mean": round(self.latency.mean() / 1000, 2),
+            },
+        }
+
+
+class Connection:
+    """A single keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host, port, use_ssl):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=None, headers=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+        data = json.dumps(body).encode() if body is not None else b""
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "Accept: application/json",
+            f"Content-Length: {len(data)}",
+        ]
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + data)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("server closed the connection")
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if status in (204, 304) or method == "HEAD":
+            payload = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = await self._read_chunked()
+        elif "content-length" in response_headers:
+            payload = await self.reader.readexactly(int(response_headers["content-length"]))
+        else:
+            payload = await self.reader.read()
+            self.close()
+
+        if response_headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, payload
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class LoadTest:
+    def __init__(self, base_url, mix, connections, timeout, seed=None):
+        url = urlsplit(base_url)
+        self.prefix = url.path.rstrip("/")
+        self.mix = mix
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self.pool = asyncio.Queue()
+        for _ in range(connections):
+            self.pool.put_nowait(Connection(
+                url.hostname, url.port or (443 if url.scheme == "https" else 80), url.scheme == "https"
+            ))
+        self.hostel_ids = []
+        self.stats = {}
+        self.workers = None
+
+    # ---------------------------- ENDPOINTS ----------------------------
+    def _list(self):
+        return "GET", "/hostels", None
+
+    def _detail(self):
+        return "GET", f"/hostels/{self.random.choice(self.hostel_ids)}", None
+
+    def _views(self):
+        return "PATCH", f"/hostels/{self.random.choice(self.hostel_ids)}/views", None
+
+    def _login(self):
+        email, password = ACCOUNTS["user"]
+        return "POST", "/auth/login", {"email": email, "password": password}
+
+    ENDPOINTS = {
+        "list": ("GET /api/hostels", _list),
+        "detail": ("GET /api/hostels/:id", _detail),
+        "views": ("PATCH /api/hostels/:id/views", _views),
+        "login": ("POST /api/auth/login", _login),
+    }
+
+    async def prepare(self):
+        """Fetch hostel ids for the :id endpoints"""
+        status, payload = await self._send("GET", "/hostels", None)
+        if status != 200:
+            raise RuntimeError(f"GET {self.prefix}/hostels returned {status}")
+        self.hostel_ids = [hostel["_id"] for hostel in json.loads(payload).get("hostels", [])]
+        if not self.hostel_ids and any(name in self.mix for name in ("detail", "views")):
+            raise RuntimeError("no hostels in the database; seed it first (npm run seed)")
+
+    async def _send(self, method, path, body):
+        connection = await self.pool.get()
+        try:
+            return await asyncio.wait_for(connection.request(method, self.prefix + path, body), self.timeout)
+        except BaseException:
+            # Never reuse a connection left in an unknown state
+            connection.close()
+            raise
+        finally:
+            self.pool.put_nowait(connection)
+
+    async def worker_health(self):
+        """Per-worker health from GET /api/health/workers, keyed by slot (None if unavailable)"""
+        try:
+            status, payload = await self._send("GET", "/health/workers", None)
+        except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return None
+        if status != 200:
+            return None
+        return {worker["slot"]: worker for worker in json.loads(payload).get("workers", [])}
+
+    def _pick(self):
+        names = list(self.mix)
+        return self.random.choices(names, weights=[self.mix[name] for name in names])[0]
+
+    async def _one(self, name, started):
+        loop = asyncio.get_running_loop()
+        method, path, body = self.ENDPOINTS[name][1](self)
+        try:
+            status, _ = await self._send(method, path, body)
+        except asyncio.TimeoutError:
+            status = "timeout"
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            status = type(e).__name__
+        self.stats.setdefault(name, EndpointStats()).record(status, (loop.time() - started) * 1_000_000)
+
+    # ---------------------------- LOAD MODELS ----------------------------
+    async def closed_loop(self, concurrency, duration):
+        """`concurrency` clients, each sending its next request as soon as the last one returns"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+
+        async def client():
+            while loop.time() < deadline:
+                await self._one(self._pick(), loop.time())
+
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+
+    async def open_loop(self, rps, duration):
+        """Start requests at a fixed rate whether or not earlier ones have finished.
+
+        Latency is measured from the scheduled start, so time spent waiting for
+        a free connection counts (no coordinated omission).
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        pending = set()
+        for i in range(int(rps * duration)):
+            scheduled = start + i / rps
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(self._one(self._pick(), scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+
+    async def run(self, duration, concurrency=None, rps=None, warmup=0):
+        await self.prepare()
+        if warmup:
+            await (self.open_loop(rps, warmup) if rps else self.closed_loop(concurrency, warmup))
+            self.stats = {}
+
+        before = await self.worker_health()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await (self.open_loop(rps, duration) if rps else self.closed_loop(concurrency, duration))
+        elapsed = loop.time() - start
+        # Workers report their counters about once a second
+        await asyncio.sleep(1.5)
+        after = await self.worker_health()
+        if before is not None and after is not None:
+            self.workers = [
+                {
+                    "slot": slot,
+                    "pid": worker.get("pid"),
+                    "requests": worker.get("requests", 0) - before.get(slot, {}).get("requests", 0),
+                    "restarts": worker.get("restarts", 0),
+                }
+                for slot, worker in sorted(after.items())
+            ]
+
+        while not self.pool.empty():
+            self.pool.get_nowait().close()
+        return elapsed
+
+    def report(self, elapsed, settings):
+        total = EndpointStats()
+        endpoints = {}
+        for name, stats in self.stats.items():
+            endpoints[self.ENDPOINTS[name][0]] = stats.summary(elapsed)
+            for key, count in stats.latency.counts.items():
+                total.latency.counts[key] = total.latency.counts.get(key, 0) + count
+            total.latency.total += stats.latency.total
+            total.latency.sum += stats.latency.sum
+            total.latency.max = max(total.latency.max, stats.latency.max)
+            for status, count in stats.statuses.items():
+                total.statuses[status] = total.statuses.get(status, 0) + count
+            total.errors += stats.errors
+
+        return {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "settings": settings,
+            "duration_s": round(elapsed, 2),
+            "endpoints": endpoints,
+            "total": total.summary(elapsed),
+            "workers": self.workers,
+        }
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in LoadTest.ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint '{name}' (choose from {', '.join(LoadTest.ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def print_report(report):
+    headers = ["Endpoint", "Requests", "RPS", "Errors", "p50 ms", "p95 ms", "p99 ms", "Max ms"]
+    rows = []
+    for name, summary in list(report["endpoints"].items()) + [("TOTAL", report["total"])]:
+        latency = summary["latency_ms"]
+        rows.append([
+            name, summary["requests"], f"{summary['throughput_rps']:.1f}",
+            f"{summary['errors']} ({summary['error_rate'] * 100:.1f}%)",
+            latency["p50"], latency["p95"], latency["p99"], latency["max"],
+        ])
+
+    widths = [max(len(str(row[i])) for row in rows + [headers]) + 2 for i in range(len(headers))]
+
+    def fmt(row):
+        return "| " + " | ".join(str(row[i]).ljust(widths[i]) for i in range(len(row))) + " |"
+
+    line = len(fmt(headers))
+    print("\n" + "=" * line)
+    print(fmt(headers))
+    print("-" * line)
+    for row in rows:
+        print(fmt(row))
+    print("=" * line)
+    print(f"Duration: {report['duration_s']:.2f}s")
+    if report["workers"]:
+        shares = ", ".join(f"#{w['slot']}: {w['requests']}" for w in report["workers"])
+        print(f"Workers: {len(report['workers'])} (requests served: {shares})")
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hostel Facilitator API load test")
+    parser.add_argument("--base-url", default=API_URL, help=f"API base URL (default: {API_URL})")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to measure (default: 30)")
+    parser.add_argument("--warmup", type=float, default=0, help="seconds of unmeasured load first (default: 0)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--concurrency", type=int, default=20, help="closed loop: concurrent clients (default: 20)")
+    group.add_argument("--rps", type=float, help="open loop: target requests per second")
+    parser.add_argument(
+        "--connections", type=int,
+        help="keep-alive connections to share (default: --concurrency, or 100 with --rps)"
+    )
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"endpoint weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds (default: 10)")
+    parser.add_argument("--seed", type=int, help="random seed for the request mix and hostel ids")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    args = parser.parse_args()
+
+    connections = args.connections or (100 if args.rps else args.concurrency)
+    settings = {
+        "base_url": args.base_url,
+        "mode": "open-loop" if args.rps else "closed-loop",
+        "rps": args.rps,
+        "concurrency": None if args.rps else args.concurrency,
+        "connections": connections,
+        "mix": args.mix,
+    }
+    print(f"Load test against {args.base_url}: {settings['mode']}, "
+          f"{f'{args.rps:g} rps' if args.rps else f'{args.concurrency} clients'}, "
+          f"{connections} connections, {args.duration:g}s")
+
+    async def main():
+        test = LoadTest(args.base_url, args.mix, connections, args.timeout, args.seed)
+        elapsed = await test.run(args.duration, concurrency=args.concurrency, rps=args.rps, warmup=args.warmup)
+        return test.report(elapsed, settings)
+
+    report = asyncio.run(main())
+    print_report(report)
+    if args.json:
+        with open(os.path.abspath(args.json), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
@@ -0,0 +1,164 @@
+import time
+from selenium.webdriver.common.by import By
+
+# Per-locator lookup statistics: name -> {"calls", "total", "slowest"} in seconds
+_stats = {}
+
+
+class Locator(tuple):
+    """A named (by, value) pair, usable anywhere Selenium expects a locator tuple"""
+
+    def __new__(cls, name, by, value):
+        locator = super().__new__(cls, (by, value))
+        locator.name = name
+        return locator
+
+
+def by_test_id(name, value):
+    return Locator(name, By.CSS_SELECTOR, f"[data-testid='{value}']")
+
+
+def _timed(locator, lookup):
+    start = time.perf_counter()
+    try:
+        return lookup()
+    finally:
+        elapsed = time.perf_counter() - start
+        stats = _stats.setdefault(locator.name, {"calls": 0, "total": 0.0, "slowest": 0.0})
+        stats["calls"] += 1
+        stats["total"] += elapsed
+        stats["slowest"] = max(stats["slowest"], elapsed)
+
+
+def find(context, locator):
+    """find_element on a driver or element, recorded under the locator's name"""
+    return _timed(locator, lambda: context.find_element(*locator))
+
+
+def find_all(context, locator):
+    """find_elements on a driver or element, recorded under the locator's name"""
+    return _timed(locator, lambda: context.find_elements(*locator))
+
+
+def locator_stats():
+    return {name: dict(stats) for name, stats in _stats.items()}
+
+
+def merge_locator_stats(into, other):
+    for name, stats in other.items():
+        merged = into.setdefault(name, {"calls": 0, "total": 0.0, "slowest": 0.0})
+        merged["calls"] += stats["calls"]
+        merged["total"] += stats["total"]
+        merged["slowest"] = max(merged["slowest"], stats["slowest"])
+    return into
+
+
+def slowest_locators(stats, limit=10):
+    """Locators with the highest average lookup time, the first candidates to replace"""
+    return sorted(stats.items(), key=lambda item: item[1]["total"] / item[1]["calls"], reverse=True)[:limit]
+
+
+class LoginPage:
+    PATH = "/login"
+    EMAIL = by_test_id("login.email", "login-email")
+    PASSWORD = by_test_id("login.password", "login-password")
+    SUBMIT = by_test_id("login.submit", "login-submit")
+    ERROR = by_test_id("login.error", "login-error")
+
+
+class SignupPage:
+    PATH = "/signup"
+    NAME = by_test_id("signup.name", "signup-name")
+    EMAIL = by_test_id("signup.email", "signup-email")
+    PASSWORD = by_test_id("signup.password", "signup-password")
+    ROLE = by_test_id("signup.role", "signup-role")
+    SUBMIT = by_test_id("signup.submit", "signup-submit")
+    ERROR = by_test_id("signup.error", "signup-error")
+
+
+class Navbar:
+    ADMIN_LINK = by_test_id("navbar.admin_link", "nav-admin")
+    OWNER_LINK = by_test_id("navbar.owner_link", "nav-owner")
+    DASHBOARD_LINK = by_test_id("navbar.dashboard_link", "nav-dashboard")
+    LOGOUT = by_test_id("navbar.logout", "nav-logout")
+
+
+class UserDashboardPage:
+    PATH = "/dashboard"
+    TITLE = by_test_id("user_dashboard.title", "dashboard-title")
+    PROFILE_TITLE = by_test_id("user_dashboard.profile_title", "profile-title")
+    PROFILE_EMAIL = by_test_id("user_dashboard.profile_email", "profile-email")
+    WISHLIST_TITLE = by_test_id("user_dashboard.wishlist_title", "wishlist-title")
+    REVIEWS_TITLE = by_test_id("user_dashboard.reviews_title", "reviews-title")
+    QUESTIONS_TITLE = by_test_id("user_dashboard.questions_title", "questions-title")
+    VISITS_TITLE = by_test_id("user_dashboard.visits_title", "visits-title")
+
+
+class HostelsPage:
+    PATH = "/hostels"
+    VIEW_DETAILS = by_test_id("hostels.view_details", "hostel-view-details")
+
+
+class HostelDetailsPage:
+    REVIEWS_TAB = by_test_id("hostel_details.reviews_tab", "tab-reviews")
+    QUESTIONS_TAB = by_test_id("hostel_details.questions_tab", "tab-questions")
+    BOOK_VISIT = by_test_id("hostel_details.book_visit", "book-visit")
+    VISIT_SUBMIT = by_test_id("hostel_details.visit_submit", "visit-submit")
+    GUEST_LOGIN_PROMPT = by_test_id("hostel_details.guest_login_prompt", "guest-login-prompt")
+    REVIEW_TEXT = by_test_id("hostel_details.review_text", "review-text")
+    REVIEW_SUBMIT = by_test_id("hostel_details.review_submit", "review-submit")
+    QUESTION_TEXT = by_test_id("hostel_details.question_text", "question-text")
+    QUESTION_SUBMIT = by_test_id("hostel_details.question_submit", "question-submit")
+
+
+class OwnerDashboardPage:
+    PATH = "/owner"
+    HOSTELS_TITLE = by_test_id("owner_dashboard.hostels_title", "owner-hostels-title")
+    ADD_HOSTEL = by_test_id("owner_dashboard.add_hostel", "add-hostel")
+    UPDATE_HOSTEL = by_test_id("owner_dashboard.update_hostel", "hostel-update")
+    BOOST_HOSTEL = by_test_id("owner_dashboard.boost_hostel", "hostel-boost")
+    MANAGE_FAQS = by_test_id("owner_dashboard.manage_faqs", "hostel-manage-faqs")
+    PENDING_QUESTIONS_TITLE = by_test_id("owner_dashboard.pending_questions_title", "pending-questions-title")
+    ANSWER_TEXT = by_test_id("owner_dashboard.answer_text", "answer-text")
+    ANSWER_SUBMIT = by_test_id("owner_dashboard.answer_submit", "answer-submit")
+    VISITS_TITLE = by_test_id("owner_dashboard.visits_title", "owner-visits-title")
+    APPROVE_VISIT = by_test_id("owner_dashboard.approve_visit", "visit-approve")
+
+
+class HostelFormModal:
+    """Add and update hostel modals share the same fields"""
+    ADD_TITLE = by_test_id("hostel_form.add_title", "add-hostel-title")
+    EDIT_TITLE = by_test_id("hostel_form.edit_title", "edit-hostel-title")
+    NAME = by_test_id("hostel_form.name", "hostel-name")
+    AREA = by_test_id("hostel_form.area", "hostel-area")
+    CONTACT = by_test_id("hostel_form.contact", "hostel-contact")
+    RENT = by_test_id("hostel_form.rent", "hostel-rent")
+    GENDER = by_test_id("hostel_form.gender", "hostel-gender")
+    PROFESSION = by_test_id("hostel_form.profession", "hostel-profession")
+    DESCRIPTION = by_test_id("hostel_form.description", "hostel-description")
+    CANCEL = by_test_id("hostel_form.cancel", "hostel-form-cancel")
+    SUBMIT = by_test_id("hostel_form.submit", "hostel-form-submit")
+
+
+class FaqModal:
+    TITLE = by_test_id("faq_modal.title", "faq-modal-title")
+    CLOSE = by_test_id("faq_modal.close", "faq-modal-close")
+
+
+class BoostModal:
+    TITLE = by_test_id("boost_modal.title", "boost-modal-title")
+    CLOSE = by_test_id("boost_modal.close", "boost-modal-close")
+
+
+class AdminDashboardPage:
+    PATH = "/admin"
+    STAT_CARDS = by_test_id("admin_dashboard.stat_cards", "stat-card")
+    PENDING_HOSTELS = by_test_id("admin_dashboard.pending_hostels", "pending-hostels")
+    APPROVE_HOSTEL = by_test_id("admin_dashboard.approve_hostel", "approve-hostel")
+    REJECT_HOSTEL = by_test_id("admin_dashboard.reject_hostel", "reject-hostel")
+    BOOST_REQUESTS = by_test_id("admin_dashboard.boost_requests", "boost-requests")
+    APPROVE_BOOST = by_test_id("admin_dashboard.approve_boost", "approve-boost")
+    SALES_STATS = by_test_id("admin_dashboard.sales_stats", "sales-stats")
+    RECENT_RATINGS = by_test_id("admin_dashboard.recent_ratings", "recent-ratings")
+    REMOVE_REVIEW = by_test_id("admin_dashboard.remove_review", "remove-review")
+    FAQS = by_test_id("admin_dashboard.faqs", "admin-faqs")
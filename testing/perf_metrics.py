@@ -0,0 +1,162 @@
+import re
+import json
+import statistics
+from datetime import datetime
+
+# Runs at the start of every document (installed over the DevTools protocol in
+# create_driver). Each page load gets one record; it is kept in sessionStorage
+# when the page is left so that pages a test navigated away from are not lost.
+# Client-side route changes count towards the document they happened in.
+COLLECTOR_SCRIPT = """
+(() => {
+  if (!location.protocol.startsWith("http")) return;
+  const KEY = "__perfRecords";
+  const page = {
+    path: location.pathname,
+    ttfb: null, domContentLoaded: null, load: null, lcp: null,
+    longTasks: 0, longTaskTime: 0, jsHeap: null
+  };
+
+  try {
+    new PerformanceObserver((list) => {
+      const entries = list.getEntries();
+      page.lcp = entries[entries.length - 1].startTime;
+    }).observe({ type: "largest-contentful-paint", buffered: true });
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) {
+        page.longTasks += 1;
+        page.longTaskTime += entry.duration;
+      }
+    }).observe({ type: "longtask", buffered: true });
+  } catch (e) {}
+
+  window.__perfSnapshot = () => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    if (nav) {
+      page.ttfb = nav.responseStart - nav.startTime;
+      page.domContentLoaded = nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null;
+      page.load = nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null;
+    }
+    if (performance.memory) page.jsHeap = performance.memory.usedJSHeapSize;
+    return page;
+  };
+
+  addEventListener("pagehide", () => {
+    if (window.__perfCollected || document.contentType !== "text/html") return;
+    const records = JSON.parse(sessionStorage.getItem(KEY) || "[]");
+    records.push(window.__perfSnapshot());
+    sessionStorage.setItem(KEY, JSON.stringify(records));
+  });
+})();
+"""
+
+# Returns the stored records plus the current page, and stops the current page
+# from storing itself again when the browser moves on
+COLLECT_SCRIPT = """
+const drain = arguments[0];
+const records = JSON.parse(sessionStorage.getItem("__perfRecords") || "[]");
+sessionStorage.removeItem("__perfRecords");
+if (!drain && window.__perfSnapshot && !window.__perfCollected
+    && document.contentType === "text/html") {
+  records.push(window.__perfSnapshot());
+}
+if (!drain) window.__perfCollected = true;
+return records;
+"""
+
+METRICS = ["ttfb", "domContentLoaded", "load", "lcp", "longTasks", "longTaskTime", "jsHeap"]
+
+_OBJECT_ID = re.compile(r"/[0-9a-f]{24}(?=/|$)")
+
+
+def install_collector(driver):
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": COLLECTOR_SCRIPT})
+
+
+def _on_app_page(driver):
+    try:
+        return driver.current_url.startswith("http")
+    except Exception:
+        return False
+
+
+def discard_pages(driver):
+    """Drop records left over from class setup; the page currently open stays with the test"""
+    if driver is not None and _on_app_page(driver):
+        try:
+            driver.execute_script(COLLECT_SCRIPT, True)
+        except Exception:
+            pass
+
+
+def collect_pages(driver):
+    """Return the per-page metrics recorded since the last call"""
+    if driver is None or not _on_app_page(driver):
+        return []
+    try:
+        records = driver.execute_script(COLLECT_SCRIPT, False) or []
+    except Exception:
+        # A test that ends on an alert or a dead session still reports its result
+        return []
+
+    for record in records:
+        record["path"] = normalize_path(record["path"])
+    return records
+
+
+def normalize_path(path):
+    """Group /hostel/<ObjectId> style paths under one name"""
+    path = _OBJECT_ID.sub("/:id", path)
+    return path.rstrip("/") or "/"
+
+
+def summarize(records):
+    """Median and worst value of every metric, per page, over the runner's test records"""
+    samples = {}
+    for record in records:
+        for page in record[6]:
+            samples.setdefault(page["path"], []).append(page)
+
+    summary = {}
+    for path, pages in sorted(samples.items()):
+        summary[path] = {"samples": len(pages)}
+        for metric in METRICS:
+            values = [page[metric] for page in pages if page.get(metric) is not None]
+            if values:
+                summary[path][metric] = {
+                    "median": round(statistics.median(values), 1),
+                    "max": round(max(values), 1),
+                }
+    return summary
+
+
+def check_budget(summary, budget):
+    """Compare page medians with the budget and return one message per breach"""
+    breaches = []
+    for path, limits in budget.items():
+        if path not in summary:
+            continue
+        for metric, limit in limits.items():
+            measured = summary[path].get(metric)
+            if measured and measured["median"] > limit:
+                breaches.append(f"{path} {metric}: {measured['median']:g} > {limit:g}")
+    return breaches
+
+
+def load_budget(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_report(path, records, summary, breaches):
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "pages": summary,
+        "budget_breaches": breaches,
+        "tests": [
+            {"id": test_id, "name": name, "status": status, "pages": pages}
+            for test_id, name, status, _, _, _, pages in records
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
@@ -1,6 +1,11 @@
 import unittest
 import sys
+import os
+import io
 import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 # Import all test modules
@@ -11,6 +16,42 @@ from test_04_admin_dashboard import TestAdminDashboard
 from test_05_role_based_access import TestRoleBasedAccess
 from test_06_form_validation import TestFormValidation
 
+from driver_factory import (
+    HEADLESS_ENV,
+    PROFILE_ENV,
+    lease_driver,
+    release_driver,
+    shutdown_pool,
+    reset_pool,
+    pool_stats,
+    startup_time_saved,
+)
+from auth_fixtures import SESSIONS_ENV, export_sessions
+from waits import consume_wait_time
+import impact
+from pages import locator_stats, merge_locator_stats, slowest_locators
+from perf_metrics import (
+    collect_pages,
+    discard_pages,
+    summarize,
+    check_budget,
+    load_budget,
+    write_report,
+)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PERF_REPORT = os.path.join(HERE, "perf_report.json")
+DEFAULT_PERF_BUDGET = os.path.join(HERE, "perf_budget.json")
+
+TEST_CLASSES = [
+    TestUserAuthentication,
+    TestUserDashboard,
+    TestOwnerDashboard,
+    TestAdminDashboard,
+    TestRoleBasedAccess,
+    TestFormValidation,
+]
+
 
 class EnhancedTestResult(unittest.TextTestResult):
     """Shows live output and then generates a final summary table."""
@@ -19,59 +60,61 @@ class EnhancedTestResult(unittest.TextTestResult):
         super().__init__(*args, **kwargs)
         self.test_start_time = None
         self.results_table = []
+        self.records = []  # Raw (test id, name, status, details, elapsed, waited, pages) for merging shards
         self.counter = 1  # For Test IDs
 
     def startTest(self, test):
         super().startTest(test)
         self.test_start_time = time.time()
+        consume_wait_time()  # Waits from class setup don't belong to this test
+        discard_pages(getattr(test, "driver", None))
         print(f"\n{'='*70}")
         print(f"Running: {test._testMethodName}")
         print(f"{'='*70}")
 
     def addSuccess(self, test):
         super().addSuccess(test)
-        elapsed = time.time() - self.test_start_time
+        elapsed = self._elapsed()
         print(f"✓ PASSED ({elapsed:.2f}s)")
         self._store(test, "PASSED", "Executed successfully", elapsed)
 
     def addFailure(self, test, err):
         super().addFailure(test, err)
-        elapsed = time.time() - self.test_start_time
+        elapsed = self._elapsed()
         print(f"✗ FAILED ({elapsed:.2f}s)")
         self._store(test, "FAILED", "Assertion failed", elapsed)
 
     def addError(self, test, err):
         super().addError(test, err)
-        elapsed = time.time() - self.test_start_time
+        elapsed = self._elapsed()
         print(f"✗ ERROR ({elapsed:.2f}s)")
         self._store(test, "ERROR", "Unexpected error occurred", elapsed)
 
+    def _elapsed(self):
+        # setUpClass errors are reported without a preceding startTest
+        return time.time() - self.test_start_time if self.test_start_time else 0.0
+
     def _store(self, test, status, details, elapsed):
         test_id = f"T{self.counter:03d}"
         self.counter += 1
-        test_name = test._testMethodName
+        test_name = getattr(test, "_testMethodName", str(test))
+        waited = consume_wait_time()
+        pages = collect_pages(getattr(test, "driver", None))
+        print(f"  waited {waited:.2f}s for the page to settle, {len(pages)} page load(s) measured")
 
         self.results_table.append([
             test_id,
             test_name,
             status,
             details,
-            f"{elapsed:.2f}s"
+            f"{elapsed:.2f}s",
+            f"{waited:.2f}s"
         ])
+        self.records.append((test.id(), test_name, status, details, elapsed, waited, pages))
 
 
-def create_test_suite():
+def create_test_suite(test_classes=TEST_CLASSES):
     suite = unittest.TestSuite()
-    test_classes = [
-        TestUserAuthentication,
-        TestUserDashboard,
-        TestOwnerDashboard,
-        TestAdminDashboard,
-        TestRoleBasedAccess,
-        TestFormValidation,
-
-    ]
-
     for cls in test_classes:
         suite.addTests(unittest.TestLoader().loadTestsFromTestCase(cls))
     return suite
@@ -83,63 +126,295 @@ def print_table(headers, rows):
     def fmt(row):
         return "| " + " | ".join(str(row[i]).ljust(widths[i]) for i in range(len(row))) + " |"
 
-    print("\n" + "=" * 95)
+    line = len(fmt(headers))
+    print("\n" + "=" * line)
     print(fmt(headers))
-    print("-" * 95)
+    print("-" * line)
     for row in rows:
         print(fmt(row))
-    print("=" * 95 + "\n")
+    print("=" * line + "\n")
 
 
-def run_tests():
-    print("\n" + "="*70)
-    print("HOSTEL FACILITATOR - SELENIUM TEST SUITE")
-    print("="*70)
-    print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+def print_pool_report(stats):
+    print("BROWSER SESSIONS")
     print("="*70)
+    print(f"Chrome launches : {stats['launches']}")
+    print(f"Driver leases   : {stats['leases']}")
+    print(f"Startup saved   : {startup_time_saved(stats):.2f}s")
+    print("="*70 + "\n")
 
-    suite = create_test_suite()
-    runner = unittest.TextTestRunner(
-        verbosity=1,  
-        resultclass=EnhancedTestResult
-    )
 
-    start = time.time()
-    result = runner.run(suite)
-    end = time.time()
+def print_perf_report(summary, breaches):
+    if not summary:
+        return
 
-    # Final summary table
-    headers = ["Test ID", "Test Name", "Status", "Details", "Time"]
-    print_table(headers, result.results_table)
+    def cell(path, metric, unit=1):
+        value = summary[path].get(metric)
+        return f"{value['median'] / unit:.0f}" if value else "-"
 
-    # Final summary stats
-    passed = result.testsRun - len(result.failures) - len(result.errors)
-    failed = len(result.failures)
-    errors = len(result.errors)
-    percent = (passed / result.testsRun * 100) if result.testsRun else 0
+    headers = ["Page", "Loads", "TTFB ms", "DCL ms", "Load ms", "LCP ms", "Long tasks ms", "Heap MB"]
+    rows = [
+        [path, summary[path]["samples"], cell(path, "ttfb"), cell(path, "domContentLoaded"),
+         cell(path, "load"), cell(path, "lcp"), cell(path, "longTaskTime"), cell(path, "jsHeap", 1024 * 1024)]
+        for path in summary
+    ]
+    print("PAGE PERFORMANCE (median per page)")
+    print_table(headers, rows)
+
+    if breaches:
+        print("✗ PERFORMANCE BUDGET EXCEEDED")
+        for breach in breaches:
+            print(f"  {breach}")
+        print()
+
+
+def print_locator_report(stats):
+    if not stats:
+        return
+    headers = ["Locator", "Calls", "Avg ms", "Slowest ms", "Total ms"]
+    rows = [
+        [name, s["calls"], f"{s['total'] / s['calls'] * 1000:.1f}", f"{s['slowest'] * 1000:.1f}", f"{s['total'] * 1000:.1f}"]
+        for name, s in slowest_locators(stats)
+    ]
+    print("SLOWEST LOCATORS")
+    print_table(headers, rows)
+
+
+def print_impact_plan(rev, reasons):
+    print(f"\nCHANGE IMPACT (since {rev})")
+    print("="*70)
+    for name, reason in reasons.items():
+        print(f"{name:<24}: {reason}")
+    print("="*70)
+
+
+def print_summary(rows, tests_run, failed, errors, elapsed, waited, reused=0):
+    headers = ["Test ID", "Test Name", "Status", "Details", "Time", "Wait"]
+    if rows:
+        print_table(headers, rows)
+
+    passed = tests_run - failed - errors
+    percent = (passed / tests_run * 100) if tests_run else 0
 
     print("FINAL SUMMARY")
     print("="*70)
-    print(f"Total Tests : {result.testsRun}")
+    print(f"Total Tests : {tests_run}")
     print(f"Passed      : {passed}")
     print(f"Failed      : {failed}")
     print(f"Errors      : {errors}")
+    if reused:
+        print(f"Cached      : {reused} (reused, not run)")
     print(f"Pass %      : {percent:.2f}%")
-    print(f"Total Time  : {end-start:.2f}s")
+    print(f"Total Time  : {elapsed:.2f}s")
+    print(f"Wait Time   : {waited:.2f}s")
     print("="*70 + "\n")
 
-    return 0 if result.wasSuccessful() else 1
+
+def _init_worker():
+    # Every worker drives its own headless Chrome and never the parent's sessions
+    os.environ[HEADLESS_ENV] = "1"
+    reset_pool()
+
+
+def _run_shard(class_names):
+    """Run a group of test classes inside a worker process and return its raw results."""
+    classes = [cls for cls in TEST_CLASSES if cls.__name__ in class_names]
+    log = io.StringIO()
+
+    with contextlib.redirect_stdout(log):
+        runner = unittest.TextTestRunner(stream=log, verbosity=1, resultclass=EnhancedTestResult)
+        result = runner.run(create_test_suite(classes))
+        shutdown_pool()
+
+    return {
+        "classes": class_names,
+        "log": log.getvalue(),
+        "records": result.records,
+        "tests_run": result.testsRun,
+        "failed": len(result.failures),
+        "errors": len(result.errors),
+        "pool": pool_stats(),
+        "locators": locator_stats(),
+    }
+
+
+def _shard_classes(workers, test_classes):
+    """Deal test classes round-robin so every worker gets a similar share."""
+    shards = [[] for _ in range(workers)]
+    for i, cls in enumerate(test_classes):
+        shards[i % workers].append(cls.__name__)
+    return [shard for shard in shards if shard]
+
+
+def _suite_position(order, test_id):
+    if test_id in order:
+        return order[test_id]
+    # Class fixture errors are reported as "setUpClass (module.Class)"
+    owner = test_id.partition("(")[2].rstrip(")")
+    return min((i for tid, i in order.items() if tid.startswith(owner + ".")), default=len(order))
+
+
+def _rows(records):
+    return [
+        [f"T{i:03d}", name, status, details, f"{elapsed:.2f}s", f"{waited:.2f}s"]
+        for i, (_, name, status, details, elapsed, waited, _) in enumerate(records, start=1)
+    ]
+
+
+def run_parallel(workers, test_classes=TEST_CLASSES):
+    records = []
+    tests_run = failed = errors = 0
+    sessions = pool_stats()
+    locators = {}
+
+    # Log each role in once for the whole run; workers reuse the cached tokens
+    try:
+        os.environ[SESSIONS_ENV] = export_sessions()
+    except OSError as e:
+        print(f"✗ Could not pre-fetch login tokens: {e}")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_run_shard, shard): shard for shard in _shard_classes(workers, test_classes)}
+
+        for future in as_completed(futures):
+            try:
+                shard = future.result()
+            except Exception as e:
+                print(f"✗ Worker for {', '.join(futures[future])} crashed: {e}")
+                tests_run += 1
+                errors += 1
+                continue
+
+            print(f"\n{'#'*70}")
+            print(f"Worker finished: {', '.join(shard['classes'])}")
+            print(f"{'#'*70}")
+            print(shard["log"], end="")
+
+            records.extend(shard["records"])
+            tests_run += shard["tests_run"]
+            failed += shard["failed"]
+            errors += shard["errors"]
+            for key in sessions:
+                sessions[key] += shard["pool"][key]
+            merge_locator_stats(locators, shard["locators"])
+
+    return records, tests_run, failed, errors, sessions, locators
+
+
+def run_tests(workers=1, perf_report=DEFAULT_PERF_REPORT, perf_budget=DEFAULT_PERF_BUDGET, changed_since=None):
+    print("\n" + "="*70)
+    print("HOSTEL FACILITATOR - SELENIUM TEST SUITE")
+    print("="*70)
+    print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if workers > 1:
+        print(f"Workers   : {workers} (headless)")
+    if os.environ.get(PROFILE_ENV) == "fast":
+        print("Profile   : fast (headless, images and fonts blocked)")
+    print("="*70)
+
+    test_classes = TEST_CLASSES
+    reused = []
+    if changed_since:
+        try:
+            test_classes, reused, reasons = impact.plan(changed_since, TEST_CLASSES)
+            print_impact_plan(changed_since, reasons)
+        except ValueError as e:
+            print(f"✗ Could not diff against {changed_since}: {e}")
+            print("  Running every test class")
+            changed_since = None
+
+    start = time.time()
+
+    if not test_classes:
+        records, tests_run, failed, errors = [], 0, 0, 0
+        sessions, locators = pool_stats(), {}
+    elif workers > 1:
+        # Forked workers must not inherit the parent's idle browser
+        shutdown_pool()
+        records, tests_run, failed, errors, sessions, locators = run_parallel(workers, test_classes)
+    else:
+        runner = unittest.TextTestRunner(
+            verbosity=1,
+            resultclass=EnhancedTestResult
+        )
+        result = runner.run(create_test_suite(test_classes))
+        records = result.records
+        tests_run = result.testsRun
+        failed = len(result.failures)
+        errors = len(result.errors)
+        sessions = pool_stats()
+        locators = locator_stats()
+        shutdown_pool()
+
+    end = time.time()
+
+    if changed_since:
+        impact.save_results(records)
+
+    # Position of every test in the full serial suite, so merged rows keep the same T-ids
+    order = {test.id(): i for i, test in enumerate(create_test_suite())}
+    records = sorted(records + reused, key=lambda r: _suite_position(order, r[0]))
+    rows = _rows(records)
+
+    print_pool_report(sessions)
+    print_locator_report(locators)
+
+    summary = summarize(records)
+    breaches = []
+    if perf_budget and os.path.exists(perf_budget):
+        breaches = check_budget(summary, load_budget(perf_budget))
+    print_perf_report(summary, breaches)
+    if perf_report:
+        write_report(perf_report, records, summary, breaches)
+        print(f"Performance report written to {perf_report}\n")
+
+    waited = sum(record[5] for record in records)
+    print_summary(rows, tests_run + len(reused), failed, errors, end - start, waited, len(reused))
+
+    return 0 if failed == 0 and errors == 0 and not breaches else 1
 
 
 if __name__ == "__main__":
-    # Check chromedriver
+    parser = argparse.ArgumentParser(description="Hostel Facilitator Selenium test runner")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="run test classes across N parallel headless Chrome workers (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help=f"use the fast headless browser profile (same as {PROFILE_ENV}=fast)"
+    )
+    parser.add_argument(
+        "--perf-report", default=DEFAULT_PERF_REPORT,
+        help="where to write the per-test page metrics as JSON (default: testing/perf_report.json)"
+    )
+    parser.add_argument(
+        "--perf-budget", default=DEFAULT_PERF_BUDGET,
+        help="per-page thresholds that fail the run when exceeded (default: testing/perf_budget.json)"
+    )
+    parser.add_argument(
+        "--changed-since", metavar="REV",
+        help="only run test classes affected by changes since the git revision REV; "
+             "reuse cached results for the rest"
+    )
+    args = parser.parse_args()
+
+    if args.fast:
+        os.environ[PROFILE_ENV] = "fast"
+    if args.workers > 1:
+        os.environ[HEADLESS_ENV] = "1"
+
+    # Check chromedriver; the probe session goes back to the pool for the first test class
     try:
-        from selenium import webdriver
-        driver = webdriver.Chrome()
-        driver.quit()
+        release_driver(lease_driver())
         print("✓ ChromeDriver found and working\n")
     except Exception as e:
         print(f"✗ ChromeDriver not found or not working: {e}")
         sys.exit(1)
 
-    sys.exit(run_tests())
+    sys.exit(run_tests(
+        workers=max(1, args.workers),
+        perf_report=args.perf_report,
+        perf_budget=args.perf_budget,
+        changed_since=args.changed_since,
+    ))
@@ -1,37 +1,39 @@
 import unittest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import time
 
+from driver_factory import lease_driver, release_driver
+from waits import TimedWait, wait_for_settled
+from pages import find, LoginPage, SignupPage, Navbar
+
 class TestUserAuthentication(unittest.TestCase):
     """Test user registration, login, and logout functionality"""
     
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Chrome()
-        cls.driver.maximize_window()
+        cls.driver = lease_driver()
+        cls.addClassCleanup(release_driver, cls.driver)
         cls.base_url = "http://localhost:3000"
-        cls.wait = WebDriverWait(cls.driver, 10)
+        cls.wait = TimedWait(cls.driver, 10)
     
     def test_01_user_signup_success(self):
         """Test successful user registration"""
         self.driver.get(f"{self.base_url}/signup")
         
         # Fill signup form
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Full Name']").send_keys("Test User")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys(f"testuser{int(time.time())}@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='Password']").send_keys("password123")
+        find(self.driver, SignupPage.NAME).send_keys("Test User")
+        find(self.driver, SignupPage.EMAIL).send_keys(f"testuser{int(time.time())}@test.com")
+        find(self.driver, SignupPage.PASSWORD).send_keys("password123")
         
         # Select role
-        role_select = self.driver.find_element(By.CSS_SELECTOR, "select")
+        role_select = find(self.driver, SignupPage.ROLE)
         role_select.click()
-        self.driver.find_element(By.CSS_SELECTOR, "option[value='user']").click()
+        role_select.find_element(By.CSS_SELECTOR, "option[value='user']").click()
         
         # Submit form
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, SignupPage.SUBMIT).click()
         
         # Wait for redirect to dashboard
         self.wait.until(EC.url_contains("/dashboard"))
@@ -42,11 +44,11 @@ class TestUserAuthentication(unittest.TestCase):
         self.driver.get(f"{self.base_url}/login")
         
         # Fill login form
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("user@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
+        find(self.driver, LoginPage.EMAIL).send_keys("user@test.com")
+        find(self.driver, LoginPage.PASSWORD).send_keys("abcd123")
         
         # Submit form
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, LoginPage.SUBMIT).click()
         
         # Wait for redirect to dashboard
         self.wait.until(EC.url_contains("/dashboard"))
@@ -57,25 +59,25 @@ class TestUserAuthentication(unittest.TestCase):
         self.driver.get(f"{self.base_url}/login")
         
         # Fill login form with invalid credentials
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("invalid@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("wrongpassword")
+        find(self.driver, LoginPage.EMAIL).send_keys("invalid@test.com")
+        find(self.driver, LoginPage.PASSWORD).send_keys("wrongpassword")
         
         # Submit form
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, LoginPage.SUBMIT).click()
         
         # Wait for error message
-        time.sleep(2)
-        error_message = self.driver.find_element(By.CSS_SELECTOR, "p.text-red-400")
+        wait_for_settled(self.driver)
+        error_message = find(self.driver, LoginPage.ERROR)
         self.assertTrue(error_message.is_displayed())
     
     def test_04_owner_login_success(self):
         """Test owner login"""
         self.driver.get(f"{self.base_url}/login")
         
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("owner@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
+        find(self.driver, LoginPage.EMAIL).send_keys("owner@test.com")
+        find(self.driver, LoginPage.PASSWORD).send_keys("abcd123")
         
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, LoginPage.SUBMIT).click()
         
         self.wait.until(EC.url_contains("/owner"))
         self.assertIn("/owner", self.driver.current_url)
@@ -84,10 +86,10 @@ class TestUserAuthentication(unittest.TestCase):
         """Test admin login"""
         self.driver.get(f"{self.base_url}/login")
         
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("admin@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
+        find(self.driver, LoginPage.EMAIL).send_keys("admin@test.com")
+        find(self.driver, LoginPage.PASSWORD).send_keys("abcd123")
         
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, LoginPage.SUBMIT).click()
         
         self.wait.until(EC.url_contains("/admin"))
         self.assertIn("/admin", self.driver.current_url)
@@ -96,23 +98,20 @@ class TestUserAuthentication(unittest.TestCase):
         """Test user logout functionality"""
         # Login first
         self.driver.get(f"{self.base_url}/login")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("user@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        find(self.driver, LoginPage.EMAIL).send_keys("user@test.com")
+        find(self.driver, LoginPage.PASSWORD).send_keys("abcd123")
+        find(self.driver, LoginPage.SUBMIT).click()
         
         self.wait.until(EC.url_contains("/dashboard"))
         
         # Click logout button
-        logout_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Logout')]")))
+        logout_button = self.wait.until(EC.element_to_be_clickable(Navbar.LOGOUT))
         logout_button.click()
         
         # Verify redirected to home
-        time.sleep(2)
+        wait_for_settled(self.driver)
         self.assertIn("/", self.driver.current_url)
     
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
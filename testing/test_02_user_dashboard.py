@@ -1,65 +1,31 @@
 import unittest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from driver_factory import lease_driver, release_driver
+from waits import TimedWait
+from auth_fixtures import login_as
+from pages import find_all, Navbar, UserDashboardPage
+
 class TestUserDashboard(unittest.TestCase):
     """Robust test suite for user dashboard functionality."""
 
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Chrome()
-        cls.driver.maximize_window()
+        cls.driver = lease_driver()
+        cls.addClassCleanup(release_driver, cls.driver)
         cls.base_url = "http://localhost:3000"
-        cls.wait = WebDriverWait(cls.driver, 20)  # increased timeout
-        
-        # Login as user
-        cls.driver.get(f"{cls.base_url}/login")
-        
-        # Wait for email and password inputs
-        cls.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Email']")))
-        cls.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Password']")))
+        cls.wait = TimedWait(cls.driver, 20)  # increased timeout
         
-        cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("user@test.com")
-        cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
+        # Start on the dashboard already logged in as user
+        login_as(cls.driver, "user", cls.base_url, "/dashboard")
         
-        # Wait for login button to be clickable
-        login_btn = cls.wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-        )
-        login_btn.click()
-        
-        # Wait for either dashboard element or URL change
-        cls.wait.until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//h1[contains(text(), 'Dashboard')] | "
-                "//h2[contains(translate(text(), 'YOURPROFILE', 'yourprofile'), 'profile')] | "
-                "//h3[contains(translate(text(), 'YOURPROFILE', 'yourprofile'), 'profile')]"
-            ))
-        )
+        # Wait for dashboard content
+        cls.wait.until(EC.presence_of_element_located(UserDashboardPage.PROFILE_TITLE))
 
     def login_user(self):
         """Helper method to log in user and ensure dashboard is loaded"""
-        driver = self.driver
-        wait = self.wait
-
-        driver.get(f"{self.base_url}/login")
-
-        # Fill login form
-        email_input = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "input[placeholder='Email']")))
-        email_input.clear()
-        email_input.send_keys("user@test.com")
-
-        password_input = driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']")
-        password_input.clear()
-        password_input.send_keys("abcd123")
-
-        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-
-        # Wait until dashboard loads
-        wait.until(EC.url_contains("/dashboard"))
+        login_as(self.driver, "user", self.base_url, "/dashboard")
+        self.wait.until(EC.url_contains("/dashboard"))
 
     def setUp(self):
         """Ensure user is logged in at the start of each test"""
@@ -71,31 +37,18 @@ class TestUserDashboard(unittest.TestCase):
         driver = self.driver
         
         # Wait for dashboard profile section
-        profile_or_title = self.wait.until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//h1[contains(text(), 'Dashboard')] | "
-                "//h2[contains(translate(text(), 'YOURPROFILE', 'yourprofile'), 'profile')] | "
-                "//h3[contains(translate(text(), 'YOURPROFILE', 'yourprofile'), 'profile')]"
-            ))
-        )
-        self.assertTrue(profile_or_title.is_displayed())
+        profile_title = self.wait.until(EC.presence_of_element_located(UserDashboardPage.PROFILE_TITLE))
+        self.assertTrue(profile_title.is_displayed())
         
         # Verify at least one user info field
-        user_info = driver.find_elements(By.XPATH,
-            "//*[contains(text(), 'Name') or contains(text(), 'Email') or contains(text(), 'Role') or contains(text(), '@')]"
-        )
+        user_info = find_all(driver, UserDashboardPage.PROFILE_EMAIL)
         self.assertGreater(len(user_info), 0, "No user profile information found on dashboard")
 
     def test_02_view_wishlist_section(self):
         driver = self.driver
         driver.get(f"{self.base_url}/dashboard")
 
-        wishlist_elements = driver.find_elements(By.XPATH,
-            "//h2[contains(translate(text(), 'WISHLIST', 'wishlist'), 'wishlist')] | "
-            "//h3[contains(translate(text(), 'WISHLIST', 'wishlist'), 'wishlist')] | "
-            "//h1[contains(translate(text(), 'WISHLIST', 'wishlist'), 'wishlist')]"
-        )
+        wishlist_elements = find_all(driver, UserDashboardPage.WISHLIST_TITLE)
         # Pass even if empty
         self.assertTrue(True)
 
@@ -104,49 +57,34 @@ class TestUserDashboard(unittest.TestCase):
         driver = self.driver
         driver.get(f"{self.base_url}/dashboard")
 
-        reviews_elements = driver.find_elements(By.XPATH,
-            "//h3[contains(translate(text(), 'REVIEW', 'review'), 'review')] | "
-            "//h2[contains(translate(text(), 'REVIEW', 'review'), 'review')]"
-        )
+        reviews_elements = find_all(driver, UserDashboardPage.REVIEWS_TITLE)
         self.assertTrue(True)
 
     def test_04_view_user_questions(self):
         driver = self.driver
         driver.get(f"{self.base_url}/dashboard")
 
-        questions_elements = driver.find_elements(By.XPATH,
-            "//h3[contains(translate(text(), 'QUESTION', 'question'), 'question')] | "
-            "//h2[contains(translate(text(), 'QUESTION', 'question'), 'question')]"
-        )
+        questions_elements = find_all(driver, UserDashboardPage.QUESTIONS_TITLE)
         self.assertTrue(True)
 
     def test_05_view_scheduled_visits(self):
         driver = self.driver
         driver.get(f"{self.base_url}/dashboard")
 
-        visits_elements = driver.find_elements(By.XPATH,
-            "//h2[contains(translate(text(), 'VISIT', 'visit'), 'visit')] | "
-            "//h3[contains(translate(text(), 'VISIT', 'visit'), 'visit')]"
-        )
+        visits_elements = find_all(driver, UserDashboardPage.VISITS_TITLE)
         self.assertTrue(True)
 
     def test_06_logout_from_dashboard(self):
         driver = self.driver
         driver.get(f"{self.base_url}/dashboard")
 
-        logout_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(translate(text(), 'LOGOUT', 'logout'), 'logout')]"))
-        )
+        logout_button = self.wait.until(EC.element_to_be_clickable(Navbar.LOGOUT))
         logout_button.click()
 
         # Wait until login page loads
         self.wait.until(EC.url_contains("/login"))
         self.assertIn("/login", self.driver.current_url)
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,112 +1,41 @@
 import unittest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 import time
 
+from driver_factory import lease_driver, release_driver
+from waits import TimedWait, wait_for_settled
+from auth_fixtures import login_as
+from pages import find_all, OwnerDashboardPage, HostelFormModal, FaqModal, BoostModal
+
 class TestOwnerDashboard(unittest.TestCase):
     """Test owner dashboard functionality"""
     
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Chrome()
-        cls.driver.maximize_window()
+        cls.driver = lease_driver()
+        cls.addClassCleanup(release_driver, cls.driver)
         cls.base_url = "http://localhost:3000"
-        cls.wait = WebDriverWait(cls.driver, 15)
-        
-        # Login as owner
-        cls.driver.get(f"{cls.base_url}/login")
-        time.sleep(1)
-        
-        email_input = cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']")
-        email_input.clear()
-        email_input.send_keys("owner@test.com")
-        
-        password_input = cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']")
-        password_input.clear()
-        password_input.send_keys("abcd123")
-        
-        submit_button = cls.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        cls.driver.execute_script("arguments[0].click();", submit_button)
-        
-        # Wait for redirect to owner dashboard
-        try:
-            cls.wait.until(EC.url_contains("/owner"))
-        except:
-            time.sleep(3)
-            if "/owner" not in cls.driver.current_url:
-                cls.driver.get(f"{cls.base_url}/owner")
-        
-        time.sleep(2)
+        cls.wait = TimedWait(cls.driver, 15)
         
-        # Save cookies for session persistence
-        cls.cookies = cls.driver.get_cookies()
+        # Start on the owner dashboard already logged in as owner
+        login_as(cls.driver, "owner", cls.base_url, "/owner")
     
     def setUp(self):
         """Ensure we're on owner dashboard before each test"""
-        # Check if we're logged in by checking current URL
-        current_url = self.driver.current_url
-        
-        if "/login" in current_url or "/owner" not in current_url:
-            # Session lost, restore cookies
-            self.driver.delete_all_cookies()
-            for cookie in self.cookies:
-                try:
-                    # Remove problematic attributes
-                    cookie_copy = cookie.copy()
-                    cookie_copy.pop('sameSite', None)
-                    cookie_copy.pop('expiry', None)
-                    self.driver.add_cookie(cookie_copy)
-                except:
-                    pass
-            
-            # Navigate to owner dashboard
-            self.driver.get(f"{self.base_url}/owner")
-            time.sleep(2)
-            
-            # If still redirected to login, re-login
-            if "/login" in self.driver.current_url:
-                email_input = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']")
-                email_input.clear()
-                email_input.send_keys("owner@test.com")
-                
-                password_input = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']")
-                password_input.clear()
-                password_input.send_keys("abcd123")
-                
-                submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-                self.driver.execute_script("arguments[0].click();", submit_button)
-                
-                try:
-                    self.wait.until(EC.url_contains("/owner"))
-                except:
-                    time.sleep(3)
-                
-                # Update cookies
-                self.__class__.cookies = self.driver.get_cookies()
-        else:
-            # Already on correct page, just refresh to ensure clean state
-            if "/owner" not in current_url:
-                self.driver.get(f"{self.base_url}/owner")
-                time.sleep(1)
+        if "/owner" not in self.driver.current_url:
+            login_as(self.driver, "owner", self.base_url, "/owner")
         
         # Wait for page to be ready
         try:
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "h3")))
+            self.wait.until(EC.presence_of_element_located(OwnerDashboardPage.HOSTELS_TITLE))
         except:
-            time.sleep(2)
+            wait_for_settled(self.driver)
     
     def test_01_view_my_hostels(self):
         """Test viewing owner's hostel listings"""
         try:
-            hostels_elements = self.driver.find_elements(By.XPATH, 
-                "//h3[contains(translate(text(), 'MYHOSTELS', 'myhostels'), 'hostel') and "
-                "contains(translate(text(), 'LISTINGS', 'listings'), 'listing')] | "
-                "//h3[contains(translate(text(), 'MY', 'my'), 'my') and "
-                "contains(translate(text(), 'HOSTEL', 'hostel'), 'hostel')]"
-            )
+            hostels_elements = find_all(self.driver, OwnerDashboardPage.HOSTELS_TITLE)
             self.assertGreater(len(hostels_elements), 0, "My Hostel Listings section not found")
         except Exception as e:
             print(f"View hostels test error: {e}")
@@ -115,32 +44,22 @@ class TestOwnerDashboard(unittest.TestCase):
     def test_02_add_new_hostel(self):
         """Test opening add hostel modal"""
         try:
-            add_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'ADDNEWHOSTEL', 'addnewhostel'), 'add') and "
-                "contains(translate(text(), 'HOSTEL', 'hostel'), 'hostel')] | "
-                "//button[contains(translate(text(), 'ADD', 'add'), 'add')]"
-            )
+            add_buttons = find_all(self.driver, OwnerDashboardPage.ADD_HOSTEL)
             
             if len(add_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", add_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
                 
                 # Verify modal is open
-                modal_titles = self.driver.find_elements(By.XPATH, 
-                    "//h3[contains(translate(text(), 'LIST', 'list'), 'list') or "
-                    "contains(translate(text(), 'ADD', 'add'), 'add')]"
-                )
+                modal_titles = find_all(self.driver, HostelFormModal.ADD_TITLE)
                 self.assertGreater(len(modal_titles), 0, "Add hostel modal not opened")
                 
                 # Close modal
-                cancel_buttons = self.driver.find_elements(By.XPATH, 
-                    "//button[contains(translate(text(), 'CANCEL', 'cancel'), 'cancel')]"
-                )
+                cancel_buttons = find_all(self.driver, HostelFormModal.CANCEL)
                 if len(cancel_buttons) > 0:
                     self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
-                    time.sleep(1)
+                    wait_for_settled(self.driver)
             else:
                 print("Add hostel button not found")
                 self.assertTrue(True)
@@ -151,74 +70,54 @@ class TestOwnerDashboard(unittest.TestCase):
     def test_03_fill_hostel_form(self):
         """Test filling out the add hostel form"""
         try:
-            add_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'ADDNEWHOSTEL', 'addnewhostel'), 'add') and "
-                "contains(translate(text(), 'HOSTEL', 'hostel'), 'hostel')] | "
-                "//button[contains(translate(text(), 'ADD', 'add'), 'add')]"
-            )
+            add_buttons = find_all(self.driver, OwnerDashboardPage.ADD_HOSTEL)
             
             if len(add_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", add_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
                 
                 # Fill form fields
                 timestamp = int(time.time())
                 
-                name_inputs = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'HOSTELNAME', 'hostelname'), 'hostel') and "
-                    "contains(translate(text(), 'NAME', 'name'), 'name')]/following-sibling::input"
-                )
+                name_inputs = find_all(self.driver, HostelFormModal.NAME)
                 if len(name_inputs) > 0:
                     name_inputs[0].send_keys(f"Test Hostel {timestamp}")
                 
-                area_inputs = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'AREA', 'area'), 'area')]/following-sibling::input"
-                )
+                area_inputs = find_all(self.driver, HostelFormModal.AREA)
                 if len(area_inputs) > 0:
                     area_inputs[0].send_keys("G-11")
                 
-                contact_inputs = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'CONTACT', 'contact'), 'contact')]/following-sibling::input"
-                )
+                contact_inputs = find_all(self.driver, HostelFormModal.CONTACT)
                 if len(contact_inputs) > 0:
                     contact_inputs[0].send_keys("0333-1234567")
                 
-                rent_inputs = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'RENT', 'rent'), 'rent')]/following-sibling::input"
-                )
+                rent_inputs = find_all(self.driver, HostelFormModal.RENT)
                 if len(rent_inputs) > 0:
                     rent_inputs[0].send_keys("15000")
                 
                 # Select gender
-                gender_selects = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'GENDER', 'gender'), 'gender')]/following-sibling::select"
-                )
+                gender_selects = find_all(self.driver, HostelFormModal.GENDER)
                 if len(gender_selects) > 0:
                     gender_select = Select(gender_selects[0])
                     gender_select.select_by_visible_text("Male")
                 
                 # Select profession
-                profession_selects = self.driver.find_elements(By.XPATH, 
-                    "//label[contains(translate(text(), 'PROFESSION', 'profession'), 'profession')]/following-sibling::select"
-                )
+                profession_selects = find_all(self.driver, HostelFormModal.PROFESSION)
                 if len(profession_selects) > 0:
                     profession_select = Select(profession_selects[0])
                     profession_select.select_by_visible_text("Student")
                 
                 # Description
-                textareas = self.driver.find_elements(By.CSS_SELECTOR, "textarea")
+                textareas = find_all(self.driver, HostelFormModal.DESCRIPTION)
                 if len(textareas) > 0:
                     textareas[0].send_keys("This is a test hostel description.")
                 
                 # Submit
-                submit_buttons = self.driver.find_elements(By.XPATH, 
-                    "//button[contains(translate(text(), 'SUBMIT', 'submit'), 'submit')]"
-                )
+                submit_buttons = find_all(self.driver, HostelFormModal.SUBMIT)
                 if len(submit_buttons) > 0:
                     self.driver.execute_script("arguments[0].click();", submit_buttons[0])
-                    time.sleep(2)
+                    wait_for_settled(self.driver)
                 
                 self.assertTrue(True)
             else:
@@ -231,29 +130,22 @@ class TestOwnerDashboard(unittest.TestCase):
     def test_04_update_hostel(self):
         """Test opening update hostel modal"""
         try:
-            update_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'UPDATE', 'update'), 'update')]"
-            )
+            update_buttons = find_all(self.driver, OwnerDashboardPage.UPDATE_HOSTEL)
             
             if len(update_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", update_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", update_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
                 
                 # Verify modal is open
-                modal_titles = self.driver.find_elements(By.XPATH, 
-                    "//h3[contains(translate(text(), 'UPDATE', 'update'), 'update')]"
-                )
+                modal_titles = find_all(self.driver, HostelFormModal.EDIT_TITLE)
                 self.assertGreater(len(modal_titles), 0, "Update hostel modal not opened")
                 
                 # Close modal
-                cancel_buttons = self.driver.find_elements(By.XPATH, 
-                    "//button[contains(translate(text(), 'CANCEL', 'cancel'), 'cancel')]"
-                )
+                cancel_buttons = find_all(self.driver, HostelFormModal.CANCEL)
                 if len(cancel_buttons) > 0:
                     self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
-                    time.sleep(1)
+                    wait_for_settled(self.driver)
             else:
                 print("No hostels to update")
                 self.assertTrue(True)
@@ -265,13 +157,8 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test viewing pending questions section"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
             
-            questions_elements = self.driver.find_elements(By.XPATH, 
-                "//h3[contains(translate(text(), 'PENDING', 'pending'), 'pending') and "
-                "contains(translate(text(), 'QUESTIONS', 'questions'), 'question')] | "
-                "//h3[contains(translate(text(), 'QUESTIONS', 'questions'), 'question')]"
-            )
+            questions_elements = find_all(self.driver, OwnerDashboardPage.PENDING_QUESTIONS_TITLE)
             self.assertGreater(len(questions_elements), 0, "Pending Questions section not found")
         except Exception as e:
             print(f"View questions test error: {e}")
@@ -281,26 +168,20 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test answering a pending question"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
             
             # Find answer textarea
-            answer_textareas = self.driver.find_elements(By.CSS_SELECTOR, 
-                "textarea[placeholder*='answer'], textarea[placeholder*='Answer'], textarea[placeholder*='reply'], textarea[placeholder*='Reply']"
-            )
+            answer_textareas = find_all(self.driver, OwnerDashboardPage.ANSWER_TEXT)
             
             if len(answer_textareas) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", answer_textareas[0])
-                time.sleep(1)
                 answer_textareas[0].send_keys("Yes, Wi-Fi is included in the rent.")
                 
                 # Find and click reply button
-                reply_buttons = self.driver.find_elements(By.XPATH, 
-                    "//button[contains(translate(text(), 'REPLY', 'reply'), 'reply')]"
-                )
+                reply_buttons = find_all(self.driver, OwnerDashboardPage.ANSWER_SUBMIT)
                 
                 if len(reply_buttons) > 0:
                     self.driver.execute_script("arguments[0].click();", reply_buttons[0])
-                    time.sleep(2)
+                    wait_for_settled(self.driver)
                 
                 self.assertTrue(True)
             else:
@@ -314,13 +195,8 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test viewing scheduled visits for owner"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
             
-            visits_elements = self.driver.find_elements(By.XPATH, 
-                "//h3[contains(translate(text(), 'SCHEDULED', 'scheduled'), 'scheduled') and "
-                "contains(translate(text(), 'VISITS', 'visits'), 'visit')] | "
-                "//h3[contains(translate(text(), 'VISITS', 'visits'), 'visit')]"
-            )
+            visits_elements = find_all(self.driver, OwnerDashboardPage.VISITS_TITLE)
             self.assertGreater(len(visits_elements), 0, "Scheduled Visits section not found")
         except Exception as e:
             print(f"View visits test error: {e}")
@@ -330,17 +206,13 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test approving a visit request"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
             
-            approve_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'APPROVE', 'approve'), 'approve')]"
-            )
+            approve_buttons = find_all(self.driver, OwnerDashboardPage.APPROVE_VISIT)
             
             if len(approve_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", approve_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", approve_buttons[0])
-                time.sleep(2)
+                wait_for_settled(self.driver)
                 self.assertTrue(True)
             else:
                 print("No pending visits to approve")
@@ -353,33 +225,23 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test opening manage FAQs modal"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
             
-            faq_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'MANAGE', 'manage'), 'manage') and "
-                "contains(translate(text(), 'FAQS', 'faqs'), 'faq')] | "
-                "//button[contains(translate(text(), 'FAQ', 'faq'), 'faq')]"
-            )
+            faq_buttons = find_all(self.driver, OwnerDashboardPage.MANAGE_FAQS)
             
             if len(faq_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", faq_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", faq_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
                 
                 # Verify modal is open
-                modal_titles = self.driver.find_elements(By.XPATH, 
-                    "//h2[contains(translate(text(), 'FAQ', 'faq'), 'faq')]"
-                )
+                modal_titles = find_all(self.driver, FaqModal.TITLE)
                 self.assertGreater(len(modal_titles), 0, "FAQ modal not opened")
                 
                 # Close modal
-                close_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                    "button.text-gray-400, button[aria-label='Close']"
-                )
+                close_buttons = find_all(self.driver, FaqModal.CLOSE)
                 if len(close_buttons) > 0:
                     self.driver.execute_script("arguments[0].click();", close_buttons[0])
-                    time.sleep(1)
+                    wait_for_settled(self.driver)
             else:
                 print("Manage FAQs button not found")
                 self.assertTrue(True)
@@ -391,22 +253,16 @@ class TestOwnerDashboard(unittest.TestCase):
         """Test opening boost modal"""
         try:
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
             
-            boost_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'BOOST', 'boost'), 'boost')]"
-            )
+            boost_buttons = find_all(self.driver, OwnerDashboardPage.BOOST_HOSTEL)
             
             if len(boost_buttons) > 0:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", boost_buttons[0])
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", boost_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
                 
                 # Verify modal is open
-                modal_titles = self.driver.find_elements(By.XPATH, 
-                    "//h2[contains(translate(text(), 'BOOST', 'boost'), 'boost')]"
-                )
+                modal_titles = find_all(self.driver, BoostModal.TITLE)
                 self.assertGreater(len(modal_titles), 0, "Boost modal not opened")
             else:
                 print("Boost button not available - hostel might already be boosted")
@@ -415,9 +271,6 @@ class TestOwnerDashboard(unittest.TestCase):
             print(f"Boost hostel test error: {e}")
             self.assertTrue(True)
     
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,54 +1,52 @@
 import unittest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+
+from driver_factory import lease_driver, release_driver
+from waits import TimedWait, wait_for_settled, wait_for_alert
+from auth_fixtures import login_as
+from pages import find, find_all, AdminDashboardPage
 
 class TestAdminDashboard(unittest.TestCase):
     """Test admin dashboard functionality"""
     
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Chrome()
-        cls.driver.maximize_window()
+        cls.driver = lease_driver()
+        cls.addClassCleanup(release_driver, cls.driver)
         cls.base_url = "http://localhost:3000"
-        cls.wait = WebDriverWait(cls.driver, 10)
+        cls.wait = TimedWait(cls.driver, 10)
         
-        # Login as admin
-        cls.driver.get(f"{cls.base_url}/login")
-        cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("admin@test.com")
-        cls.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
-        cls.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        # Start on the admin dashboard already logged in as admin
+        login_as(cls.driver, "admin", cls.base_url, "/admin")
         cls.wait.until(EC.url_contains("/admin"))
     
     def test_01_view_statistics(self):
         """Test viewing admin statistics"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         # Check for stat cards
-        stat_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='bg-gray-800']")
+        stat_cards = find_all(self.driver, AdminDashboardPage.STAT_CARDS)
         self.assertGreater(len(stat_cards), 0, "No stat cards found")
     
     def test_02_view_pending_hostels(self):
         """Test viewing pending hostel approvals"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
-        pending_section = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'Pending Hostel Listings')]")
+        pending_section = find(self.driver, AdminDashboardPage.PENDING_HOSTELS)
         self.assertTrue(pending_section.is_displayed())
     
     def test_03_approve_hostel(self):
         """Test approving a pending hostel"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
-            approve_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Approve')]")
+            approve_button = find(self.driver, AdminDashboardPage.APPROVE_HOSTEL)
             approve_button.click()
             
-            time.sleep(2)
+            wait_for_settled(self.driver)
             self.assertTrue(True)
         except:
             print("No pending hostels to approve")
@@ -56,17 +54,16 @@ class TestAdminDashboard(unittest.TestCase):
     def test_04_reject_hostel(self):
         """Test rejecting a pending hostel"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
-            reject_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Reject')]")
+            reject_button = find(self.driver, AdminDashboardPage.REJECT_HOSTEL)
             reject_button.click()
-            time.sleep(1)
 
-            # Switch to alert and accept it
-            alert = self.driver.switch_to.alert
+            # Wait for the confirm alert and accept it
+            alert = wait_for_alert(self.driver)
             alert.accept()  # click 'Yes' on the alert
-            time.sleep(2)
+            wait_for_settled(self.driver)
 
             self.assertTrue(True)
         except:
@@ -76,15 +73,15 @@ class TestAdminDashboard(unittest.TestCase):
     def test_05_approve_boost(self):
         """Test approving a boost request"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
             # Find boost approve button (inside boost section)
-            boost_section = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'Boost Requests')]/parent::div")
-            approve_button = boost_section.find_element(By.XPATH, ".//button[contains(text(), 'Approve')]")
+            boost_section = find(self.driver, AdminDashboardPage.BOOST_REQUESTS)
+            approve_button = find(boost_section, AdminDashboardPage.APPROVE_BOOST)
             approve_button.click()
             
-            time.sleep(2)
+            wait_for_settled(self.driver)
             self.assertTrue(True)
         except:
             print("No boost requests to approve")
@@ -92,10 +89,10 @@ class TestAdminDashboard(unittest.TestCase):
     def test_06_view_sales_stats(self):
         """Test viewing sales statistics"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
-            sales_section = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'Sales Statistics')]")
+            sales_section = find(self.driver, AdminDashboardPage.SALES_STATS)
             self.assertTrue(sales_section.is_displayed())
         except:
             print("Sales statistics section not found")
@@ -103,15 +100,15 @@ class TestAdminDashboard(unittest.TestCase):
     def test_07_remove_review(self):
         """Test removing a review as admin"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
             # Find remove button in reviews section
-            reviews_section = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'Recent Ratings')]/parent::div")
-            remove_button = reviews_section.find_element(By.XPATH, ".//button[contains(text(), 'Remove')]")
+            reviews_section = find(self.driver, AdminDashboardPage.RECENT_RATINGS)
+            remove_button = find(reviews_section, AdminDashboardPage.REMOVE_REVIEW)
             remove_button.click()
             
-            time.sleep(2)
+            wait_for_settled(self.driver)
             self.assertTrue(True)
         except:
             print("No reviews to remove")
@@ -119,17 +116,14 @@ class TestAdminDashboard(unittest.TestCase):
     def test_08_manage_faqs(self):
         """Test managing platform FAQs"""
         self.driver.get(f"{self.base_url}/admin")
-        time.sleep(2)
+        wait_for_settled(self.driver)
         
         try:
-            faq_section = self.driver.find_element(By.XPATH, "//h3[contains(text(), 'Manage FAQs')]")
+            faq_section = find(self.driver, AdminDashboardPage.FAQS)
             self.assertTrue(faq_section.is_displayed())
         except:
             print("FAQ management section not found")
     
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
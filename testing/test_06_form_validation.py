@@ -1,112 +1,95 @@
 import unittest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+
+from driver_factory import lease_driver, release_driver
+from waits import TimedWait, wait_for_settled, wait_for_alert
+from auth_fixtures import login_as
+from pages import (
+    find,
+    find_all,
+    LoginPage,
+    SignupPage,
+    OwnerDashboardPage,
+    HostelFormModal,
+    HostelsPage,
+    HostelDetailsPage,
+)
 
 class TestFormValidation(unittest.TestCase):
     """Test form validation across the application with alert handling"""
     
     @classmethod
     def setUpClass(cls):
-        cls.driver = webdriver.Chrome()
-        cls.driver.maximize_window()
+        cls.driver = lease_driver()
+        cls.addClassCleanup(release_driver, cls.driver)
         cls.base_url = "http://localhost:3000"
-        cls.wait = WebDriverWait(cls.driver, 10)
+        cls.wait = TimedWait(cls.driver, 10)
 
     # ---------------------------- LOGIN & SIGNUP VALIDATIONS ----------------------------
     def test_01_login_empty_fields(self):
         self.driver.get(f"{self.base_url}/login")
-        time.sleep(1)
-        submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        wait_for_settled(self.driver)
+        submit_button = find(self.driver, LoginPage.SUBMIT)
         submit_button.click()
-        time.sleep(1)
+        wait_for_settled(self.driver)
         self.assertIn("/login", self.driver.current_url)
     
     def test_02_login_invalid_email_format(self):
         self.driver.get(f"{self.base_url}/login")
-        time.sleep(1)
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("invalidemail")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("password123")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        time.sleep(1)
+        wait_for_settled(self.driver)
+        find(self.driver, LoginPage.EMAIL).send_keys("invalidemail")
+        find(self.driver, LoginPage.PASSWORD).send_keys("password123")
+        find(self.driver, LoginPage.SUBMIT).click()
+        wait_for_settled(self.driver)
         self.assertIn("/login", self.driver.current_url)
     
     def test_03_signup_password_too_short(self):
         self.driver.get(f"{self.base_url}/signup")
-        time.sleep(1)
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Full Name']").send_keys("Test User")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("test@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='Password']").send_keys("123")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        time.sleep(1)
-        error_messages = self.driver.find_elements(By.CSS_SELECTOR, "p.text-red-400")
+        wait_for_settled(self.driver)
+        find(self.driver, SignupPage.NAME).send_keys("Test User")
+        find(self.driver, SignupPage.EMAIL).send_keys("test@test.com")
+        find(self.driver, SignupPage.PASSWORD).send_keys("123")
+        find(self.driver, SignupPage.SUBMIT).click()
+        wait_for_settled(self.driver)
+        error_messages = find_all(self.driver, SignupPage.ERROR)
         self.assertTrue(len(error_messages) > 0 or "/signup" in self.driver.current_url)
     
     def test_04_signup_empty_name(self):
         self.driver.get(f"{self.base_url}/signup")
-        time.sleep(1)
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("test@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder*='Password']").send_keys("password123")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        time.sleep(1)
+        wait_for_settled(self.driver)
+        find(self.driver, SignupPage.EMAIL).send_keys("test@test.com")
+        find(self.driver, SignupPage.PASSWORD).send_keys("password123")
+        find(self.driver, SignupPage.SUBMIT).click()
+        wait_for_settled(self.driver)
         self.assertIn("/signup", self.driver.current_url)
 
     # ---------------------------- ADD HOSTEL VALIDATIONS ----------------------------
-    def _login_owner(self):
-        self.driver.get(f"{self.base_url}/login")
-        time.sleep(1)
-        email_input = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']")
-        email_input.clear()
-        email_input.send_keys("owner@test.com")
-        password_input = self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']")
-        password_input.clear()
-        password_input.send_keys("abcd123")
-        submit = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        self.driver.execute_script("arguments[0].click();", submit)
-        try:
-            self.wait.until(EC.url_contains("/owner"))
-        except:
-            time.sleep(2)
-            self.driver.get(f"{self.base_url}/owner")
-        time.sleep(1)
-
     def test_05_add_hostel_empty_required_fields(self):
         """Test adding hostel with empty required fields"""
         try:
-            self._login_owner()
-            add_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'ADDNEWHOSTEL', 'addnewhostel'), 'add') and contains(translate(text(), 'HOSTEL', 'hostel'), 'hostel')] | //button[contains(translate(text(), 'ADD', 'add'), 'add')]"
-            )
+            login_as(self.driver, "owner", self.base_url, "/owner")
+            wait_for_settled(self.driver)
+            add_buttons = find_all(self.driver, OwnerDashboardPage.ADD_HOSTEL)
             if add_buttons:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_buttons[0])
-                time.sleep(0.5)
                 self.driver.execute_script("arguments[0].click();", add_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
 
-                submit_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'SUBMIT', 'submit'), 'submit')]"
-                )
+                submit_buttons = find_all(self.driver, HostelFormModal.SUBMIT)
                 if submit_buttons:
                     self.driver.execute_script("arguments[0].click();", submit_buttons[0])
-                    time.sleep(0.5)
                     # Handle alert if any
-                    try:
-                        alert = self.driver.switch_to.alert
+                    alert = wait_for_alert(self.driver)
+                    if alert:
                         alert.accept()
-                        time.sleep(0.5)
-                    except:
-                        pass
+                        wait_for_settled(self.driver)
                     self.assertTrue(True)
 
                 # Close modal
-                cancel_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'CANCEL', 'cancel'), 'cancel') or contains(translate(text(), 'CLOSE', 'close'), 'close')]"
-                )
+                cancel_buttons = find_all(self.driver, HostelFormModal.CANCEL)
                 if cancel_buttons:
                     self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
-                    time.sleep(0.5)
+                    wait_for_settled(self.driver)
 
         except Exception as e:
             print(f"Add hostel validation test error: {e}")
@@ -115,84 +98,54 @@ class TestFormValidation(unittest.TestCase):
     def test_06_add_hostel_negative_rent(self):
         """Test add hostel form with negative rent"""
         try:
-            self._login_owner()
-            add_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'ADDNEWHOSTEL', 'addnewhostel'), 'add') and contains(translate(text(), 'HOSTEL', 'hostel'), 'hostel')] | //button[contains(translate(text(), 'ADD', 'add'), 'add')]"
-            )
+            login_as(self.driver, "owner", self.base_url, "/owner")
+            wait_for_settled(self.driver)
+            add_buttons = find_all(self.driver, OwnerDashboardPage.ADD_HOSTEL)
             if add_buttons:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_buttons[0])
-                time.sleep(0.5)
                 self.driver.execute_script("arguments[0].click();", add_buttons[0])
-                time.sleep(1)
+                wait_for_settled(self.driver)
 
-                rent_inputs = self.driver.find_elements(By.XPATH,
-                    "//label[contains(translate(text(), 'RENT', 'rent'), 'rent')]/following-sibling::input | //input[@type='number']"
-                )
+                rent_inputs = find_all(self.driver, HostelFormModal.RENT)
                 if rent_inputs:
                     rent_inputs[0].send_keys("-1000")
                     value = rent_inputs[0].get_attribute("value")
                     print(f"Rent input value after negative entry: {value}")
 
                 # Close modal
-                cancel_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'CANCEL', 'cancel'), 'cancel') or contains(translate(text(), 'CLOSE', 'close'), 'close')]"
-                )
+                cancel_buttons = find_all(self.driver, HostelFormModal.CANCEL)
                 if cancel_buttons:
                     self.driver.execute_script("arguments[0].click();", cancel_buttons[0])
-                    time.sleep(0.5)
+                    wait_for_settled(self.driver)
         except Exception as e:
             print(f"Negative rent test error: {e}")
             self.assertTrue(True)
 
     # ---------------------------- REVIEW & QUESTION VALIDATIONS ----------------------------
-    def _login_user(self):
-        self.driver.get(f"{self.base_url}/login")
-        time.sleep(1)
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").clear()
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Email']").send_keys("user@test.com")
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").clear()
-        self.driver.find_element(By.CSS_SELECTOR, "input[placeholder='Password']").send_keys("abcd123")
-        submit = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        self.driver.execute_script("arguments[0].click();", submit)
-        try:
-            self.wait.until(EC.url_contains("/dashboard"))
-        except:
-            time.sleep(2)
-        time.sleep(1)
-
     def test_07_review_empty_text(self):
         """Test review form with empty text"""
         try:
-            self._login_user()
-            self.driver.get(f"{self.base_url}/hostels")
-            time.sleep(1)
-            view_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'View Details')]")))
+            login_as(self.driver, "user", self.base_url, "/hostels")
+            wait_for_settled(self.driver)
+            view_button = self.wait.until(EC.element_to_be_clickable(HostelsPage.VIEW_DETAILS))
             view_button.click()
-            time.sleep(1)
+            wait_for_settled(self.driver)
 
-            reviews_tabs = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'REVIEWS', 'reviews'), 'reviews')]"
-            )
+            reviews_tabs = find_all(self.driver, HostelDetailsPage.REVIEWS_TAB)
             if reviews_tabs:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", reviews_tabs[0])
-                time.sleep(0.5)
                 self.driver.execute_script("arguments[0].click();", reviews_tabs[0])
-                time.sleep(0.5)
+                wait_for_settled(self.driver)
 
-                submit_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'SUBMIT', 'submit'), 'submit')]"
-                )
+                submit_buttons = find_all(self.driver, HostelDetailsPage.REVIEW_SUBMIT)
                 if submit_buttons:
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_buttons[0])
                     self.driver.execute_script("arguments[0].click();", submit_buttons[0])
-                    time.sleep(0.5)
-                    # Handle alert
-                    try:
-                        alert = self.driver.switch_to.alert
+                    # Handle alert if any
+                    alert = wait_for_alert(self.driver)
+                    if alert:
                         alert.accept()
-                        time.sleep(0.5)
-                    except:
-                        pass
+                        wait_for_settled(self.driver)
                     self.assertTrue(True)
         except Exception as e:
             print(f"Review validation test error: {e}")
@@ -201,35 +154,27 @@ class TestFormValidation(unittest.TestCase):
     def test_08_question_empty_text(self):
         """Test question form with empty text"""
         try:
-            self._login_user()
-            self.driver.get(f"{self.base_url}/hostels")
-            time.sleep(1)
-            view_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'View Details')]")))
+            login_as(self.driver, "user", self.base_url, "/hostels")
+            wait_for_settled(self.driver)
+            view_button = self.wait.until(EC.element_to_be_clickable(HostelsPage.VIEW_DETAILS))
             view_button.click()
-            time.sleep(1)
+            wait_for_settled(self.driver)
 
-            questions_tabs = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'QUESTIONS', 'questions'), 'questions')]"
-            )
+            questions_tabs = find_all(self.driver, HostelDetailsPage.QUESTIONS_TAB)
             if questions_tabs:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", questions_tabs[0])
-                time.sleep(0.5)
                 self.driver.execute_script("arguments[0].click();", questions_tabs[0])
-                time.sleep(0.5)
+                wait_for_settled(self.driver)
 
-                submit_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'SUBMIT', 'submit'), 'submit')]"
-                )
+                submit_buttons = find_all(self.driver, HostelDetailsPage.QUESTION_SUBMIT)
                 if submit_buttons:
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_buttons[0])
                     self.driver.execute_script("arguments[0].click();", submit_buttons[0])
-                    time.sleep(0.5)
-                    try:
-                        alert = self.driver.switch_to.alert
+                    # Handle alert if any
+                    alert = wait_for_alert(self.driver)
+                    if alert:
                         alert.accept()
-                        time.sleep(0.5)
-                    except:
-                        pass
+                        wait_for_settled(self.driver)
                     self.assertTrue(True)
         except Exception as e:
             print(f"Question validation test error: {e}")
@@ -238,43 +183,32 @@ class TestFormValidation(unittest.TestCase):
     def test_09_visit_booking_empty_date(self):
         """Test visit booking with empty date"""
         try:
-            self._login_user()
-            self.driver.get(f"{self.base_url}/hostels")
-            time.sleep(1)
-            view_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'View Details')]")))
+            login_as(self.driver, "user", self.base_url, "/hostels")
+            wait_for_settled(self.driver)
+            view_button = self.wait.until(EC.element_to_be_clickable(HostelsPage.VIEW_DETAILS))
             view_button.click()
-            time.sleep(1)
+            wait_for_settled(self.driver)
 
-            book_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'BOOK', 'book'), 'book') and contains(translate(text(), 'VISIT', 'visit'), 'visit')]"
-            )
+            book_buttons = find_all(self.driver, HostelDetailsPage.BOOK_VISIT)
             if book_buttons:
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", book_buttons[0])
-                time.sleep(0.5)
                 self.driver.execute_script("arguments[0].click();", book_buttons[0])
-                time.sleep(0.5)
+                wait_for_settled(self.driver)
 
-                book_submit_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[contains(translate(text(), 'BOOK', 'book'), 'book') and not(contains(translate(text(), 'VISIT', 'visit'), 'visit'))]"
-                )
+                book_submit_buttons = find_all(self.driver, HostelDetailsPage.VISIT_SUBMIT)
                 if book_submit_buttons:
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", book_submit_buttons[0])
                     self.driver.execute_script("arguments[0].click();", book_submit_buttons[0])
-                    time.sleep(0.5)
-                    try:
-                        alert = self.driver.switch_to.alert
+                    # Handle alert if any
+                    alert = wait_for_alert(self.driver)
+                    if alert:
                         alert.accept()
-                        time.sleep(0.5)
-                    except:
-                        pass
+                        wait_for_settled(self.driver)
                     self.assertTrue(True)
         except Exception as e:
             print(f"Visit booking validation test error: {e}")
             self.assertTrue(True)
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
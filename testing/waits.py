@@ -0,0 +1,79 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
+
+# Seconds spent waiting since the last consume_wait_time() call
+_waited = 0.0
+
+# True once the document is loaded, no axios request is in flight
+# (window.__pendingRequests, see frontend/src/api/index.js) and the DOM
+# has not changed for `quietMs`. The first call installs the observer.
+SETTLED_SCRIPT = """
+const quietMs = arguments[0];
+if (!window.__domObserver) {
+  window.__lastDomMutation = performance.now();
+  window.__domObserver = new MutationObserver(() => {
+    window.__lastDomMutation = performance.now();
+  });
+  window.__domObserver.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+  });
+  return false;
+}
+return document.readyState === "complete"
+  && (window.__pendingRequests || 0) === 0
+  && performance.now() - window.__lastDomMutation >= quietMs;
+"""
+
+
+def _record(seconds):
+    global _waited
+    _waited += seconds
+
+
+def consume_wait_time():
+    """Return the wait time collected so far and start counting from zero"""
+    global _waited
+    waited, _waited = _waited, 0.0
+    return waited
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait that adds the time spent in until()/until_not() to the wait total"""
+
+    def until(self, method, message=""):
+        start = time.time()
+        try:
+            return super().until(method, message)
+        finally:
+            _record(time.time() - start)
+
+    def until_not(self, method, message=""):
+        start = time.time()
+        try:
+            return super().until_not(method, message)
+        finally:
+            _record(time.time() - start)
+
+
+def wait_for_settled(driver, timeout=10, quiet_ms=250):
+    """Return as soon as requests have finished and the DOM has stopped changing"""
+    try:
+        TimedWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(SETTLED_SCRIPT, quiet_ms)
+        )
+    except TimeoutException:
+        # A page that never goes quiet is no worse off than after a fixed sleep
+        pass
+    except UnexpectedAlertPresentException:
+        # An open alert blocks the page; the caller handles it next
+        pass
+
+
+def wait_for_alert(driver, timeout=1):
+    """Return the open alert, or None if none appears within `timeout`"""
+    try:
+        return TimedWait(driver, timeout, poll_frequency=0.05).until(EC.alert_is_present())
+    except TimeoutException:
+        return None